@@ -0,0 +1,80 @@
+"""Validates the native DCR engine (`synqtab.utils.dcr_utils.DCRReference`) against sdmetrics' `calculate_dcr` on a
+mixed-type table with missing values, constant and datetime columns and unseen categories, and compares their run
+times. Fails if any DCR differs by more than the tolerance.
+
+Usage: python benchmarks/dcr.py [--real-rows 5000] [--synthetic-rows 2000] [--threads 4] [--tolerance 1e-9]
+"""
+import argparse
+from timeit import default_timer as timer
+
+import numpy as np
+import pandas as pd
+from sdmetrics.single_table.privacy.dcr_utils import calculate_dcr
+
+from synqtab.utils.dcr_utils import DCRReference
+
+
+METADATA = {
+    'columns': {
+        'age': {'sdtype': 'numerical'},
+        'income': {'sdtype': 'numerical'},
+        'constant': {'sdtype': 'numerical'},
+        'joined': {'sdtype': 'datetime'},
+        'tier': {'sdtype': 'categorical'},
+        'city': {'sdtype': 'categorical'},
+        'active': {'sdtype': 'boolean'},
+        'comment': {'sdtype': 'text'}, # not modelable, hence ignored
+    }
+}
+
+
+def _table(n_rows: int, rng: np.random.Generator, categories_offset: int = 0) -> pd.DataFrame:
+    table = pd.DataFrame({
+        'age': rng.integers(18, 90, size=n_rows).astype(float),
+        'income': rng.lognormal(10, 1, size=n_rows),
+        'constant': np.full(n_rows, 7.0),
+        'joined': pd.Timestamp('2020-01-01') + pd.to_timedelta(rng.integers(0, 1_000, size=n_rows), unit='D'),
+        'tier': pd.Categorical(rng.choice(['gold', 'silver', 'bronze'], size=n_rows)),
+        'city': rng.choice([f"city_{i + categories_offset}" for i in range(100)], size=n_rows).astype(object),
+        'active': rng.random(n_rows) < 0.5,
+        'comment': 'n/a',
+    })
+    for column in ['age', 'income', 'joined', 'tier', 'city']:
+        table.loc[rng.random(n_rows) < 0.05, column] = None
+    return table
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--real-rows', type=int, default=5_000)
+    parser.add_argument('--synthetic-rows', type=int, default=2_000)
+    parser.add_argument('--threads', type=int, default=4)
+    parser.add_argument('--tolerance', type=float, default=1e-9)
+    parser.add_argument('--seed', type=int, default=100)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    real_data = _table(args.real_rows, rng)
+    synthetic_data = _table(args.synthetic_rows, rng, categories_offset=10) # some cities are unseen
+
+    start = timer()
+    expected = calculate_dcr(dataset=synthetic_data, reference_dataset=real_data, metadata=METADATA).to_numpy()
+    sdmetrics_time = timer() - start
+
+    start = timer()
+    reference = DCRReference(real_data, METADATA)
+    preprocessing_time = timer() - start
+    start = timer()
+    actual = reference.distances(synthetic_data, threads=args.threads)
+    native_time = timer() - start
+
+    max_difference = np.max(np.abs(actual - expected))
+    print(f"sdmetrics: {sdmetrics_time * 1000:.0f} ms")
+    print(f"native:    {native_time * 1000:.0f} ms (+ {preprocessing_time * 1000:.0f} ms of real data preprocessing)")
+    print(f"max |DCR difference|: {max_difference:.2e}, medians: {np.median(expected):.6f} vs {np.median(actual):.6f}")
+    if max_difference > args.tolerance:
+        raise SystemExit(f"The native DCRs differ from sdmetrics by more than {args.tolerance}.")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""Import-time gate: imports each module in a fresh interpreter with `python -X importtime` and fails if any of them
+takes longer than the budget. `synqtab` itself is a namespace package, so the gate covers the subpackages that
+scripts actually import, e.g., `synqtab.mappings` through `Experiment.from_str()`. The slowest imports below each
+module are listed, to tell what to make lazy next.
+
+Usage: python benchmarks/import_time.py [--budget-ms 1000] [--top 10] [modules ...]
+"""
+import argparse
+import subprocess
+import sys
+
+
+# the budgets of the modules that are checked by default. The enums and the registries must stay free of pandas,
+# torch and the clients; the experiments and the task worker need pandas, boto3 and SQLAlchemy, but not torch
+DEFAULT_BUDGETS_MS = {
+    'synqtab.enums': 100,
+    'synqtab.mappings': 100,
+    'synqtab.experiments': 2000,
+    'synqtab.tasks': 2000,
+}
+
+
+def _import_times(module_name: str) -> list[tuple[int, int, str, bool]]:
+    """Returns the (self, cumulative) microseconds of every import of a fresh `import module_name`, and whether it
+    was imported at the top level (and not by another import)."""
+    completed_process = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module_name}'],
+        capture_output=True, text=True,
+    )
+    if completed_process.returncode != 0:
+        raise RuntimeError(f"Importing {module_name} failed:\n{completed_process.stderr}")
+
+    import_times = []
+    for line in completed_process.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, imported_module_name = line[len('import time:'):].split('|')
+        is_top_level = not imported_module_name[1:].startswith(' ') # nested imports are indented
+        import_times.append((int(self_us), int(cumulative_us), imported_module_name.strip(), is_top_level))
+    return import_times
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('modules', nargs='*', default=list(DEFAULT_BUDGETS_MS))
+    parser.add_argument('--budget-ms', type=float, default=None, help="Overrides the default budget of every module.")
+    parser.add_argument('--top', type=int, default=10)
+    args = parser.parse_args()
+
+    over_budget = []
+    for module_name in args.modules:
+        import_times = _import_times(module_name)
+        # the interpreter start-up imports (site, encodings, ...) are top-level imports, too, so only count ours
+        root_package = module_name.split('.')[0]
+        total_ms = sum(
+            cumulative_us for _, cumulative_us, imported_module_name, is_top_level in import_times
+            if is_top_level and imported_module_name.split('.')[0] == root_package
+        ) / 1000
+        budget_ms = args.budget_ms or DEFAULT_BUDGETS_MS.get(module_name, 1000)
+        print(f"{module_name}: {total_ms:.0f} ms (budget {budget_ms:.0f} ms)")
+        for self_us, cumulative_us, imported_module_name, _ in sorted(import_times, reverse=True)[:args.top]:
+            print(f"    {self_us / 1000:8.1f} ms self {cumulative_us / 1000:8.1f} ms cumulative  {imported_module_name}")
+        if total_ms > budget_ms:
+            over_budget.append(module_name)
+
+    if over_budget:
+        sys.exit(f"Over the import-time budget: {over_budget}")
+
+
+if __name__ == '__main__':
+    main()
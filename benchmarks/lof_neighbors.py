@@ -0,0 +1,80 @@
+"""Accuracy-vs-speed benchmark of the neighbor backends of `LofEvaluator` ('exact', 'tree', 'hnsw'). For each table,
+reports the run time of each backend and how close it gets to the exact LOF: the Spearman correlation of the outlier
+scores, the Jaccard similarity of the flagged outliers and the number of outliers. The tables are Parquet files,
+e.g., the perfect datasets downloaded from the real bucket of MinIO; without files, a synthetic mixed-type table is
+used instead.
+
+Usage: python benchmarks/lof_neighbors.py [--rows 20000] [--n-components 16] [--repeats 1] [table.parquet ...]
+"""
+import argparse
+from pathlib import Path
+from timeit import default_timer as timer
+
+import numpy as np
+import pandas as pd
+from scipy.stats import spearmanr
+
+from synqtab.evaluators.LofEvaluator import LofEvaluator
+from synqtab.reproducibility import ReproducibleOperations
+from synqtab.utils.outlier_utils import OneHotFeatureEncoder
+
+
+BACKENDS = ['exact', 'tree', 'hnsw']
+
+
+def _synthetic_table(n_rows: int, seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    table = pd.DataFrame({f"numerical_{i}": rng.normal(size=n_rows) for i in range(10)})
+    for i, n_categories in enumerate([5, 50, 500]):
+        table[f"categorical_{i}"] = pd.Categorical(rng.integers(0, n_categories, size=n_rows).astype(str))
+    return table
+
+
+def _run(data: pd.DataFrame, backend: str, n_components: int, repeats: int) -> tuple[float, np.ndarray, np.ndarray]:
+    best, notes = float('inf'), None
+    for _ in range(repeats):
+        # a fresh encoder every time, so that the memoized encoding does not favor the later runs
+        evaluator = LofEvaluator({
+            'data': data,
+            'feature_encoder': OneHotFeatureEncoder(data),
+            'neighbor_backend': backend,
+            'n_components': n_components,
+            'notes': True,
+        })
+        start = timer()
+        _, notes = evaluator.compute_result()
+        best = min(best, timer() - start)
+    return best, np.asarray(notes['outlier_scores']), np.asarray(notes['predictions']) == -1
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('tables', nargs='*', type=Path)
+    parser.add_argument('--rows', type=int, default=20_000, help="The rows of the synthetic table.")
+    parser.add_argument('--n-components', type=int, default=16)
+    parser.add_argument('--repeats', type=int, default=1)
+    parser.add_argument('--seed', type=int, default=100)
+    args = parser.parse_args()
+
+    ReproducibleOperations.set_random_seed(args.seed)
+    tables = {path.stem: pd.read_parquet(path) for path in args.tables}
+    if not tables:
+        tables = {f"synthetic ({args.rows} rows)": _synthetic_table(args.rows, args.seed)}
+
+    print(f"{'table':>30} {'backend':>7} {'time':>11} {'spearman':>9} {'jaccard':>8} {'outliers':>9}")
+    for table_name, data in tables.items():
+        exact_scores, exact_outliers = None, None
+        for backend in BACKENDS:
+            elapsed, scores, outliers = _run(data, backend, args.n_components, args.repeats)
+            if backend == 'exact':
+                exact_scores, exact_outliers = scores, outliers
+            n_either = np.sum(outliers | exact_outliers)
+            jaccard = np.sum(outliers & exact_outliers) / n_either if n_either else 1.0
+            print(
+                f"{table_name[:30]:>30} {backend:>7} {elapsed * 1000:>8.0f} ms "
+                f"{spearmanr(scores, exact_scores).statistic:>9.4f} {jaccard:>8.3f} {int(outliers.sum()):>9}"
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+import argparse
+from typing import Optional
+
+
+def _run_worker(args: argparse.Namespace) -> None:
+    from synqtab.tasks import TaskWorker
+
+    TaskWorker(
+        processes=args.processes,
+        prefix=args.prefix,
+        follow=args.follow,
+        lease_seconds=args.lease_seconds,
+        poll_seconds=args.poll_seconds,
+    ).run()
+
+
+def _run_grid(args: argparse.Namespace) -> None:
+    from synqtab.experiments import GridRunner
+    from synqtab.utils import get_experimental_params_for_normal
+
+    GridRunner(
+        experimental_params=get_experimental_params_for_normal(),
+        cpu_processes=args.cpu_processes,
+        gpu_processes=args.gpu_processes,
+    ).run()
+
+
+def _run_generator_server(args: argparse.Namespace) -> None:
+    from synqtab.generators import GeneratorServer
+
+    GeneratorServer(
+        address=args.address, authkey=args.authkey, allow_remote=True if args.allow_remote else None
+    ).serve_forever()
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(prog='synqtab')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    worker_parser = subparsers.add_parser('worker', help="Consume evaluation tasks from the MinIO tasks bucket.")
+    worker_parser.add_argument(
+        '--processes', type=int, default=None,
+        help="Number of worker processes. Defaults to the TASK_WORKER_PROCESSES environment variable."
+    )
+    worker_parser.add_argument(
+        '--prefix', type=str, default="",
+        help="Only consume tasks whose key starts with this prefix, e.g., an experiment id."
+    )
+    worker_parser.add_argument(
+        '--follow', action='store_true',
+        help="Keep polling for new tasks once the queue is empty, instead of exiting."
+    )
+    worker_parser.add_argument(
+        '--lease-seconds', type=int, default=None,
+        help="Seconds after which the lease of an unfinished task is considered abandoned."
+    )
+    worker_parser.add_argument(
+        '--poll-seconds', type=int, default=None,
+        help="Seconds to wait between polls of an empty queue when --follow is given."
+    )
+    worker_parser.set_defaults(handler=_run_worker)
+
+    grid_parser = subparsers.add_parser('grid', help="Run the normal experiments of the grid in parallel.")
+    grid_parser.add_argument(
+        '--cpu-processes', type=int, default=None,
+        help="Concurrent experiments of CPU-only generators. Defaults to the GRID_CPU_PROCESSES environment variable."
+    )
+    grid_parser.add_argument(
+        '--gpu-processes', type=int, default=None,
+        help="Concurrent experiments of heavy generators. Defaults to the GRID_GPU_PROCESSES environment variable."
+    )
+    grid_parser.set_defaults(handler=_run_grid)
+
+    generator_server_parser = subparsers.add_parser(
+        'generator-server', help="Serve generation requests with warm prior-fitted models (TabPFN, TabEBM)."
+    )
+    generator_server_parser.add_argument(
+        '--address', type=str, default=None,
+        help="The host:port to listen on. Defaults to the GENERATOR_SERVER_ADDRESS environment variable."
+    )
+    generator_server_parser.add_argument(
+        '--authkey', type=str, default=None,
+        help="The key that clients must present. Defaults to the GENERATOR_SERVER_AUTHKEY environment variable."
+    )
+    generator_server_parser.add_argument(
+        '--allow-remote', action='store_true',
+        help="Listen on a host other than loopback. Only on trusted networks: clients can run code in the server."
+    )
+    generator_server_parser.set_defaults(handler=_run_generator_server)
+
+    args = parser.parse_args(argv)
+    args.handler(args)
+
+
+if __name__ == '__main__':
+    main()
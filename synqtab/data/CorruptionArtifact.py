@@ -0,0 +1,125 @@
+import hashlib
+import json
+from typing import Any, Optional
+
+import pandas as pd
+
+from synqtab.utils import get_logger
+
+
+LOG = get_logger(__file__)
+
+
+class CorruptionArtifact():
+    """The corrupted training data of an imperfect experiment, together with the rows and columns that were corrupted,
+    stored in the real bucket of MinIO under `imperfect/<minio path of the experiment>/`. The experiment stores it
+    once and its RH evaluations load it, instead of running the same corruption all over again.
+
+    The data are written first and the manifest last, so an artifact without a manifest is ignored. The manifest
+    records a fingerprint of everything the corruption depends on (the experiment id, which contains the random seed,
+    the random stream, the RNG mode and the training data), as well as a checksum of the corrupted data. An artifact
+    is only used if both still match; otherwise the caller corrupts the data again and overwrites it.
+    """
+
+    _version: int = 1
+    _data_file_name: str = 'training.parquet'
+    _manifest_file_name: str = 'manifest.json'
+
+    def __init__(self, object_prefix: str, fingerprint: str):
+        """
+        Args:
+            object_prefix (str): the MinIO prefix of the artifact, e.g., `imperfect/data/NOR/anneal/...`.
+            fingerprint (str): the fingerprint of the corruption, as returned by
+            `CorruptionArtifact.compute_fingerprint()`.
+        """
+        self.object_prefix = object_prefix
+        self.fingerprint = fingerprint
+
+    @classmethod
+    def compute_fingerprint(cls, training_df: pd.DataFrame, experiment_id: str, stream_id: str) -> str:
+        """Hashes the inputs of a corruption. Identical inputs lead to identical corrupted data."""
+        from synqtab.environment import RNG_MODE
+
+        fingerprint = hashlib.sha256()
+        for part in (str(cls._version), experiment_id, stream_id, RNG_MODE):
+            fingerprint.update(part.encode('utf-8') + b'\0')
+        fingerprint.update(cls._checksum(training_df).encode('utf-8'))
+        return fingerprint.hexdigest()
+
+    @staticmethod
+    def _checksum(df: pd.DataFrame) -> str:
+        # the values alone do not tell a categorical column from a plain one, so the dtypes and categories count, too
+        checksum = hashlib.sha256(
+            json.dumps([[str(column), str(df[column].dtype)] for column in df.columns]).encode('utf-8')
+        )
+        for column in df.columns:
+            if isinstance(df[column].dtype, pd.CategoricalDtype):
+                checksum.update(pd.util.hash_pandas_object(df[column].cat.categories, index=False).to_numpy().tobytes())
+        checksum.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+        return checksum.hexdigest()
+
+    @property
+    def _data_object_name(self) -> str:
+        return f"{self.object_prefix}/{self._data_file_name}"
+
+    def load(self) -> Optional[tuple[pd.DataFrame, list, list]]:
+        """Loads the artifact from MinIO.
+
+        Returns:
+            Optional[tuple[pd.DataFrame, list, list]]: the corrupted data, the corrupted rows and the corrupted
+            columns, or None if there is no artifact or it does not match the fingerprint and its checksum.
+        """
+        from synqtab.data import MinioClient
+        from synqtab.enums import MinioBucket
+
+        manifest_object = MinioClient.get_object_with_etag(
+            MinioBucket.REAL, f"{self.object_prefix}/{self._manifest_file_name}"
+        )
+        if manifest_object is None:
+            return None
+
+        manifest = json.loads(manifest_object[0].decode('utf-8'))
+        if manifest.get('fingerprint') != self.fingerprint:
+            LOG.warning(f"The corruption artifact '{self.object_prefix}' was created from different inputs; ignoring it.")
+            return None
+
+        data = MinioClient.read_parquet_from_bucket(bucket_name=MinioBucket.REAL, object_name=self._data_object_name)
+        for column, categorical_dtype in manifest.get('categorical_dtypes', dict()).items():
+            # Parquet does not restore every categorical column, e.g., not the ones with integer categories
+            data[column] = pd.Categorical(data[column], **categorical_dtype)
+        if self._checksum(data) != manifest.get('checksum'):
+            LOG.warning(f"The corruption artifact '{self.object_prefix}' does not match its checksum; ignoring it.")
+            return None
+
+        LOG.info(f"Loaded the corruption artifact '{self.object_prefix}'.")
+        return data, manifest['corrupted_rows'], manifest['corrupted_cols']
+
+    def store(self, data: pd.DataFrame, corrupted_rows: list, corrupted_cols: list) -> None:
+        """Stores the corrupted data and the corrupted rows and columns in MinIO, together with their manifest."""
+        from synqtab.data import MinioClient
+        from synqtab.enums import MinioBucket
+
+        MinioClient.upload_dataframe_as_parquet_to_bucket(
+            df=data,
+            bucket_name=MinioBucket.REAL,
+            object_name=self._data_object_name,
+            preserve_index=True, # the corrupted rows are index labels
+        )
+        manifest: dict[str, Any] = {
+            'version': self._version,
+            'fingerprint': self.fingerprint,
+            'checksum': self._checksum(data),
+            'corrupted_rows': pd.Index(corrupted_rows).tolist(),
+            'corrupted_cols': pd.Index(corrupted_cols).tolist(),
+            'categorical_dtypes': {
+                column: {'categories': dtype.categories.tolist(), 'ordered': bool(dtype.ordered)}
+                for column, dtype in data.dtypes.items() if isinstance(dtype, pd.CategoricalDtype)
+            },
+        }
+        MinioClient.upload_json_to_bucket(
+            data=manifest,
+            bucket_name=MinioBucket.REAL,
+            folder=self.object_prefix,
+            file_name=self._manifest_file_name,
+        )
+        LOG.info(f"Stored the corruption artifact '{self.object_prefix}'.")
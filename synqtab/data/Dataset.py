@@ -16,11 +16,33 @@ class Dataset:
     _POLLUTE_FUNCTION = 'pollute'
     
     def __init__(self, dataset_name: str):
+        # The metadata are fetched lazily, on first access, through the process-wide DatasetCache
         self.dataset_name = dataset_name
-        self.metadata = self._fetch_metadata()
-        self.problem_type = self.metadata.get(str(Metadata.PROBLEM_TYPE), 'classification')
-        self.target_feature = self.metadata.get(str(Metadata.TARGET_FEATURE))
-        self.categorcal_features = self.metadata.get(str(Metadata.CATEGORICAL_FEATURES), [])
+        self._metadata: Optional[dict[str, Any]] = None
+    
+    @property
+    def metadata(self) -> dict[str, Any]:
+        from synqtab.data.DatasetCache import DatasetCache
+        
+        if self._metadata is None:
+            self._metadata = DatasetCache.get_metadata(self.dataset_name, loader=self._fetch_metadata)
+        return self._metadata
+    
+    @property
+    def problem_type(self) -> str:
+        return self.metadata.get(str(Metadata.PROBLEM_TYPE), 'classification')
+    
+    @property
+    def target_feature(self) -> str:
+        return self.metadata.get(str(Metadata.TARGET_FEATURE))
+    
+    @property
+    def categorcal_features(self) -> list[str]:
+        return self.metadata.get(str(Metadata.CATEGORICAL_FEATURES), [])
+    
+    @property
+    def categorical_features(self) -> list[str]:
+        return self.categorcal_features
         
     def get_metadata(self) -> dict:
         """
@@ -54,6 +76,14 @@ class Dataset:
         )
         
     def _fetch_real_perfect_dataframe(self) -> pd.DataFrame:
+        """Returns a private copy of the real perfect data of the dataset. The data are downloaded at most once per
+        process, as long as they stay in the DatasetCache.
+        """
+        from synqtab.data.DatasetCache import DatasetCache
+        
+        return DatasetCache.get_dataframe(self.dataset_name, loader=self._download_real_perfect_dataframe)
+        
+    def _download_real_perfect_dataframe(self) -> pd.DataFrame:
         from synqtab.data import MinioClient
         from synqtab.enums import MinioBucket, MinioFolder
         
@@ -76,7 +106,7 @@ class Dataset:
 
         return df
 
-    def get_sdmetrics_single_table_metadata(self) -> dict[str, Any]:
+    def get_sdmetrics_single_table_metadata(self, columns: Optional[list[str]] = None) -> dict[str, Any]:
         """Example based on https://docs.sdv.dev/sdmetrics/getting-started/metadata/single-table-metadata
         {
             "columns": {
@@ -92,13 +122,17 @@ class Dataset:
             }
         }
 
+        Args:
+            columns (list[str], optional): the columns of the dataset, if the caller has already fetched it.
+            If None, the dataset is fetched from MinIO to get its columns. Defaults to None.
+
         Returns:
             dict[str, Any]: An sdmetrics metadata dictionary
         """
         from synqtab.enums import ProblemType
         
         columns_dict: dict[str, str] = dict()
-        all_columns = self._fetch_real_perfect_dataframe().columns
+        all_columns = columns if columns is not None else self._fetch_real_perfect_dataframe().columns
         
         # Create one sub-dictionary per feature column
         for column in all_columns:
@@ -0,0 +1,92 @@
+import copy
+import threading
+from collections import OrderedDict
+from typing import Any, Callable
+
+import pandas as pd
+
+from synqtab.environment import DATASET_CACHE_MAX_ENTRIES, DATASET_CACHE_MAX_BYTES
+from synqtab.utils import get_logger
+
+
+LOG = get_logger(__file__)
+
+
+class SingletonDatasetCache(type):
+    _instances = {}
+
+    def __call__(cls, *args, **kwargs):
+        if cls not in cls._instances:
+            cls._instances[cls] = super(SingletonDatasetCache, cls).__call__(*args, **kwargs)
+        return cls._instances[cls]
+
+
+class _DatasetCache:
+    _lock = threading.Lock()
+    _metadata: OrderedDict[str, dict[str, Any]] = OrderedDict()
+    _dataframes: OrderedDict[str, pd.DataFrame] = OrderedDict()
+    _dataframe_bytes: dict[str, int] = dict()
+    max_entries: int = DATASET_CACHE_MAX_ENTRIES
+    max_bytes: int = DATASET_CACHE_MAX_BYTES
+
+
+class DatasetCache(_DatasetCache, metaclass=SingletonDatasetCache):
+    """Process-wide least-recently-used cache of the metadata and the (categorical-typed) real perfect DataFrame of
+    each dataset, keyed by dataset name. Both are loaded through the given loader on a miss and handed out as copies
+    on every hit, so that callers can never mutate the cached state. The DataFrames are bounded both by number
+    (`DATASET_CACHE_MAX_ENTRIES`) and by their total in-memory size (`DATASET_CACHE_MAX_BYTES`).
+    """
+
+    @classmethod
+    def get_metadata(cls, dataset_name: str, loader: Callable[[], dict[str, Any]]) -> dict[str, Any]:
+        with cls._lock:
+            metadata = cls._metadata.get(dataset_name)
+            if metadata is not None:
+                cls._metadata.move_to_end(dataset_name)
+
+        if metadata is None:
+            metadata = loader()
+            with cls._lock:
+                cls._metadata[dataset_name] = metadata
+                while len(cls._metadata) > cls.max_entries:
+                    cls._metadata.popitem(last=False)
+
+        return copy.deepcopy(metadata)
+
+    @classmethod
+    def get_dataframe(cls, dataset_name: str, loader: Callable[[], pd.DataFrame]) -> pd.DataFrame:
+        with cls._lock:
+            df = cls._dataframes.get(dataset_name)
+            if df is not None:
+                cls._dataframes.move_to_end(dataset_name)
+
+        if df is None:
+            df = loader()
+            cls._put_dataframe(dataset_name, df)
+
+        return df.copy(deep=True)
+
+    @classmethod
+    def _put_dataframe(cls, dataset_name: str, df: pd.DataFrame) -> None:
+        df_bytes = int(df.memory_usage(deep=True).sum())
+        if df_bytes > cls.max_bytes:
+            LOG.info(f"Dataset {dataset_name} ({df_bytes} bytes) exceeds the cache budget and will not be cached.")
+            return
+
+        with cls._lock:
+            cls._dataframes[dataset_name] = df
+            cls._dataframe_bytes[dataset_name] = df_bytes
+            while (
+                len(cls._dataframes) > cls.max_entries
+                or sum(cls._dataframe_bytes.values()) > cls.max_bytes
+            ):
+                evicted_dataset_name, _ = cls._dataframes.popitem(last=False)
+                cls._dataframe_bytes.pop(evicted_dataset_name)
+                LOG.info(f"Evicted dataset {evicted_dataset_name} from the dataset cache.")
+
+    @classmethod
+    def clear(cls) -> None:
+        with cls._lock:
+            cls._metadata.clear()
+            cls._dataframes.clear()
+            cls._dataframe_bytes.clear()
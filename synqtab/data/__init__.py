@@ -1,10 +1,14 @@
+from .CorruptionArtifact import CorruptionArtifact
 from .Dataset import Dataset
+from .DatasetCache import DatasetCache
 from .clients.FileSystemClient import FileSystemClient
 from .clients.MinioClient import MinioClient
 from .clients.PostgresClient import PostgresClient
 
 __all__ = [
+    'CorruptionArtifact',
     'Dataset',
+    'DatasetCache',
     'FileSystemClient',
     'MinioClient',
     'PostgresClient'
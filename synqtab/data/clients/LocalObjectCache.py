@@ -0,0 +1,85 @@
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Iterable, Optional
+
+from synqtab.utils import get_logger
+
+
+LOG = get_logger(__file__)
+
+
+class LocalObjectCache():
+    """Content-addressed cache of MinIO objects on the local disk. Objects are stored under their ETag, which changes
+    whenever the object changes, so a cached copy is valid for as long as the ETag that MinIO reports for the key is
+    the same. The cache directory may be shared by all processes of a node: files are written to a temporary file and
+    atomically renamed into place, and a file that disappears because another process evicted it is simply a miss.
+    Once the total size of the cache exceeds `max_bytes`, the least recently used objects are evicted.
+    """
+
+    _chunk_size: int = 8 * 1024 * 1024
+
+    def __init__(self, cache_dir: str, max_bytes: int):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _path_of(self, etag: str) -> Path:
+        etag = etag.strip('"')
+        return self.cache_dir / etag[:2] / etag
+
+    def get(self, etag: str) -> Optional[Path]:
+        """Returns the local path of the object with the given ETag, or None if it is not cached."""
+        path = self._path_of(etag)
+        try:
+            os.utime(path) # mark as recently used
+            return path
+        except FileNotFoundError:
+            return None
+
+    def put(self, etag: str, chunks: Iterable[bytes]) -> Path:
+        """Stores the object with the given ETag from an iterable of byte chunks and returns its local path."""
+        path = self._path_of(etag)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        file_descriptor, temp_path = tempfile.mkstemp(dir=path.parent, prefix='.', suffix='.part')
+        try:
+            with os.fdopen(file_descriptor, 'wb') as temp_file:
+                for chunk in chunks:
+                    temp_file.write(chunk)
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+        self._evict_if_needed()
+        return path
+
+    def _evict_if_needed(self) -> None:
+        with self._lock:
+            cached_files = []
+            total_bytes = 0
+            for path in self.cache_dir.glob('*/*'):
+                if path.name.startswith('.'): # in-flight writes of this or other processes
+                    continue
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                cached_files.append((stat.st_mtime, stat.st_size, path))
+                total_bytes += stat.st_size
+
+            if total_bytes <= self.max_bytes:
+                return
+
+            for _, size, path in sorted(cached_files):
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+                total_bytes -= size
+                LOG.info(f"Evicted '{path.name}' from the local object cache.")
+                if total_bytes <= self.max_bytes:
+                    return
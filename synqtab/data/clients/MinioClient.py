@@ -1,17 +1,21 @@
 import io
 import json
 import os
-from typing import Any, Optional
+from typing import Any, Iterable, Iterator, Optional
 import yaml
 
 import boto3
 from botocore.exceptions import ClientError, NoCredentialsError
 import pandas as pd
 
+from synqtab.data.clients.LocalObjectCache import LocalObjectCache
 from synqtab.enums import MinioBucket
 from synqtab.environment import (
     MINIO_ROOT_USER, MINIO_ROOT_PASSWORD,
     MINIO_API_MAPPED_PORT, MINIO_HOST,
+    MINIO_CACHE_DIR, MINIO_CACHE_MAX_BYTES, MINIO_CACHE_BUCKETS,
+    MINIO_PARQUET_COMPRESSION, MINIO_PARQUET_ROW_GROUP_SIZE, MINIO_MULTIPART_PART_BYTES,
+    MINIO_LIST_PAGE_SIZE, MINIO_LIST_MAX_WORKERS,
 )
 from synqtab.utils import get_logger
 
@@ -35,6 +39,9 @@ class _MinioClient:
         aws_access_key_id=MINIO_ROOT_USER,
         aws_secret_access_key=MINIO_ROOT_PASSWORD,
     )
+    _local_cache = LocalObjectCache(MINIO_CACHE_DIR, MINIO_CACHE_MAX_BYTES) if MINIO_CACHE_DIR else None
+    _local_cache_buckets = set(MINIO_CACHE_BUCKETS)
+    _existing_buckets: set[str] = set() # buckets known to exist, so that they are not checked again
     
 
 class MinioClient(_MinioClient, metaclass=SingletonMinioClient):
@@ -53,6 +60,8 @@ class MinioClient(_MinioClient, metaclass=SingletonMinioClient):
     @classmethod
     def ensure_bucket_exists(cls, bucket_name: str | MinioBucket) -> None:
         bucket_name = str(bucket_name)
+        if bucket_name in cls._existing_buckets:
+            return
         try:
             cls._client.head_bucket(Bucket=bucket_name)
             LOG.info(f"Bucket '{bucket_name}' exists and is accessible.")
@@ -64,17 +73,130 @@ class MinioClient(_MinioClient, metaclass=SingletonMinioClient):
             except ClientError as e:
                 LOG.error(f"Failed to create bucket '{bucket_name}'. {e}")
                 raise
+        cls._existing_buckets.add(bucket_name)
     
+    @classmethod
+    def iter_bucket_objects(
+        cls,
+        bucket_name: str | MinioBucket,
+        prefix: str = "",
+        prefixes: Optional[Iterable[str]] = None,
+        max_workers: Optional[int] = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Lazily yields all objects of the bucket under the given prefix, one listing page at a time, so that
+        arbitrarily large buckets can be traversed without holding all their keys in memory.
+
+        Args:
+            bucket_name (str | MinioBucket): the bucket to list.
+            prefix (str, optional): the prefix to list. Ignored if `prefixes` are given. Defaults to "".
+            prefixes (Iterable[str], optional): disjoint prefixes (e.g., one per dataset or per seed) to list
+            concurrently. The objects of different prefixes are interleaved in no particular order. Defaults to None.
+            max_workers (int, optional): threads listing `prefixes`. Defaults to `MINIO_LIST_MAX_WORKERS`.
+
+        Yields:
+            dict[str, Any]: the objects, as returned in the `Contents` of `list_objects_v2`.
+        """
+        bucket_name = str(bucket_name)
+        if prefixes is None:
+            for page in cls._iter_bucket_pages(bucket_name, prefix):
+                yield from page
+            return
+
+        prefixes = list(prefixes)
+        max_workers = max(1, min(max_workers or MINIO_LIST_MAX_WORKERS, len(prefixes) or 1))
+        if max_workers == 1:
+            for prefix in prefixes:
+                for page in cls._iter_bucket_pages(bucket_name, prefix):
+                    yield from page
+            return
+
+        yield from cls._iter_bucket_pages_concurrently(bucket_name, prefixes, max_workers)
+
+    @classmethod
+    def _iter_bucket_pages(cls, bucket_name: str, prefix: str) -> Iterator[list[dict[str, Any]]]:
+        # paginators are not thread-safe, unlike the client itself, so every listing gets its own
+        paginator = cls._client.get_paginator('list_objects_v2')
+        total_objects = 0
+        try:
+            for response in paginator.paginate(
+                Bucket=bucket_name, Prefix=prefix, PaginationConfig={'PageSize': MINIO_LIST_PAGE_SIZE}
+            ):
+                contents = response.get("Contents", [])
+                total_objects += len(contents)
+                yield contents
+        except ClientError as e:
+            LOG.error(f"Failed to list objects in bucket '{bucket_name}' with prefix '{prefix}'. {e}")
+            raise
+        LOG.info(f"Found {total_objects} objects in '{bucket_name}' with prefix '{prefix}'.")
+
+    @classmethod
+    def _iter_bucket_pages_concurrently(
+        cls, bucket_name: str, prefixes: list[str], max_workers: int
+    ) -> Iterator[dict[str, Any]]:
+        import queue
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+
+        # bounded, so that fast listers cannot run arbitrarily ahead of the consumer
+        pages = queue.Queue(maxsize=2 * max_workers)
+        stop = threading.Event()
+        done = object()
+
+        def put(item: Any) -> bool:
+            while not stop.is_set():
+                try:
+                    pages.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def list_prefix(prefix: str) -> None:
+            try:
+                for page in cls._iter_bucket_pages(bucket_name, prefix):
+                    if not put(page):
+                        return
+            except BaseException as e:
+                put(e)
+            finally:
+                put(done)
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='minio-list') as executor:
+            for prefix in prefixes:
+                executor.submit(list_prefix, prefix)
+            try:
+                pending_prefixes = len(prefixes)
+                while pending_prefixes:
+                    item = pages.get()
+                    if item is done:
+                        pending_prefixes -= 1
+                    elif isinstance(item, BaseException):
+                        raise item
+                    else:
+                        yield from item
+            finally:
+                stop.set() # releases listers blocked on a full queue if the consumer stops early or fails
+
     @classmethod
     def list_bucket_objects(cls, bucket_name: str | MinioBucket, prefix: str = "") -> list[dict[str, Any]]:
+        """Returns all objects of the bucket under the given prefix. Prefer `iter_bucket_objects()` for large buckets."""
+        return list(cls.iter_bucket_objects(bucket_name=bucket_name, prefix=prefix))
+
+    @classmethod
+    def list_common_prefixes(cls, bucket_name: str | MinioBucket, prefix: str = "", delimiter: str = "/") -> list[str]:
+        """Returns the distinct prefixes that follow `prefix` up to the next `delimiter`, e.g., the dataset folders
+        under a data folder. Useful to split a large listing into `prefixes` for `iter_bucket_objects()`.
+        """
         bucket_name = str(bucket_name)
+        paginator = cls._client.get_paginator('list_objects_v2')
         try:
-            response = cls._client.list_objects_v2(Bucket=bucket_name, Prefix=prefix)
-            contents = response.get("Contents", [])
-            LOG.info(f"Found {len(contents)} objects in '{bucket_name}' with prefix '{prefix}'.")
-            return contents
+            return [
+                common_prefix['Prefix']
+                for response in paginator.paginate(Bucket=bucket_name, Prefix=prefix, Delimiter=delimiter)
+                for common_prefix in response.get('CommonPrefixes', [])
+            ]
         except ClientError as e:
-            LOG.error(f"Failed to list objects in bucket '{bucket_name}'. {e}")
+            LOG.error(f"Failed to list common prefixes in bucket '{bucket_name}' with prefix '{prefix}'. {e}")
             raise
         
     @classmethod
@@ -85,12 +207,12 @@ class MinioClient(_MinioClient, metaclass=SingletonMinioClient):
         prefix: str="",
         include_extension: bool=False,
         txt_output_file: Optional[str]=None,
+        prefixes: Optional[Iterable[str]]=None,
     ):
         bucket_name = str(bucket_name)
-        objects = cls.list_bucket_objects(bucket_name=bucket_name, prefix=prefix)
         relevant_files = [
             os.path.splitext(os.path.basename(obj['Key']))[0]
-            for obj in objects
+            for obj in cls.iter_bucket_objects(bucket_name=bucket_name, prefix=prefix, prefixes=prefixes)
             if obj['Key'].endswith(file_extension)
         ]
         LOG.info(f"Found {len(relevant_files)} files with {file_extension} \
@@ -201,14 +323,61 @@ class MinioClient(_MinioClient, metaclass=SingletonMinioClient):
             LOG.error(f"Failed to download object '{object_name}' from bucket '{bucket_name}'.")
             raise
         
+    @classmethod
+    def _get_locally_cached_object(cls, bucket_name: str | MinioBucket, object_name: str) -> Optional[str]:
+        """Returns the path of an up-to-date local copy of the object, downloading it into the local cache if needed.
+        Returns None if the local cache is disabled for the bucket, or if the object changed while downloading it.
+        """
+        bucket_name = str(bucket_name)
+        if cls._local_cache is None or bucket_name not in cls._local_cache_buckets:
+            return None
+
+        try:
+            etag = cls._client.head_object(Bucket=bucket_name, Key=object_name)['ETag']
+            cached_path = cls._local_cache.get(etag)
+            if cached_path is not None:
+                LOG.info(f"Local cache hit for '{bucket_name}/{object_name}'.")
+                return str(cached_path)
+
+            response = cls._client.get_object(Bucket=bucket_name, Key=object_name, IfMatch=etag)
+            cached_path = cls._local_cache.put(etag, response['Body'].iter_chunks(LocalObjectCache._chunk_size))
+            LOG.info(f"Local cache miss for '{bucket_name}/{object_name}'. Cached it in '{cached_path}'.")
+            return str(cached_path)
+        except ClientError as e:
+            if e.response.get('Error', {}).get('Code') in {'PreconditionFailed', '412'}:
+                return None # the object was overwritten in the meantime; read it directly
+            LOG.error(f"Failed to read object '{bucket_name}/{object_name}' through the local cache. {e}")
+            raise
+
+    @classmethod
+    def _read_object_bytes(cls, bucket_name: str | MinioBucket, object_name: str) -> bytes:
+        bucket_name = str(bucket_name)
+        cached_path = cls._get_locally_cached_object(bucket_name, object_name)
+        if cached_path is not None:
+            try:
+                with open(cached_path, 'rb') as cached_file:
+                    return cached_file.read()
+            except FileNotFoundError:
+                pass # evicted by another process in the meantime
+        response = cls._client.get_object(Bucket=bucket_name, Key=object_name)
+        return response['Body'].read()
+
     @classmethod
     def read_parquet_from_bucket(
         cls, bucket_name: str | MinioBucket, object_name: str, **pandas_kwargs
     ) -> pd.DataFrame:
         bucket_name = str(bucket_name)
         try:
-            response = cls._client.get_object(Bucket=bucket_name, Key=object_name)
-            df = pd.read_parquet(io.BytesIO(response['Body'].read()), **pandas_kwargs)
+            cached_path = cls._get_locally_cached_object(bucket_name, object_name)
+            df = None
+            if cached_path is not None:
+                try:
+                    df = pd.read_parquet(cached_path, engine='pyarrow', memory_map=True, **pandas_kwargs)
+                except FileNotFoundError:
+                    pass # evicted by another process in the meantime
+            if df is None:
+                response = cls._client.get_object(Bucket=bucket_name, Key=object_name)
+                df = pd.read_parquet(io.BytesIO(response['Body'].read()), **pandas_kwargs)
             LOG.info(f"Loaded Parquet from '{bucket_name}/{object_name}' into DataFrame with shape {df.shape}.")
             return df
         except (ClientError, NoCredentialsError):
@@ -221,8 +390,7 @@ class MinioClient(_MinioClient, metaclass=SingletonMinioClient):
     ) -> dict[str, Any]:
         bucket_name = str(bucket_name)
         try:
-            response = cls._client.get_object(Bucket=bucket_name, Key=object_name)
-            content = response['Body'].read().decode('utf-8')
+            content = cls._read_object_bytes(bucket_name, object_name).decode('utf-8')
             data = yaml.safe_load(content, **yaml_kwargs)
             LOG.info(f"Loaded YAML from '{bucket_name}/{object_name}'.")
             return data
@@ -235,8 +403,7 @@ class MinioClient(_MinioClient, metaclass=SingletonMinioClient):
         try:
             bucket_name = str(bucket_name)
             import json
-            response = cls._client.get_object(Bucket=bucket_name, Key=prefix)
-            content = response['Body'].read().decode('utf-8')
+            content = cls._read_object_bytes(bucket_name, prefix).decode('utf-8')
             data = json.loads(content)
             LOG.info(f"Loaded JSON from '{bucket_name}/{prefix}'.")
             return data
@@ -265,27 +432,134 @@ class MinioClient(_MinioClient, metaclass=SingletonMinioClient):
             LOG.error(f"Failed to upload JSON to '{bucket_name}/{object_key}'.")
             raise
     
+    @classmethod
+    def object_exists(cls, bucket_name: str | MinioBucket, object_name: str) -> bool:
+        bucket_name = str(bucket_name)
+        try:
+            cls._client.head_object(Bucket=bucket_name, Key=object_name)
+            return True
+        except ClientError as e:
+            if e.response.get('Error', {}).get('Code') in {'404', 'NoSuchKey', 'NotFound'}:
+                return False
+            LOG.error(f"Failed to check whether '{bucket_name}/{object_name}' exists. {e}")
+            raise
+
+    @classmethod
+    def get_object_with_etag(cls, bucket_name: str | MinioBucket, object_name: str) -> Optional[tuple[bytes, str]]:
+        """Reads an object together with its ETag. Returns None if the object does not exist."""
+        bucket_name = str(bucket_name)
+        try:
+            response = cls._client.get_object(Bucket=bucket_name, Key=object_name)
+            return response['Body'].read(), response['ETag']
+        except ClientError as e:
+            if e.response.get('Error', {}).get('Code') in {'404', 'NoSuchKey', 'NotFound'}:
+                return None
+            LOG.error(f"Failed to read object '{bucket_name}/{object_name}'. {e}")
+            raise
+
+    @classmethod
+    def put_object_if_absent(cls, bucket_name: str | MinioBucket, object_name: str, data: bytes) -> Optional[str]:
+        """Atomically creates the object only if no object exists under the same key.
+
+        Returns:
+            Optional[str]: the ETag of the object created by this call, or None if another writer got there first.
+        """
+        return cls._put_object_conditionally(bucket_name, object_name, data, IfNoneMatch='*')
+
+    @classmethod
+    def put_object_if_match(
+        cls, bucket_name: str | MinioBucket, object_name: str, data: bytes, etag: str
+    ) -> Optional[str]:
+        """Atomically overwrites the object only if its current ETag equals the given one.
+
+        Returns:
+            Optional[str]: the ETag of the object written by this call, or None if it has changed in the meantime.
+        """
+        return cls._put_object_conditionally(bucket_name, object_name, data, IfMatch=etag)
+
+    @classmethod
+    def _put_object_conditionally(
+        cls, bucket_name: str | MinioBucket, object_name: str, data: bytes, **condition
+    ) -> Optional[str]:
+        bucket_name = str(bucket_name)
+        try:
+            return cls._client.put_object(Bucket=bucket_name, Key=object_name, Body=data, **condition)['ETag']
+        except ClientError as e:
+            if e.response.get('Error', {}).get('Code') in {
+                'PreconditionFailed', 'ConditionalRequestConflict', 'NoSuchKey', '412', '409'
+            }:
+                return None
+            LOG.error(f"Failed to conditionally write '{bucket_name}/{object_name}'. {e}")
+            raise
+
+    @classmethod
+    def upload_yaml_to_bucket(cls, data: dict[str, Any], bucket_name: str | MinioBucket, object_name: str) -> None:
+        bucket_name = str(bucket_name)
+        cls.ensure_bucket_exists(bucket_name=bucket_name)
+        try:
+            cls._client.put_object(
+                Bucket=bucket_name,
+                Key=object_name,
+                Body=yaml.dump(data).encode('utf-8'),
+                ContentType='application/yaml'
+            )
+            LOG.info(f"Uploaded YAML to '{bucket_name}/{object_name}'.")
+        except ClientError:
+            LOG.error(f"Failed to upload YAML to '{bucket_name}/{object_name}'.")
+            raise
+
     @classmethod
     def upload_dataframe_as_parquet_to_bucket(
         cls,
         df: pd.DataFrame,
         bucket_name: str | MinioBucket,
         object_name: str,
+        compression: Optional[str] = None,
+        row_group_size: Optional[int] = None,
+        preserve_index: bool = False,
     ) -> None:
-        temp_file_path = None
+        """Writes the DataFrame as Parquet straight into a (multipart) upload, without any temporary files.
+
+        Args:
+            df (pd.DataFrame): the DataFrame to upload.
+            bucket_name (str | MinioBucket): the destination bucket.
+            object_name (str): the destination key.
+            compression (str, optional): the Parquet compression codec, e.g., 'zstd' or 'snappy'.
+            Defaults to the MINIO_PARQUET_COMPRESSION environment variable.
+            row_group_size (int, optional): the maximum number of rows per row group.
+            Defaults to the MINIO_PARQUET_ROW_GROUP_SIZE environment variable.
+            preserve_index (bool, optional): whether to write the index of the DataFrame too, so that reading the
+            Parquet back restores it. Defaults to False.
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        from synqtab.data.clients.MultipartUploadStream import MultipartUploadStream
+
         bucket_name = str(bucket_name)
+        compression = compression or MINIO_PARQUET_COMPRESSION
+        row_group_size = row_group_size or MINIO_PARQUET_ROW_GROUP_SIZE
+        cls.ensure_bucket_exists(bucket_name=bucket_name)
+
+        upload_stream = MultipartUploadStream(
+            client=cls._client,
+            bucket_name=bucket_name,
+            object_name=object_name,
+            part_size=MINIO_MULTIPART_PART_BYTES,
+            content_type='application/vnd.apache.parquet',
+        )
         try:
-            import tempfile
-            with tempfile.NamedTemporaryFile(suffix=".parquet", delete=False) as tmp:
-                df.to_parquet(tmp.name, index=False)
-                temp_file_path = tmp.name
-                MinioClient.upload_file_to_bucket(
-                    local_file_path=temp_file_path,
-                    bucket_name=bucket_name,
-                    object_name=object_name,
-                )
-        finally:
-            if os.path.exists(temp_file_path):
-                os.remove(temp_file_path)
-    
-        
+            table = pa.Table.from_pandas(df, preserve_index=preserve_index)
+            with pq.ParquetWriter(
+                upload_stream, table.schema, compression=None if compression == 'none' else compression
+            ) as parquet_writer:
+                for record_batch in table.to_batches(max_chunksize=row_group_size):
+                    parquet_writer.write_batch(record_batch, row_group_size=row_group_size)
+            upload_stream.close()
+            LOG.info(f"Uploaded DataFrame with shape {df.shape} as Parquet to '{bucket_name}/{object_name}'.")
+        except (ClientError, NoCredentialsError):
+            upload_stream.abort()
+            LOG.error(f"Failed to upload Parquet to '{bucket_name}/{object_name}'.")
+            raise
+        except BaseException:
+            upload_stream.abort()
+            raise
@@ -0,0 +1,97 @@
+import io
+from typing import Any
+
+
+class MultipartUploadStream(io.RawIOBase):
+    """Write-only file-like object that streams whatever is written to it into an S3/MinIO object, without touching
+    the local disk. Bytes are buffered in memory until a part of `part_size` bytes is complete, which is then
+    uploaded as one part of a multipart upload. Small objects that never fill a single part are uploaded with a
+    plain `put_object` on close. If anything fails before the upload is complete, the multipart upload is aborted,
+    so that no orphan parts are left behind.
+    """
+
+    _min_part_size: int = 5 * 1024 * 1024 # S3 rejects non-final parts smaller than 5 MiB
+
+    def __init__(self, client: Any, bucket_name: str, object_name: str, part_size: int, content_type: str):
+        super().__init__()
+        self._client = client
+        self._bucket_name = bucket_name
+        self._object_name = object_name
+        self._part_size = max(part_size, self._min_part_size)
+        self._content_type = content_type
+        self._buffer = bytearray()
+        self._position = 0
+        self._upload_id = None
+        self._parts = []
+
+    def writable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def write(self, data: bytes) -> int:
+        if self.closed:
+            raise ValueError("I/O operation on closed upload stream.")
+        self._buffer += data
+        self._position += len(data)
+        while len(self._buffer) >= self._part_size:
+            self._upload_part(bytes(self._buffer[:self._part_size]))
+            del self._buffer[:self._part_size]
+        return len(data)
+
+    def _upload_part(self, part: bytes) -> None:
+        if self._upload_id is None:
+            self._upload_id = self._client.create_multipart_upload(
+                Bucket=self._bucket_name, Key=self._object_name, ContentType=self._content_type
+            )['UploadId']
+        part_number = len(self._parts) + 1
+        response = self._client.upload_part(
+            Bucket=self._bucket_name,
+            Key=self._object_name,
+            UploadId=self._upload_id,
+            PartNumber=part_number,
+            Body=part,
+        )
+        self._parts.append({'PartNumber': part_number, 'ETag': response['ETag']})
+
+    def close(self) -> None:
+        """Completes the upload. Call `abort()` instead if the written content is incomplete."""
+        if self.closed:
+            return
+        try:
+            if self._upload_id is None:
+                self._client.put_object(
+                    Bucket=self._bucket_name,
+                    Key=self._object_name,
+                    Body=bytes(self._buffer),
+                    ContentType=self._content_type,
+                )
+            else:
+                if self._buffer:
+                    self._upload_part(bytes(self._buffer))
+                self._client.complete_multipart_upload(
+                    Bucket=self._bucket_name,
+                    Key=self._object_name,
+                    UploadId=self._upload_id,
+                    MultipartUpload={'Parts': self._parts},
+                )
+        except BaseException:
+            self.abort()
+            raise
+        self._buffer = bytearray()
+        super().close()
+
+    def abort(self) -> None:
+        if self._upload_id is not None:
+            self._client.abort_multipart_upload(
+                Bucket=self._bucket_name, Key=self._object_name, UploadId=self._upload_id
+            )
+            self._upload_id = None
+        self._buffer = bytearray()
+        super().close()
+
+    def __del__(self) -> None:
+        # never complete an upload implicitly, e.g., when the stream is garbage collected after an error
+        if not self.closed:
+            self.abort()
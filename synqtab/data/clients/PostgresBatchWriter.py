@@ -0,0 +1,191 @@
+import atexit
+import os
+import threading
+from collections import defaultdict
+from functools import lru_cache
+from typing import Any
+
+from sqlalchemy.engine import Engine
+
+from synqtab.utils.logging_utils import get_logger
+
+
+LOG = get_logger(__file__)
+
+
+@lru_cache(maxsize=None)
+def _insert_statement(table_name: str, column_names: tuple[str, ...]):
+    """Builds the insert statement of a table and a set of columns only once. Being a Core `Insert` construct (and not
+    a textual query), SQLAlchemy also caches its compiled form and sends many rows as multi-row VALUES batches.
+    """
+    from sqlalchemy import column, table
+    from sqlalchemy.dialects.postgresql import insert
+
+    return insert(table(table_name, *[column(column_name) for column_name in column_names])).on_conflict_do_nothing()
+
+
+class _ConnectionLost(Exception):
+    def __init__(self, unwritten_rows: list[dict[str, Any]]):
+        super().__init__(f"Postgres became unreachable with {len(unwritten_rows)} rows left to write.")
+        self.unwritten_rows = unwritten_rows
+
+
+class PostgresBatchWriter():
+    """Buffers rows per table and inserts them in batches, from a background thread, whenever `max_rows` rows have
+    been buffered or `flush_seconds` have passed. Rows that conflict with existing primary keys are ignored, and rows
+    that Postgres rejects otherwise are logged and dropped. Rows of a flush that failed because Postgres was
+    unreachable are kept for the next one (up to `max_pending_rows`), so that a short Postgres outage loses nothing.
+    Buffered rows are flushed on interpreter exit, as well as on the exit of `multiprocessing` children (which skip
+    `atexit` handlers). Call `flush()` wherever the rows must be durable before moving on.
+    """
+
+    def __init__(self, engine: Engine, max_rows: int, flush_seconds: float, max_pending_rows: int):
+        self.engine = engine
+        self.max_rows = max(1, max_rows)
+        self.flush_seconds = flush_seconds
+        self.max_pending_rows = max_pending_rows
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._flush_requested = threading.Event()
+        self._rows: dict[tuple[str, tuple[str, ...]], list[dict[str, Any]]] = defaultdict(list)
+        self._buffered_rows = 0
+        self._pid = None
+        self._thread = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.flush_seconds > 0
+
+    def add(self, table_name: str, row: dict[str, Any]) -> None:
+        """Buffers a row for insertion into the given table. Writes it immediately if batching is disabled."""
+        if not self.enabled:
+            self.write(table_name, [row])
+            return
+
+        self._ensure_started()
+        with self._lock:
+            self._rows[(table_name, tuple(row))].append(row)
+            self._buffered_rows += 1
+            if self._buffered_rows >= self.max_rows:
+                self._flush_requested.set()
+
+    def write(self, table_name: str, rows: list[dict[str, Any]]) -> None:
+        """Inserts the given rows into the given table right away, in a single transaction."""
+        if not rows:
+            return
+        with self.engine.begin() as connection:
+            connection.execute(_insert_statement(table_name, tuple(rows[0])), rows)
+
+    def flush(self) -> None:
+        """Writes all buffered rows. If Postgres is unreachable, the rows that could not be written stay buffered and
+        the error is re-raised. A batch that Postgres rejects, e.g., because a row violates a NOT NULL constraint, is
+        retried row by row and only the rejected rows are dropped, so that a bad row never blocks the others.
+        """
+        with self._flush_lock:
+            with self._lock:
+                batches, self._rows, self._buffered_rows = self._rows, defaultdict(list), 0
+
+            failed_batches = dict()
+            error = None
+            for (table_name, column_names), rows in batches.items():
+                try:
+                    self._insert(table_name, column_names, rows)
+                except Exception as e:
+                    if self.is_connection_error(e):
+                        failed_batches[(table_name, column_names)] = rows
+                        error = e
+                        continue
+                    try:
+                        self._insert_row_by_row(table_name, column_names, rows)
+                    except _ConnectionLost as e:
+                        failed_batches[(table_name, column_names)] = e.unwritten_rows
+                        error = e.__cause__
+
+            if error is not None:
+                self._requeue(failed_batches)
+                raise error
+
+    def _insert(self, table_name: str, column_names: tuple[str, ...], rows: list[dict[str, Any]]) -> None:
+        with self.engine.begin() as connection:
+            connection.execute(_insert_statement(table_name, column_names), rows)
+
+    def _insert_row_by_row(self, table_name: str, column_names: tuple[str, ...], rows: list[dict[str, Any]]) -> None:
+        """Inserts the rows one at a time and drops the ones that Postgres rejects. If Postgres becomes unreachable
+        meanwhile, raises a `_ConnectionLost` that carries the rows that were not written yet."""
+        dropped_rows = 0
+        for position, row in enumerate(rows):
+            try:
+                self._insert(table_name, column_names, [row])
+            except Exception as e:
+                if self.is_connection_error(e):
+                    raise _ConnectionLost(rows[position:]) from e
+                dropped_rows += 1
+                # not an error log: ERROR records are themselves written to Postgres through this writer
+                LOG.warning(f"Dropped a row that Postgres rejected from table {table_name}: {row}. Error: {e}")
+        if dropped_rows:
+            LOG.warning(f"Dropped {dropped_rows} of {len(rows)} rows of table {table_name} that Postgres rejected.")
+
+    @staticmethod
+    def is_connection_error(error: Exception) -> bool:
+        """Whether the error means that Postgres is unreachable, as opposed to Postgres rejecting the statement."""
+        from sqlalchemy.exc import DBAPIError, InterfaceError, OperationalError
+
+        return isinstance(error, (OperationalError, InterfaceError)) or (
+            isinstance(error, DBAPIError) and error.connection_invalidated
+        )
+
+    def _requeue(self, failed_batches: dict[tuple[str, tuple[str, ...]], list[dict[str, Any]]]) -> None:
+        with self._lock:
+            for key, rows in failed_batches.items():
+                self._rows[key] = rows + self._rows[key]
+                self._buffered_rows += len(rows)
+
+            dropped_rows = 0
+            for rows in self._rows.values():
+                while self._buffered_rows > self.max_pending_rows and rows:
+                    rows.pop(0)
+                    self._buffered_rows -= 1
+                    dropped_rows += 1
+        if dropped_rows:
+            LOG.warning(f"Dropped the {dropped_rows} oldest buffered rows, because Postgres remains unreachable.")
+
+    def _ensure_started(self) -> None:
+        # a forked child inherits the buffer but not the thread, so it starts over with its own
+        if self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            if self._pid is not None:
+                self._rows, self._buffered_rows = defaultdict(list), 0
+                self._flush_requested.clear()
+            self._pid = os.getpid()
+            self._thread = threading.Thread(target=self._flush_periodically, name='postgres-batch-writer', daemon=True)
+            self._thread.start()
+            self._register_exit_flush()
+
+    def _register_exit_flush(self) -> None:
+        from multiprocessing import util
+
+        atexit.register(self._flush_on_exit)
+        util.Finalize(self, PostgresBatchWriter._flush_on_exit, args=(self,), exitpriority=10)
+
+    def _flush_on_exit(self) -> None:
+        if self._pid != os.getpid() or not self._buffered_rows:
+            return
+        try:
+            self.flush()
+        except Exception as e:
+            LOG.warning(f"Could not flush {self._buffered_rows} buffered rows to Postgres on exit. Error: {e}")
+
+    def _flush_periodically(self) -> None:
+        while True:
+            self._flush_requested.wait(timeout=self.flush_seconds)
+            self._flush_requested.clear()
+            if not self._buffered_rows:
+                continue
+            try:
+                self.flush()
+            except Exception as e:
+                # not an error log: ERROR records are themselves written to Postgres and would only add to the backlog
+                LOG.warning(f"Could not flush buffered rows to Postgres; they will be retried. Error: {e}")
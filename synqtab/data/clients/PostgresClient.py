@@ -1,10 +1,12 @@
-from typing import Any, Optional
+from typing import Any, Iterable, Optional
 
 from sqlalchemy import create_engine
 
+from synqtab.data.clients.PostgresBatchWriter import PostgresBatchWriter
 from synqtab.environment.postgres import (
     POSTGRES_USER, POSTGRES_PASSWORD,
-    POSTGRES_MAPPED_PORT, POSTGRES_HOST, POSTGRES_DB
+    POSTGRES_MAPPED_PORT, POSTGRES_HOST, POSTGRES_DB,
+    POSTGRES_BATCH_MAX_ROWS, POSTGRES_BATCH_FLUSH_SECONDS, POSTGRES_BATCH_MAX_PENDING_ROWS,
 )
 from synqtab.utils.logging_utils import get_logger
 
@@ -27,6 +29,12 @@ class _PostgresClient:
         echo=False,
         pool_pre_ping=True,
     )
+    _batch_writer = PostgresBatchWriter(
+        engine=_engine,
+        max_rows=POSTGRES_BATCH_MAX_ROWS,
+        flush_seconds=POSTGRES_BATCH_FLUSH_SECONDS,
+        max_pending_rows=POSTGRES_BATCH_MAX_PENDING_ROWS,
+    )
     
 
 class PostgresClient(_PostgresClient, metaclass=SingletonPostgresClient):
@@ -36,21 +44,32 @@ class PostgresClient(_PostgresClient, metaclass=SingletonPostgresClient):
         cls,
         table_name: str,
         query_params: dict[str, Any],
+        batched: bool = True,
     ):
-        from sqlalchemy import text
+        """Inserts a row into the given table, ignoring it if it conflicts with an existing primary key.
+
+        Args:
+            table_name (str): the table to insert the row into.
+            query_params (dict[str, Any]): the row, as a mapping of column names to values.
+            batched (bool, optional): whether the row may be buffered and written in a later batch (see
+            `PostgresBatchWriter`) instead of right away. Defaults to True.
+        """
         from synqtab.environment import EXECUTION_PROFILE
         
         query_params['execution_profile'] = EXECUTION_PROFILE
-        field_names_list = list(query_params.keys())
-        value_indicators_list = [':' + field_name for field_name in field_names_list]
-        
-        field_names = ', '.join(field_names_list)
-        value_indicators = ', '.join(value_indicators_list)
-        
-        query = text(f"""INSERT INTO {table_name} ({field_names}) VALUES ({value_indicators})""")
-        with cls._engine.connect() as connection:
-            connection.execute(query, query_params)
-            connection.commit()
+        if batched:
+            cls._batch_writer.add(table_name, query_params)
+        else:
+            cls._batch_writer.write(table_name, [query_params])
+    
+    @classmethod
+    def flush(cls) -> None:
+        """Writes all rows buffered by `execute_insert_query()` so far."""
+        try:
+            cls._batch_writer.flush()
+        except Exception as e:
+            LOG.warning(f"Failed to flush buffered rows to Postgres. Error: {e}")
+            raise
             
     @classmethod
     def write_skipped_computation(
@@ -90,6 +109,18 @@ class PostgresClient(_PostgresClient, metaclass=SingletonPostgresClient):
             LOG.error(f"Failed to write runtime error for experiment {experiment_id}. Error: {e}")
             raise
         
+    @classmethod
+    def write_runtime_errors(cls, errors: list[dict[str, Any]], errors_table_name: str = 'errors') -> None:
+        """Writes many runtime errors at once, in a single insert.
+
+        Args:
+            errors (list[dict[str, Any]]): the errors, each with an `experiment_id`, a `file_path` and an `error_message`.
+        """
+        from synqtab.environment import EXECUTION_PROFILE
+
+        rows = [{**error, 'execution_profile': EXECUTION_PROFILE} for error in errors]
+        cls._batch_writer.write(errors_table_name, rows)
+
     @classmethod
     def write_experiment(
         cls,
@@ -180,6 +211,7 @@ class PostgresClient(_PostgresClient, metaclass=SingletonPostgresClient):
                 WHERE experiment_id = :experiment_id \
                 LIMIT 1 
             """)
+            cls.flush() # buffered rows count as existing, too
             with cls._engine.connect() as connection:
                 result = connection.execute(query, {"experiment_id": evaluation_id})
                 exists = result.scalar() is not None
@@ -212,6 +244,7 @@ class PostgresClient(_PostgresClient, metaclass=SingletonPostgresClient):
                 WHERE {experiment_id_column_name} = :experiment_id \
                 LIMIT 1 
             """)
+            cls.flush() # buffered rows count as existing, too
             with cls._engine.connect() as connection:
                 result = connection.execute(query, {"experiment_id": experiment_id})
                 exists = result.scalar() is not None
@@ -243,6 +276,7 @@ class PostgresClient(_PostgresClient, metaclass=SingletonPostgresClient):
                 WHERE evaluation_id = :evaluation_id AND experiment_id = :experiment_id \
                 LIMIT 1 
             """)
+            cls.flush() # buffered rows count as existing, too
             with cls._engine.connect() as connection:
                 result = connection.execute(query, {"experiment_id": experiment_id, "evaluation_id": evaluation_id})
                 exists = result.scalar() is not None
@@ -251,3 +285,50 @@ class PostgresClient(_PostgresClient, metaclass=SingletonPostgresClient):
         except Exception as e:
             LOG.error(f"Failed to check existence of evaluation {evaluation_id} for experiment {experiment_id}. Error: {e}")
             raise
+
+    @classmethod
+    def existing_ids(
+        cls,
+        ids: Iterable[str],
+        id_columns_by_table: Optional[dict[str, str]] = None,
+        filters: Optional[dict[str, Any]] = None,
+    ) -> set[str]:
+        """Checks in bulk which of the given ids exist, in a single round trip to Postgres.
+
+        Args:
+            ids (Iterable[str]): The ids to check for existence.
+            id_columns_by_table (dict[str, str], optional): The tables to look the ids up in, mapped to the name of
+            their id column. An id exists if it is found in at least one of them. Defaults to {'experiments': 'experiment_id'}.
+            filters (dict[str, Any], optional): Extra column-value equality conditions that rows must satisfy in all
+            tables, e.g., {'experiment_id': ...} when looking up evaluation ids. Defaults to None.
+
+        Returns:
+            set[str]: The subset of `ids` that exist.
+        """
+        from sqlalchemy import text
+
+        ids = list(dict.fromkeys(ids))
+        if not ids:
+            return set()
+
+        id_columns_by_table = id_columns_by_table or {'experiments': 'experiment_id'}
+        filters = filters or dict()
+        query_params = {'ids': ids}
+        filter_conditions = ''
+        for position, (column_name, value) in enumerate(filters.items()):
+            filter_conditions += f" AND {column_name} = :filter_{position}"
+            query_params[f'filter_{position}'] = value
+
+        query = text(' UNION '.join(
+            f"SELECT {id_column_name} AS id FROM {table_name} WHERE {id_column_name} = ANY(:ids){filter_conditions}"
+            for table_name, id_column_name in id_columns_by_table.items()
+        ))
+        try:
+            cls.flush() # buffered rows count as existing, too
+            with cls._engine.connect() as connection:
+                existing = {row[0] for row in connection.execute(query, query_params)}
+                LOG.info(f"Checked existence of {len(ids)} ids in {list(id_columns_by_table)}: {len(existing)} exist.")
+                return existing
+        except Exception as e:
+            LOG.error(f"Failed to check existence of {len(ids)} ids in {list(id_columns_by_table)}. Error: {e}")
+            raise
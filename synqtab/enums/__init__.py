@@ -23,12 +23,16 @@ from .experiments import ExperimentType
 
 from .generators import (
     GeneratorModel,
+    ResourceClass,
     GENERIC_MODELS,
-    PRIVACY_MODELS
+    PRIVACY_MODELS,
+    CPU_MODELS,
 )
 
 from .minio import MinioBucket, MinioFolder
 
+from .tasks import TaskStatus
+
 
 __all__ = [
     'Metadata',
@@ -47,8 +51,11 @@ __all__ = [
     'PRIVACY_EVALUATORS',
     'ExperimentType',
     'GeneratorModel',
+    'ResourceClass',
     'GENERIC_MODELS',
     'PRIVACY_MODELS',
+    'CPU_MODELS',
     'MinioBucket',
     'MinioFolder',
+    'TaskStatus',
 ]
@@ -1,6 +1,10 @@
-from synqtab.errors import DataError
+from typing import TYPE_CHECKING
+
 from synqtab.enums.EasilyStringifyableEnum import EasilyStringifyableEnum
 
+if TYPE_CHECKING:
+    from synqtab.errors import DataError
+
 
 class Metadata(EasilyStringifyableEnum):
     NAME = 'name'
@@ -40,7 +44,7 @@ class DataErrorType(EasilyStringifyableEnum):
     INCONSISTENCY = 'INC'
     LABEL_ERROR = 'LER'
     
-    def get_class(self) -> DataError.__class__:
+    def get_class(self) -> 'type[DataError]':
         
         match(self):
             case DataErrorType.CATEGORICAL_SHIFT:
@@ -28,6 +28,7 @@ class EvaluationInput(EasilyStringifyableEnum):
     PREDICTION_COLUMN_NAME  = 'prediction_column_name'
     PROBLEM_TYPE            = 'problem_type'
     NOTES                   = 'notes'
+    FEATURE_ENCODER         = 'feature_encoder'
     
 
 # =========== ALL OUTPUT KEYS FOR EVALUATORS ===========
@@ -22,6 +22,15 @@ class GeneratorModel(EasilyStringifyableEnum):
     DPGAN = 'dpgan'
     DECAF = 'decaf'
     PRIVBAYES = 'privbayes'
+
+    def resource_class(self) -> 'ResourceClass':
+        """Returns the class of resources that fitting and sampling this generator mostly needs."""
+        return ResourceClass.CPU if self in CPU_MODELS else ResourceClass.GPU
+
+
+class ResourceClass(EasilyStringifyableEnum):
+    CPU = 'cpu' # light models that only use the CPU and can run many at a time
+    GPU = 'gpu' # deep or foundation models that need (a share of) an accelerator or a lot of memory
     
 
 GENERIC_MODELS = [
@@ -49,6 +58,14 @@ PRIVACY_MODELS = [
     GeneratorModel.PRIVBAYES,
 ]
 
+CPU_MODELS = [
+    GeneratorModel.ARF,
+    GeneratorModel.MARGINAL_DISTRIBUTIONS,
+    GeneratorModel.BAYESIAN_NETWORK,
+    GeneratorModel.AIM,
+    GeneratorModel.PRIVBAYES,
+]
+
 class SynthcityModelOption(EasilyStringifyableEnum):
     # generic models
     CTGAN = 'ctgan'
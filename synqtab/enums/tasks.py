@@ -0,0 +1,22 @@
+from synqtab.enums.EasilyStringifyableEnum import EasilyStringifyableEnum
+from synqtab.enums.minio import MinioBucket
+
+
+class TaskStatus(EasilyStringifyableEnum):
+    FINISHED = 'finished'
+    FAILED = 'failed'
+    SKIPPED = 'skipped'
+    CONTENDED = 'contended' # another worker holds the lease or already consumed the task
+    UNMOVED = 'unmoved' # the task could not be processed or moved, e.g., Postgres was unreachable; it stays in place
+
+    def destination_bucket(self) -> MinioBucket | None:
+        """Returns the bucket where a task with this status is moved to, or None if the task stays in place."""
+        match self:
+            case TaskStatus.FINISHED:
+                return MinioBucket.FINISHED_TASKS
+            case TaskStatus.FAILED:
+                return MinioBucket.FAILED_TASKS
+            case TaskStatus.SKIPPED:
+                return MinioBucket.SKIPPED_TASKS
+            case _:
+                return None
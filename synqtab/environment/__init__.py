@@ -1,6 +1,7 @@
 from .experiment import (
     RANDOM_SEEDS, ERROR_RATES,
-    EXECUTION_PROFILE, MAX_TRAINING_ROWS
+    EXECUTION_PROFILE, MAX_TRAINING_ROWS,
+    RNG_MODE, CORRUPTION_COPY_MODE, CORRUPTION_ARTIFACTS,
 )
 
 from .minio import (
@@ -10,20 +11,121 @@ from .minio import (
     MINIO_UI_MAPPED_PORT,
     MINIO_ENDPOINT,
     MINIO_HOST,
+    MINIO_PARQUET_COMPRESSION,
+    MINIO_PARQUET_ROW_GROUP_SIZE,
+    MINIO_MULTIPART_PART_BYTES,
+    MINIO_LIST_PAGE_SIZE,
+    MINIO_LIST_MAX_WORKERS,
+)
+
+from .cache import (
+    DATASET_CACHE_MAX_ENTRIES,
+    DATASET_CACHE_MAX_BYTES,
+    MINIO_CACHE_DIR,
+    MINIO_CACHE_MAX_BYTES,
+    MINIO_CACHE_BUCKETS,
 )
 
 from .discord import DISCORD_WEBHOOK_URL
 
+from .tasks import (
+    TASK_WORKER_PROCESSES,
+    TASK_LEASE_SECONDS,
+    TASK_POLL_SECONDS,
+    EVALUATION_BATCHING,
+)
+
+from .grid import (
+    GRID_CPU_PROCESSES,
+    GRID_GPU_PROCESSES,
+)
+
+from .generators import (
+    GENERATOR_SERVER_ADDRESS,
+    GENERATOR_SERVER_AUTHKEY,
+    GENERATOR_SERVER_ALLOW_REMOTE,
+    GENERATOR_SERVER_MODELS,
+    TABPFN_GENERATION_BATCH_ROWS,
+    TABPFN_GENERATION_MEMORY_BYTES,
+    TABPFN_NUM_THREADS,
+)
+
+from .evaluators import (
+    HYFD_BACKEND,
+    HYFD_JVM_MAX_HEAP,
+    DESBORDANTE_FD_ALGORITHM,
+    DESBORDANTE_FD_WIDE_COLUMNS,
+    DESBORDANTE_FD_FEW_ROWS,
+    DESBORDANTE_FD_SAMPLE_ROWS,
+    DESBORDANTE_FD_THREADS,
+    DESBORDANTE_FD_TIMEOUT_SECONDS,
+    LOF_NEIGHBOR_BACKEND,
+    LOF_TREE_COMPONENTS,
+    DCR_ENGINE,
+    DCR_BLOCK_BYTES,
+    DCR_THREADS,
+    DCR_REAL_SAMPLE_ROWS,
+)
+
+from .logs import (
+    LOG_QUEUE_MAX_RECORDS,
+    LOG_BATCH_MAX_RECORDS,
+    LOG_FLUSH_SECONDS,
+)
+
 __all__ = [
     'RANDOM_SEEDS',
     'ERROR_RATES',
     'EXECUTION_PROFILE',
     'MAX_TRAINING_ROWS',
+    'RNG_MODE',
+    'CORRUPTION_COPY_MODE',
+    'CORRUPTION_ARTIFACTS',
     'MINIO_ROOT_USER',
     'MINIO_ROOT_PASSWORD',
     'MINIO_API_MAPPED_PORT',
     'MINIO_UI_MAPPED_PORT',
     'MINIO_ENDPOINT',
     'MINIO_HOST',
-    'DISCORD_WEBHOOK_URL'
+    'MINIO_PARQUET_COMPRESSION',
+    'MINIO_PARQUET_ROW_GROUP_SIZE',
+    'MINIO_MULTIPART_PART_BYTES',
+    'MINIO_LIST_PAGE_SIZE',
+    'MINIO_LIST_MAX_WORKERS',
+    'DATASET_CACHE_MAX_ENTRIES',
+    'DATASET_CACHE_MAX_BYTES',
+    'MINIO_CACHE_DIR',
+    'MINIO_CACHE_MAX_BYTES',
+    'MINIO_CACHE_BUCKETS',
+    'DISCORD_WEBHOOK_URL',
+    'TASK_WORKER_PROCESSES',
+    'TASK_LEASE_SECONDS',
+    'TASK_POLL_SECONDS',
+    'EVALUATION_BATCHING',
+    'GRID_CPU_PROCESSES',
+    'GRID_GPU_PROCESSES',
+    'GENERATOR_SERVER_ADDRESS',
+    'GENERATOR_SERVER_AUTHKEY',
+    'GENERATOR_SERVER_ALLOW_REMOTE',
+    'GENERATOR_SERVER_MODELS',
+    'TABPFN_GENERATION_BATCH_ROWS',
+    'TABPFN_GENERATION_MEMORY_BYTES',
+    'TABPFN_NUM_THREADS',
+    'HYFD_BACKEND',
+    'HYFD_JVM_MAX_HEAP',
+    'DESBORDANTE_FD_ALGORITHM',
+    'DESBORDANTE_FD_WIDE_COLUMNS',
+    'DESBORDANTE_FD_FEW_ROWS',
+    'DESBORDANTE_FD_SAMPLE_ROWS',
+    'DESBORDANTE_FD_THREADS',
+    'DESBORDANTE_FD_TIMEOUT_SECONDS',
+    'LOF_NEIGHBOR_BACKEND',
+    'LOF_TREE_COMPONENTS',
+    'DCR_ENGINE',
+    'DCR_BLOCK_BYTES',
+    'DCR_THREADS',
+    'DCR_REAL_SAMPLE_ROWS',
+    'LOG_QUEUE_MAX_RECORDS',
+    'LOG_BATCH_MAX_RECORDS',
+    'LOG_FLUSH_SECONDS',
 ]
@@ -0,0 +1,12 @@
+import os
+from dotenv import load_dotenv
+
+
+load_dotenv()
+DATASET_CACHE_MAX_ENTRIES = int(os.getenv('DATASET_CACHE_MAX_ENTRIES', '64'))
+DATASET_CACHE_MAX_BYTES = int(os.getenv('DATASET_CACHE_MAX_BYTES', str(2 * 1024 ** 3))) # 2 GiB
+MINIO_CACHE_DIR = os.getenv('MINIO_CACHE_DIR', '') # the local disk cache of MinIO reads is disabled if empty
+MINIO_CACHE_MAX_BYTES = int(os.getenv('MINIO_CACHE_MAX_BYTES', str(10 * 1024 ** 3))) # 10 GiB
+MINIO_CACHE_BUCKETS = [
+    bucket.strip() for bucket in os.getenv('MINIO_CACHE_BUCKETS', 'real,synthetic').split(',') if bucket.strip()
+]
@@ -0,0 +1,19 @@
+import os
+from dotenv import load_dotenv
+
+
+load_dotenv()
+HYFD_BACKEND = os.getenv('HYFD_BACKEND', 'subprocess') # 'subprocess' starts java per call, 'jvm' keeps a JVM alive per process (needs jpype1)
+HYFD_JVM_MAX_HEAP = os.getenv('HYFD_JVM_MAX_HEAP', '16g') # the -Xmx of the JVM that runs HyFD; with 'jvm', held by every worker process, so size it per process
+DESBORDANTE_FD_ALGORITHM = os.getenv('DESBORDANTE_FD_ALGORITHM', 'auto') # 'auto' picks by shape, or one of 'pyro', 'hyfd', 'fdep', 'tane'
+DESBORDANTE_FD_WIDE_COLUMNS = int(os.getenv('DESBORDANTE_FD_WIDE_COLUMNS', 100)) # above this many columns 'auto' leaves Pyro
+DESBORDANTE_FD_FEW_ROWS = int(os.getenv('DESBORDANTE_FD_FEW_ROWS', 1000)) # wide tables with at most this many rows use FDep, the rest HyFD
+DESBORDANTE_FD_SAMPLE_ROWS = int(os.getenv('DESBORDANTE_FD_SAMPLE_ROWS', 0)) # discover on a row sample of this size and validate on all rows; 0 = exact
+DESBORDANTE_FD_THREADS = int(os.getenv('DESBORDANTE_FD_THREADS', 1)) # threads of the algorithms that support them (Pyro, HyFD)
+DESBORDANTE_FD_TIMEOUT_SECONDS = float(os.getenv('DESBORDANTE_FD_TIMEOUT_SECONDS', 0)) # 0 = no timeout
+LOF_NEIGHBOR_BACKEND = os.getenv('LOF_NEIGHBOR_BACKEND', 'exact') # 'exact', 'tree' (KD-tree on SVD components) or 'hnsw' (needs hnswlib)
+LOF_TREE_COMPONENTS = int(os.getenv('LOF_TREE_COMPONENTS', 16)) # the dimensions that the 'tree' backend reduces the data to
+DCR_ENGINE = os.getenv('DCR_ENGINE', 'native') # 'native' (synqtab.utils.dcr_utils) or 'sdmetrics'
+DCR_BLOCK_BYTES = int(os.getenv('DCR_BLOCK_BYTES', 64 * 2**20)) # the memory of the distance block that each thread computes at a time
+DCR_THREADS = int(os.getenv('DCR_THREADS', os.cpu_count() or 1)) # the threads that compute the distance blocks
+DCR_REAL_SAMPLE_ROWS = int(os.getenv('DCR_REAL_SAMPLE_ROWS', 0)) # compare against a sample of this many real rows; 0 = all rows
@@ -34,3 +34,6 @@ ERROR_RATES = _get_pollution_rates_from_env_or_else_default()
 MAX_TRAINING_ROWS = float(os.getenv('MAX_TRAINING_ROWS', 'inf'))
 EXECUTION_PROFILE = os.getenv('EXECUTION_PROFILE', 'NOT FOUND IN ENV')
 
+RNG_MODE = os.getenv('RNG_MODE', 'legacy') # 'legacy' reseeds the global numpy state, 'streams' uses per-purpose generators
+CORRUPTION_COPY_MODE = os.getenv('CORRUPTION_COPY_MODE', 'touched_columns') # 'deep' copies all columns before corrupting
+CORRUPTION_ARTIFACTS = os.getenv('CORRUPTION_ARTIFACTS', 'true').lower() == 'true' # reuse the corrupted training data via MinIO
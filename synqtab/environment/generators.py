@@ -0,0 +1,14 @@
+import os
+from dotenv import load_dotenv
+
+
+load_dotenv()
+GENERATOR_SERVER_ADDRESS = os.getenv('GENERATOR_SERVER_ADDRESS', '') # host:port of the generator server; generators run in-process if empty
+GENERATOR_SERVER_AUTHKEY = os.getenv('GENERATOR_SERVER_AUTHKEY', '') # required by the server and its clients; use a long random secret
+GENERATOR_SERVER_ALLOW_REMOTE = os.getenv('GENERATOR_SERVER_ALLOW_REMOTE', 'false').lower() == 'true' # allow hosts other than loopback; requests are pickled, so only on trusted networks
+GENERATOR_SERVER_MODELS = [ # the generators that are served by the generator server, if any
+    generator.strip() for generator in os.getenv('GENERATOR_SERVER_MODELS', 'tabpfn,tabebm').split(',') if generator.strip()
+]
+TABPFN_GENERATION_BATCH_ROWS = int(os.getenv('TABPFN_GENERATION_BATCH_ROWS', '0')) # rows generated at a time; all at once if 0
+TABPFN_GENERATION_MEMORY_BYTES = int(os.getenv('TABPFN_GENERATION_MEMORY_BYTES', '0')) # caps the rows generated at a time; no cap if 0
+TABPFN_NUM_THREADS = int(os.getenv('TABPFN_NUM_THREADS', '0')) # torch threads while generating; torch decides if 0
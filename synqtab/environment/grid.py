@@ -0,0 +1,7 @@
+import os
+from dotenv import load_dotenv
+
+
+load_dotenv()
+GRID_CPU_PROCESSES = int(os.getenv('GRID_CPU_PROCESSES', str(os.cpu_count() or 1))) # concurrent experiments of CPU-only generators
+GRID_GPU_PROCESSES = int(os.getenv('GRID_GPU_PROCESSES', '1')) # concurrent experiments of heavy (GPU) generators
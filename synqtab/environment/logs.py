@@ -0,0 +1,8 @@
+import os
+from dotenv import load_dotenv
+
+
+load_dotenv()
+LOG_QUEUE_MAX_RECORDS = int(os.getenv('LOG_QUEUE_MAX_RECORDS', '10000')) # error records waiting to be written; more are dropped
+LOG_BATCH_MAX_RECORDS = int(os.getenv('LOG_BATCH_MAX_RECORDS', '100')) # error records written per insert
+LOG_FLUSH_SECONDS = float(os.getenv('LOG_FLUSH_SECONDS', '2')) # idle time after which buffered error records are written
@@ -9,3 +9,8 @@ MINIO_API_MAPPED_PORT = os.getenv('MINIO_API_MAPPED_PORT')
 MINIO_UI_MAPPED_PORT = os.getenv('MINIO_UI_MAPPED_PORT')
 MINIO_ENDPOINT = os.getenv('MINIO_ENDPOINT')
 MINIO_HOST = os.getenv('MINIO_HOST')
+MINIO_PARQUET_COMPRESSION = os.getenv('MINIO_PARQUET_COMPRESSION', 'zstd') # e.g., zstd, snappy, gzip or none
+MINIO_PARQUET_ROW_GROUP_SIZE = int(os.getenv('MINIO_PARQUET_ROW_GROUP_SIZE', str(128 * 1024))) # rows per row group
+MINIO_MULTIPART_PART_BYTES = int(os.getenv('MINIO_MULTIPART_PART_BYTES', str(16 * 1024 ** 2))) # 16 MiB, at least 5 MiB
+MINIO_LIST_PAGE_SIZE = int(os.getenv('MINIO_LIST_PAGE_SIZE', '1000')) # keys per list request, at most 1000
+MINIO_LIST_MAX_WORKERS = int(os.getenv('MINIO_LIST_MAX_WORKERS', '8')) # threads when listing several prefixes
@@ -8,3 +8,6 @@ POSTGRES_PASSWORD = os.getenv('POSTGRES_PASSWORD')
 POSTGRES_MAPPED_PORT = os.getenv('POSTGRES_MAPPED_PORT')
 POSTGRES_HOST = os.getenv('POSTGRES_HOST')
 POSTGRES_DB = os.getenv('POSTGRES_DB')
+POSTGRES_BATCH_MAX_ROWS = int(os.getenv('POSTGRES_BATCH_MAX_ROWS', '500')) # buffered rows that trigger a flush
+POSTGRES_BATCH_FLUSH_SECONDS = float(os.getenv('POSTGRES_BATCH_FLUSH_SECONDS', '5')) # 0 writes every row immediately
+POSTGRES_BATCH_MAX_PENDING_ROWS = int(os.getenv('POSTGRES_BATCH_MAX_PENDING_ROWS', '100000')) # kept while Postgres is unreachable
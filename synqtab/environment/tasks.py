@@ -0,0 +1,9 @@
+import os
+from dotenv import load_dotenv
+
+
+load_dotenv()
+TASK_WORKER_PROCESSES = int(os.getenv('TASK_WORKER_PROCESSES', str(os.cpu_count() or 1)))
+TASK_LEASE_SECONDS = int(os.getenv('TASK_LEASE_SECONDS', str(6 * 60 * 60))) # a lease older than this is considered abandoned; renewed between the evaluations of a batch, so it must cover the longest single evaluation
+TASK_POLL_SECONDS = int(os.getenv('TASK_POLL_SECONDS', '60'))
+EVALUATION_BATCHING = os.getenv('EVALUATION_BATCHING', 'true').lower() == 'true' # one task per evaluation target pair instead of per evaluation
@@ -17,13 +17,41 @@ class CategoricalShift(DataError):
         return str(DataErrorType.CATEGORICAL_SHIFT)
 
     def _apply_corruption(self, data_to_corrupt, rows_to_corrupt, columns_to_corrupt, **kwargs):
+        import pandas as pd
         from synqtab.reproducibility import ReproducibleOperations
         
         for column_to_corrupt in columns_to_corrupt:
             distinct_values = data_to_corrupt[column_to_corrupt].value_counts().index
             permuted_distinct_values = ReproducibleOperations.derangement(distinct_values)
+            if isinstance(data_to_corrupt[column_to_corrupt].dtype, pd.CategoricalDtype):
+                data_to_corrupt[column_to_corrupt] = self._replace_categories_of_rows(
+                    data_to_corrupt, rows_to_corrupt, column_to_corrupt, distinct_values, permuted_distinct_values
+                )
+                continue
+
             replacement_values = data_to_corrupt.loc[rows_to_corrupt, column_to_corrupt] \
                                 .replace(distinct_values, permuted_distinct_values)
             data_to_corrupt.loc[rows_to_corrupt, column_to_corrupt] = replacement_values
 
         return data_to_corrupt
+
+    def _replace_categories_of_rows(self, data_to_corrupt, rows_to_corrupt, column_to_corrupt, values, replacements):
+        """Replaces each of the `values` with the corresponding of the `replacements` in the given rows of a
+        categorical column, by remapping the category codes of the rows. The dtype of the column does not change.
+        """
+        import numpy as np
+        import pandas as pd
+
+        column = data_to_corrupt[column_to_corrupt]
+        categories = column.cat.categories
+        replacement_code = np.arange(len(categories))
+        replacement_code[categories.get_indexer(values)] = categories.get_indexer(replacements)
+
+        codes = column.cat.codes.to_numpy().copy()
+        positions_to_corrupt = data_to_corrupt.index.get_indexer(rows_to_corrupt)
+        codes_to_corrupt = codes[positions_to_corrupt]
+        # missing values (code -1) are left untouched
+        codes[positions_to_corrupt] = np.where(
+            codes_to_corrupt >= 0, replacement_code[codes_to_corrupt], codes_to_corrupt
+        )
+        return pd.Categorical.from_codes(codes, dtype=column.dtype)
@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class CopyMode(Enum):
+    DEEP = "deep" # the whole input is deep-copied
+    TOUCHED_COLUMNS = "touched_columns" # the input is shallow-copied and only the columns to corrupt are deep-copied
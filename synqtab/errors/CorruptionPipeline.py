@@ -0,0 +1,105 @@
+from typing import Any, List, Optional, Tuple
+
+import pandas as pd
+
+from synqtab.errors.CopyMode import CopyMode
+from synqtab.errors.DataError import DataError
+
+
+class CorruptionPipeline():
+    """Applies several data errors one after the other on the same data, e.g., Outlier + Placeholder + LabelError at
+    different rates, to study how errors interact. Depending on the copy mode, the data is either deep-copied once and
+    every error corrupts that copy in place, or every error copies only the columns it touches (see `CopyMode`). Either
+    way, all errors work on the column partition that is computed once before the first error (so, e.g., a categorical
+    column that an error turns into `object` is still treated as categorical by the next errors).
+
+    Each error samples its own rows and columns from its own generator, keyed by its position in the pipeline (see
+    `ReproducibleOperations.get_generator()`), whatever the RNG mode. The draws of the errors are therefore
+    independent, even in legacy mode, where the operations would otherwise reseed the global random state and errors
+    with the same row fraction would corrupt the same rows.
+    """
+
+    def __init__(self, data_errors: list[DataError]):
+        from synqtab.errors.NearDuplicateRow import NearDuplicateRow
+
+        if not data_errors:
+            raise ValueError("A corruption pipeline needs at least one data error.")
+        if len(data_errors) > 1 and any(isinstance(data_error, NearDuplicateRow) for data_error in data_errors):
+            # it appends, shuffles and reindexes all rows, which invalidates the row provenance of the other errors
+            raise ValueError("NearDuplicateRow cannot be combined with other data errors in a corruption pipeline.")
+
+        self.data_errors = data_errors
+        self.provenance: list[dict[str, Any]] = []
+
+    def short_name(self) -> str:
+        return '+'.join(str(data_error.short_name()) for data_error in self.data_errors)
+
+    def corrupt(
+        self,
+        data: pd.DataFrame,
+        categorical_columns: Optional[list[str]] = None,
+        target_column: Optional[str] = None,
+        stream_id: Optional[str] = None,
+        copy: bool | CopyMode = True,
+        **kwargs,
+    ) -> Tuple[pd.DataFrame, List, List]:
+        """Corrupts a copy of `data` with all errors of the pipeline, in order.
+
+        Args:
+            data (pd.DataFrame): the data to corrupt. It is not modified, unless `copy` is False.
+            categorical_columns (list[str], optional): the categorical columns. Inferred from the dtypes if None.
+            target_column (str, optional): the target column. Defaults to None.
+            stream_id (str, optional): identifies the corruption for `ReproducibleOperations.get_generator()`, e.g.,
+            `Experiment.corruption_stream_id()`. Defaults to None.
+            copy (bool | CopyMode, optional): how to copy `data`; see `DataError.corrupt()`. Defaults to True.
+
+        Returns:
+            Tuple[pd.DataFrame, List, List]: the corrupted data, and the union of the rows and of the columns that
+            any of the errors corrupted. The rows and columns of every single error are kept in `provenance`.
+        """
+        from synqtab.reproducibility import ReproducibleOperations
+
+        copy_mode = DataError._resolve_copy_mode(copy)
+        if copy_mode == CopyMode.DEEP:
+            corrupted_data, step_copy = data.copy(deep=True), False
+        else:
+            # every error copies the columns it touches; a column touched by several errors is copied once per error
+            corrupted_data, step_copy = data, copy_mode or False
+
+        # the column partition is computed once, with the methods of the first error, and reused by all errors
+        first_data_error = self.data_errors[0]
+        first_data_error.corrupted_data = corrupted_data
+        if categorical_columns is not None:
+            first_data_error.set_numerical_categorical_columns(categorical_columns, target_column)
+        else:
+            first_data_error.infer_numerical_categorical_columns(**kwargs)
+        categorical_columns = list(first_data_error.categorical_columns)
+        numeric_columns = list(first_data_error.numeric_columns)
+
+        self.provenance = []
+        corrupted_rows, corrupted_cols = dict(), dict() # ordered sets
+        for position, data_error in enumerate(self.data_errors):
+            error_generator = ReproducibleOperations.get_generator(
+                f"corruption/{position}/{data_error.short_name()}", stream_id
+            )
+            with ReproducibleOperations.use_generator(error_generator):
+                corrupted_data, error_rows, error_cols = data_error.corrupt(
+                    data=corrupted_data,
+                    categorical_columns=categorical_columns,
+                    numeric_columns=numeric_columns,
+                    target_column=target_column,
+                    copy=step_copy,
+                    **kwargs,
+                )
+
+            error_rows, error_cols = list(error_rows), list(error_cols)
+            self.provenance.append({
+                'data_error': str(data_error.short_name()),
+                'row_fraction': data_error.row_fraction,
+                'corrupted_rows': error_rows,
+                'corrupted_cols': error_cols,
+            })
+            corrupted_rows.update(dict.fromkeys(error_rows))
+            corrupted_cols.update(dict.fromkeys(error_cols))
+
+        return corrupted_data, list(corrupted_rows), list(corrupted_cols)
@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional, Tuple
 import pandas as pd
 
+from synqtab.errors.CopyMode import CopyMode
 from synqtab.errors.DataErrorApplicability import DataErrorApplicability
 from synqtab.reproducibility import ReproducibleOperations
 
@@ -122,13 +123,38 @@ class DataError(ABC):
         data: pd.DataFrame,
         categorical_columns: Optional[list[str]]=None,
         target_column: Optional[str]=None,
+        numeric_columns: Optional[list[str]]=None,
+        copy: bool | CopyMode=True,
         **kwargs
     )-> Tuple[pd.DataFrame, List, List]:
+        """Corrupts a fraction of the rows of `data` in a fraction of its applicable columns.
+
+        Args:
+            data (pd.DataFrame): the data to corrupt.
+            categorical_columns (list[str], optional): the categorical columns. Inferred from the dtypes if None.
+            target_column (str, optional): the target column. Defaults to None.
+            numeric_columns (list[str], optional): the numeric columns. Only taken into account together with
+            `categorical_columns`, in which case the column partition is used as is. Defaults to None.
+            copy (bool | CopyMode, optional): how to copy `data` before corrupting it. True copies it with the
+            `CORRUPTION_COPY_MODE` of the environment. With `CopyMode.TOUCHED_COLUMNS`, only the columns returned by
+            `columns_to_materialize()` are copied and the rest are shared with `data`, which is still not modified.
+            If False, `data` is corrupted in place, e.g., because the caller has copied it already. Defaults to True.
+
+        Returns:
+            Tuple[pd.DataFrame, List, List]: the corrupted data, the corrupted rows and the corrupted columns.
+        """
         
         # prepare for corruption
-        self.corrupted_data = data.copy(deep=True)
+        copy_mode = self._resolve_copy_mode(copy)
+        if copy_mode is None:
+            self.corrupted_data = data
+        else:
+            self.corrupted_data = data.copy(deep=copy_mode == CopyMode.DEEP)
         
-        if categorical_columns is not None:
+        if categorical_columns is not None and numeric_columns is not None:
+            self.categorical_columns = list(categorical_columns)
+            self.numeric_columns = list(numeric_columns)
+        elif categorical_columns is not None:
             self.set_numerical_categorical_columns(categorical_columns, target_column)
         else:
             self.infer_numerical_categorical_columns(**kwargs)
@@ -138,6 +164,11 @@ class DataError(ABC):
         
         # columns_to_corrupt == [] can happen if e.g., a categorical error must be applied but no categorical cols exist
         if len(self.columns_to_corrupt) > 0:
+            if copy_mode == CopyMode.TOUCHED_COLUMNS:
+                # the shallow copy shares its columns with `data`; replace the ones to corrupt with their own copies
+                for column in self.columns_to_materialize(target_column):
+                    self.corrupted_data[column] = self.corrupted_data[column].copy()
+
             # apply corruption; this is meant to be overriden for each specific data error type
             self.corrupted_data = self._apply_corruption(
                 data_to_corrupt=self.corrupted_data,
@@ -150,6 +181,19 @@ class DataError(ABC):
         # return tuple in a standardized way; single-point of change if needed
         return self.corruption_result_output_tuple(**kwargs)
 
+    def columns_to_materialize(self, target_column: Optional[str] = None) -> List:
+        """The columns that `_apply_corruption()` modifies, which are copied before corrupting in
+        `CopyMode.TOUCHED_COLUMNS`. Meant to be overriden by errors that do not modify `columns_to_corrupt`."""
+        return list(self.columns_to_corrupt)
+
+    @staticmethod
+    def _resolve_copy_mode(copy: bool | CopyMode) -> Optional[CopyMode]:
+        from synqtab.environment import CORRUPTION_COPY_MODE
+
+        if isinstance(copy, CopyMode):
+            return copy
+        return CopyMode(CORRUPTION_COPY_MODE) if copy else None
+
     @abstractmethod
     def _apply_corruption(
         self,
@@ -16,88 +16,108 @@ class Inconsistency(DataError):
     def full_name(self):
         return "Representational Inconsistencies"
 
-    def _apply_typo(self, categorical_value: str) -> str:
-        """Applies a typo to a string value. Randomly (yet reproducibly)
-        selects one of the following typo types:
+    _typo_types: int = 3 # extra letter, missing letter, swapped letters
+
+    def _apply_typos(self, categorical_values: list) -> list[str]:
+        """Applies a typo to each of the given values. Randomly (yet reproducibly) selects one of the following typo
+        types and the position of the typo for each value, with a single random draw for all values:
         - extra letter -> see _apply_typo_extra_letter;
         - missing letter -> see _apply_typo_missing_letter;
         - swapped letter -> see _apply_typo_swapped_letter.
 
+        Args:
+            categorical_values (list): the values to apply typos on
+
+        Returns:
+            list[str]: the values with the typos, in the same order
+        """
+        from synqtab.reproducibility import ReproducibleOperations
+
+        if len(categorical_values) == 0:
+            return []
+
+        draws = ReproducibleOperations.uniform(low=0, high=1, size=(len(categorical_values), 2))
+        typo_types = (draws[:, 0] * self._typo_types).astype(int)
+        return [
+            self._apply_typo(str(categorical_value), typo_type, position_draw)
+            for categorical_value, typo_type, position_draw in zip(categorical_values, typo_types, draws[:, 1])
+        ]
+
+    def _apply_typo(self, categorical_value: str, typo_type: int, position_draw: float) -> str:
+        """Applies a typo of the given type to a string value, at the position that corresponds to `position_draw`.
+
         Args:
             categorical_value (str): the value to apply typo on
+            typo_type (int): 0 for an extra letter, 1 for a missing letter and 2 for swapped letters. Values with a
+            single letter cannot have their letters swapped, so they get an extra letter instead.
+            position_draw (float): a random number in [0, 1) that selects the position of the typo
 
         Returns:
             str: the value with the typo
         """
-        from synqtab.reproducibility import ReproducibleOperations
-        
-        return ReproducibleOperations.sample_from(
-            elements=[
-                self._apply_typo_extra_letter,
-                self._apply_typo_missing_letter,
-                self._apply_typo_swapped_letter,
-            ],
-            how_many=1,
-        )[0](categorical_value)
-
-    def _apply_typo_extra_letter(self, categorical_value: str) -> str:
+        if len(categorical_value) == 0:
+            return categorical_value
+        if typo_type == 2 and len(categorical_value) < 2:
+            typo_type = 0
+
+        match typo_type:
+            case 0:
+                return self._apply_typo_extra_letter(
+                    categorical_value, int(position_draw * len(categorical_value))
+                )
+            case 1:
+                return self._apply_typo_missing_letter(
+                    categorical_value, int(position_draw * len(categorical_value))
+                )
+            case _:
+                return self._apply_typo_swapped_letter(
+                    categorical_value, int(position_draw * (len(categorical_value) - 1))
+                )
+
+    def _apply_typo_extra_letter(self, categorical_value: str, extra_letter_index: int) -> str:
         """Applies a typo to a string value by adding an extra letter
         right after its occurrence, e.g., pollution -> poolution.
 
         Args:
             categorical_value (str): the value to applly the typo on
+            extra_letter_index (int): the position of the letter to repeat
 
         Returns:
             str: the value with the typo
         """
-        from synqtab.reproducibility import ReproducibleOperations
-        
-        categorical_value = str(categorical_value)
-        
-        extra_letter_index = ReproducibleOperations.sample_from(
-            elements=range(len(categorical_value)), how_many=1
-        )[0]
         return (
             categorical_value[:extra_letter_index]
             + 2 * categorical_value[extra_letter_index]
             + categorical_value[extra_letter_index + 1 :]
         )
 
-    def _apply_typo_missing_letter(self, categorical_value: str) -> str:
+    def _apply_typo_missing_letter(self, categorical_value: str, missing_char_index: int) -> str:
         """Applies a typo to a string value by removing a letter,
         e.g., pollution -> polution.
 
         Args:
             categorical_value (str): the value to apply the typo on
+            missing_char_index (int): the position of the letter to remove
 
         Returns:
             str: the value with the typo
         """
-        from synqtab.reproducibility import ReproducibleOperations
-        
-        missing_char_index = ReproducibleOperations.sample_from(
-            elements=range(len(categorical_value)), how_many=1
-        )[0]
         return (
             categorical_value[:missing_char_index]
             + categorical_value[missing_char_index + 1 :]
         )
 
-    def _apply_typo_swapped_letter(self, categorical_value: str) -> str:
+    def _apply_typo_swapped_letter(self, categorical_value: str, left_swapped_char_index: int) -> str:
         """Applies a typo to a string value by swapping two neighboring
         letters, e.g., pollution -> pollutoin
 
         Args:
             categorical_value (str): the value to apply the typo on
+            left_swapped_char_index (int): the position of the left one of the two letters to swap
 
         Returns:
             str: the value with the typo
         """
-        from synqtab.reproducibility import ReproducibleOperations
-        
-        left_swapped_char_index = ReproducibleOperations.sample_from(
-            elements=range(len(categorical_value) - 1), how_many=1
-        )[0]
         right_swapped_char_index = left_swapped_char_index + 1
         return (
             categorical_value[:left_swapped_char_index]
@@ -109,7 +129,10 @@ class Inconsistency(DataError):
     def _apply_corruption_to_categorical_column(
         self, data_to_corrupt, rows_to_corrupt, categorical_column_to_corrupt, **kwargs
     ):
-        """Applies corruption (typos) to a categorical column.
+        """Applies corruption (typos) to a categorical column. Works on the category codes: a typo variation is
+        created once for every category that occurs in the rows to corrupt, the variations are appended to the
+        categories, and the codes of the rows to corrupt are pointed to them. The column never leaves the
+        categorical dtype and the codes of all other rows stay as they are.
 
         Args:
             data_to_corrupt (pd.DataFrame): the data to corrupt
@@ -119,22 +142,34 @@ class Inconsistency(DataError):
         Returns:
             pd.DataFrame: the `data_to_corrupt`, after applying the corurption on top of it
         """
-        distinct_values = data_to_corrupt[categorical_column_to_corrupt].value_counts().index
-        
-        # transform the column to 'object' type to avoid pd issues with categorical
-        data_to_corrupt[categorical_column_to_corrupt] = data_to_corrupt[categorical_column_to_corrupt].astype('object')
-        
-        # get the distinct values, create a typo variation of each and corrupt the selected rows
-        distinct_values_with_typos = [
-            self._apply_typo(distinct_value) for distinct_value in distinct_values
-        ]
-        replacement_values = data_to_corrupt.loc[
-            rows_to_corrupt, categorical_column_to_corrupt
-        ].replace(distinct_values, distinct_values_with_typos)
-        data_to_corrupt.loc[rows_to_corrupt, categorical_column_to_corrupt] = replacement_values
-        
-        # make the column categorical again once the corruption is finished
-        data_to_corrupt[categorical_column_to_corrupt] = data_to_corrupt[categorical_column_to_corrupt].astype('category')
+        import numpy as np
+        import pandas as pd
+
+        column = data_to_corrupt[categorical_column_to_corrupt]
+        if not isinstance(column.dtype, pd.CategoricalDtype):
+            column = column.astype('category')
+
+        categories = column.cat.categories
+        codes = column.cat.codes.to_numpy().astype(np.int64) # typos may outgrow the narrow dtype of the codes
+        positions_to_corrupt = data_to_corrupt.index.get_indexer(rows_to_corrupt)
+
+        # missing values (code -1) are left untouched
+        codes_to_corrupt = np.unique(codes[positions_to_corrupt])
+        codes_to_corrupt = codes_to_corrupt[codes_to_corrupt >= 0]
+
+        # get the categories that occur in the selected rows and create a typo variation of each
+        categories_with_typos = pd.Index(self._apply_typos(categories[codes_to_corrupt].tolist()), dtype=object)
+        new_categories = categories.astype(object).append(categories_with_typos).unique()
+
+        # a typo may coincide with an existing category or with another typo; both then share the same category
+        code_with_typo = np.arange(len(categories))
+        code_with_typo[codes_to_corrupt] = new_categories.get_indexer(categories_with_typos)
+        corrupted_codes = codes[positions_to_corrupt]
+        codes[positions_to_corrupt] = np.where(corrupted_codes >= 0, code_with_typo[corrupted_codes], corrupted_codes)
+
+        data_to_corrupt[categorical_column_to_corrupt] = pd.Categorical.from_codes(
+            codes, categories=new_categories, ordered=column.cat.ordered
+        )
         return data_to_corrupt
 
     def _apply_corruption(self, data_to_corrupt, rows_to_corrupt, columns_to_corrupt, **kwargs):
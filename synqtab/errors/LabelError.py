@@ -17,6 +17,9 @@ class LabelError(CategoricalShift):
     def full_name(self):
         return "Label error"
 
+    def columns_to_materialize(self, target_column=None):
+        return [target_column]
+
     def _apply_corruption(self, data_to_corrupt, rows_to_corrupt, columns_to_corrupt, **kwargs):
         from synqtab.enums.data import Metadata
         
@@ -1,4 +1,6 @@
 from .CategoricalShift import CategoricalShift
+from .CopyMode import CopyMode
+from .CorruptionPipeline import CorruptionPipeline
 from .DataError import DataError
 from .GaussianNoise import GaussianNoise
 from .Inconsistency import Inconsistency
@@ -11,6 +13,8 @@ from .DataErrorApplicability import DataErrorApplicability
 
 __all__ = [
     'CategoricalShift',
+    'CopyMode',
+    'CorruptionPipeline',
     'DataError',
     'GaussianNoise',
     'Inconsistency',
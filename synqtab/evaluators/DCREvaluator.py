@@ -8,24 +8,76 @@ class DCREvaluator(Evaluator):
         - [*required*] `'synthetic_data'`: the synthetic data generated by the generator
         - [*required*] `'metadata'`: sdmetrics metadata; See 
         https://docs.sdv.dev/sdmetrics/getting-started/metadata/single-table-metadata
+        - [*optional*] `'dcr_engine'`: `'native'` computes the metric with `synqtab.utils.dcr_utils`, `'sdmetrics'`
+        with sdmetrics itself. If absent, defaults to `DCR_ENGINE`.
         - [*optional*] `'notes'`: True/False on whether to include notes in the result or not.
         If absent, defaults to False.
+
+    The score is the median DCR of the synthetic data divided by the median DCR of random data within the domain of
+    the real data, capped at 1. The native engine computes the same distances as sdmetrics, but preprocesses the real
+    data once per dataset, computes the distances in bounded NumPy blocks on `DCR_THREADS` threads, optionally against
+    `DCR_REAL_SAMPLE_ROWS` real rows only, and draws the random baseline from the random seed of the experiment.
     """
     def compute_result(self):
-        from sdmetrics.single_table import DCRBaselineProtection
-        
-        score = DCRBaselineProtection.compute_breakdown(
-            real_training_data=self.params.get('real_training_data'),
-            synthetic_data=self.params.get('synthetic_data'),
-            metadata=self.params.get('metadata'),
-        )
+        from synqtab.environment import DCR_ENGINE
+
+        dcr_engine = self.params.get('dcr_engine', DCR_ENGINE)
+        match dcr_engine:
+            case 'native':
+                score = self._compute_breakdown_natively()
+            case 'sdmetrics':
+                from sdmetrics.single_table import DCRBaselineProtection
+
+                score = DCRBaselineProtection.compute_breakdown(
+                    real_data=self.params.get('real_training_data'),
+                    synthetic_data=self.params.get('synthetic_data'),
+                    metadata=self.params.get('metadata'),
+                )
+            case _:
+                raise ValueError(f"Unknown DCR engine {dcr_engine}. Valid options: ['native', 'sdmetrics'].")
+
         if self.params.get('notes', False):
             return score.get('score'), score.get('median_DCR_to_real_data')
         return score.get('score')
-    
+
+    def _compute_breakdown_natively(self) -> dict:
+        import numpy as np
+        from synqtab.environment import DCR_BLOCK_BYTES, DCR_REAL_SAMPLE_ROWS, DCR_THREADS
+        from synqtab.reproducibility import ReproducibleOperations
+        from synqtab.utils.dcr_utils import DCRReference, generate_random_baseline
+
+        real_data = self.params.get('real_training_data')
+        synthetic_data = self.params.get('synthetic_data')
+        reference = DCRReference.of(real_data, self.params.get('metadata'))
+
+        reference_rows = None
+        if 0 < DCR_REAL_SAMPLE_ROWS < len(real_data):
+            reference_rows = np.sort(
+                ReproducibleOperations.get_generator('dcr-real-sample').choice(
+                    len(real_data), size=DCR_REAL_SAMPLE_ROWS, replace=False
+                )
+            )
+        random_data = generate_random_baseline(
+            real_data, len(synthetic_data), ReproducibleOperations.get_generator('dcr-random-baseline')
+        )
+
+        synthetic_median, random_median = (
+            float(np.median(reference.distances(
+                data, block_bytes=DCR_BLOCK_BYTES, threads=DCR_THREADS, reference_rows=reference_rows
+            )))
+            for data in (synthetic_data, random_data)
+        )
+        return {
+            'score': min(synthetic_median / random_median, 1.0) if random_median != 0.0 else np.nan,
+            'median_DCR_to_real_data': {
+                'synthetic_data': synthetic_median,
+                'random_data_baseline': random_median,
+            },
+        }
+
     def short_name(self):
         from synqtab.enums import EvaluationMethod
         return str(EvaluationMethod.DCR)
-    
+
     def full_name(self):
         return "Distance from Closest Record Evaluator"
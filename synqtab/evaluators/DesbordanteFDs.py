@@ -11,38 +11,80 @@ class DesbordanteFDs(Evaluator):
         - [*required*] `'data'`: the data to perform FD discovery on
         - [*optional*] `'notes'`: True/False on whether to include notes in the result or not.
         If absent, defaults to False.
+
+    The data are dictionary-encoded once (see `encode_as_dictionary_codes()`) and the algorithm is picked by the
+    shape of the data (see `choose_algorithm()`). With `DESBORDANTE_FD_SAMPLE_ROWS`, the FDs are discovered on a
+    row sample and only the ones that hold on all rows are kept: those are exact and minimal, but an FD of the full
+    data is missed if a smaller one held on the sample only, so the count is a lower bound. With
+    `DESBORDANTE_FD_TIMEOUT_SECONDS`, the discovery runs in a separate process and the evaluation fails if it does
+    not finish in time.
     """
-    
+
     def short_name(self):
         from synqtab.enums import EvaluationMethod
         return str(EvaluationMethod.DFD)
-    
+
     def full_name(self):
         return "Desbordante Functional Dependencies Discovery"
-    
+
+    @staticmethod
+    def choose_algorithm(n_rows: int, n_columns: int) -> str:
+        """Picks the discovery algorithm for data of the given shape, unless `DESBORDANTE_FD_ALGORITHM` names one.
+        Pyro (Desbordante's default) handles the usual, row-heavy tables well, but its lattice search blows up with
+        the number of columns. On wide tables, FDep compares all pairs of rows and is thus the fastest when there are
+        few rows; HyFD combines row sampling with a lattice search and scales with both.
+        """
+        from synqtab.environment import DESBORDANTE_FD_ALGORITHM, DESBORDANTE_FD_FEW_ROWS, DESBORDANTE_FD_WIDE_COLUMNS
+        from synqtab.utils.fd_utils import FD_ALGORITHMS
+
+        if DESBORDANTE_FD_ALGORITHM != 'auto':
+            if DESBORDANTE_FD_ALGORITHM not in FD_ALGORITHMS:
+                raise ValueError(
+                    f"Unknown FD discovery algorithm {DESBORDANTE_FD_ALGORITHM}. Choose one of {list(FD_ALGORITHMS)}."
+                )
+            return DESBORDANTE_FD_ALGORITHM
+        if n_columns <= DESBORDANTE_FD_WIDE_COLUMNS:
+            return 'pyro'
+        if n_rows <= DESBORDANTE_FD_FEW_ROWS:
+            return 'fdep'
+        return 'hyfd'
+
     def compute_result(self):
         import os
-        import desbordante as db
-        
+        from synqtab.environment import DESBORDANTE_FD_SAMPLE_ROWS, DESBORDANTE_FD_THREADS, DESBORDANTE_FD_TIMEOUT_SECONDS
+        from synqtab.utils.fd_utils import (
+            discover_fds, discover_fds_with_timeout, encode_as_dictionary_codes, fd_holds
+        )
+
         try:
             data = self.params.get('data')
-            if len(data.columns) > 100:
-                return None
+            codes = encode_as_dictionary_codes(data)
 
-            # Load data from pandas DataFrame
-            pyro_alg = db.fd.algorithms.Default()
-            pyro_alg.load_data(table=data)
+            is_sampled = 0 < DESBORDANTE_FD_SAMPLE_ROWS < len(codes)
+            discovery_codes = codes
+            if is_sampled:
+                # a fixed sample, so that the result only depends on the data
+                discovery_codes = codes.sample(n=DESBORDANTE_FD_SAMPLE_ROWS, random_state=0).reset_index(drop=True)
 
-            LOG.info("Data loaded into FD discovery algorithm.")
-
-            pyro_alg.execute()
-            LOG.info("Executed FD discovery algorithm.")
+            algorithm_name = self.choose_algorithm(*discovery_codes.shape)
+            if DESBORDANTE_FD_TIMEOUT_SECONDS > 0:
+                discovered_fds = discover_fds_with_timeout(
+                    discovery_codes, algorithm_name, DESBORDANTE_FD_THREADS, DESBORDANTE_FD_TIMEOUT_SECONDS
+                )
+            else:
+                discovered_fds = discover_fds(discovery_codes, algorithm_name, DESBORDANTE_FD_THREADS)
 
             # Collect functional dependencies
-            fds = [str(fd) for fd in pyro_alg.get_fds()]
-            
+            fds = [
+                fd_string for lhs_indices, rhs_index, fd_string in discovered_fds
+                if not is_sampled or fd_holds(codes, list(codes.columns[lhs_indices]), codes.columns[rhs_index])
+            ]
+
             if self.params.get('notes', False):
-                return len(fds), {'FDs': fds}
+                notes = {'FDs': fds}
+                if is_sampled:
+                    notes['sample_rows'] = DESBORDANTE_FD_SAMPLE_ROWS
+                return len(fds), notes
             return len(fds)
 
         finally:
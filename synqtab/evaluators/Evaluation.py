@@ -1,4 +1,4 @@
-from typing import Any, Dict, Optional, Self
+from typing import TYPE_CHECKING, Any, Dict, Optional, Self
 
 from synqtab.data.Dataset import Dataset
 from synqtab.enums import (
@@ -9,6 +9,9 @@ from synqtab.experiments.Experiment import Experiment
 from synqtab.evaluators.Evaluator import Evaluator
 from synqtab.utils import get_logger
 
+if TYPE_CHECKING:
+    from synqtab.evaluators.EvaluationContext import EvaluationContext
+
 
 LOG = get_logger(__file__)
 
@@ -24,7 +27,17 @@ class Evaluation():
         experiment: Experiment,
         evaluation_method: EvaluationMethod,
         params: Optional[Dict[str, Any]] = None,
+        context: Optional['EvaluationContext'] = None,
+        should_compute: Optional[bool] = None,
     ):
+        """
+        Args:
+            context (EvaluationContext, optional): the data shared among the evaluations of `experiment`. Pass the same
+                context to all evaluations of an experiment to compute the real split, the corruption and the
+                downloads only once. If None, the evaluation creates its own context when it runs.
+            should_compute (bool, optional): Whether the evaluation still has to be computed, if the caller already
+                knows it, e.g., from a bulk `PostgresClient.existing_ids()` pre-check. If None, Postgres is queried.
+        """
         from synqtab.mappings import EVALUATION_METHOD_TO_EVALUATION_CLASS
         
         self.evaluation_targets = evaluation_targets
@@ -32,96 +45,40 @@ class Evaluation():
         self.evaluation_method = evaluation_method
         self.evaluator = EVALUATION_METHOD_TO_EVALUATION_CLASS.get(self.evaluation_method)(params=params)
         self.params = params if params is not None else dict()
+        self.context = context
+        self.was_skipped: bool = False
         
-        self._should_compute = (not self._exists_in_postgres())
+        self._should_compute = should_compute if should_compute is not None else (not self._exists_in_postgres())
     
     def _run(self):
-        from synqtab.data import PostgresClient, MinioClient
-        from synqtab.enums import ProblemType, DataPerfectness, EvaluationInput, EvaluationTarget, MinioBucket, EvaluationOutput
+        from synqtab.data import PostgresClient
+        from synqtab.enums import EvaluationInput, EvaluationOutput
+        from synqtab.evaluators.EvaluationContext import EvaluationContext
         from synqtab.mappings.mappings import EVALUATION_METHOD_TO_EVALUATION_CLASS
-        from synqtab.reproducibility import ReproducibleOperations
         from synqtab.utils import timed_computation
         
         evaluation_full_name = str(self) + '/' + str(self.experiment)
         LOG.info(f"Entering the _run() function of Evaluation {evaluation_full_name}")
         
-        real_perfect_df = self.experiment.dataset._fetch_real_perfect_dataframe()
-        target_column_name = self.experiment.dataset.target_feature
-        target = real_perfect_df[target_column_name]
-        problem_type = ProblemType(self.experiment.dataset.problem_type)
-        sdmetrics_metadata = self.experiment.dataset.get_sdmetrics_single_table_metadata()
-        training_df, validation_df = ReproducibleOperations.train_test_split(
-            real_perfect_df, test_size=0.5, stratify=target, problem_type=problem_type)
-        
-        # use the class with the least frequency as minority class. If it is a regression problem, this
-        # EvaluationInput key is not used downstream. So, this implementation targets only classification datasets.
-        minority_class = validation_df[target_column_name].value_counts(sort=True, ascending=True).index[0]
-        
-        evaluation_target_dfs = []
-        for evaluation_target in self.evaluation_targets:
-            data = None
-            match evaluation_target:
-                case EvaluationTarget.R:
-                    LOG.info("Getting perfect R data from dataset + train test split")
-                    data = training_df
-
-                case EvaluationTarget.RH:
-                    if self.experiment.data_perfectness == DataPerfectness.PERFECT:
-                        raise ValueError(f"Cannot create real corrupted data from a perfect experiment object.")
-                    
-                    LOG.info("Getting imperfect data as perfect + corruption")
-                    data_error_instance = self.experiment.data_error.get_class()(row_fraction=self.experiment.data_error_rate)
-                    data, corrupted_rows, corrupted_cols = data_error_instance.corrupt(
-                        data=training_df,
-                        categorical_columns=self.experiment.dataset.categorcal_features,
-                        target_column=self.experiment.dataset.target_feature,
-                    )
-                    if self.experiment.data_perfectness == DataPerfectness.SEMIPERFECT:
-                        data.drop(corrupted_rows)
-
-                case EvaluationTarget.S:
-                    perfect_counterpart_experiment = self.experiment.perfect_counterpart()
-                    LOG.info("Getting S data from Synthetic bucket " + perfect_counterpart_experiment.minio_path())
-                    data = MinioClient.read_parquet_from_bucket(
-                        bucket_name=MinioBucket.SYNTHETIC,
-                        object_name=perfect_counterpart_experiment.minio_path(),
-                    )
-
-                case EvaluationTarget.SH:
-                    data = MinioClient.read_parquet_from_bucket(
-                        bucket_name=MinioBucket.SYNTHETIC,
-                        object_name=self.experiment.minio_path(),
-                    )
-                    
-                case _ as not_implemented_evaluation_target:
-                    raise NotImplementedError(
-                        f"Unknown evaluation target type. Got {not_implemented_evaluation_target}. " +
-                        f"Valid options: {[str(option) for option in EvaluationTarget]}."
-                    )
-            
-            for column in data.columns:
-                if column in self.experiment.dataset.categorcal_features:
-                    data[column] = data[column].astype('category')
-                    
-            for column in validation_df:
-                if column in self.experiment.dataset.categorcal_features:
-                    validation_df[column] = validation_df[column].astype('category')
-            
-            evaluation_target_dfs.append(data)
+        context = self.context if self.context is not None else EvaluationContext(self.experiment)
+        evaluation_target_dfs = [
+            context.get_evaluation_target_df(evaluation_target)
+            for evaluation_target in self.evaluation_targets
+        ]
         
-                  
         params = {
-            str(EvaluationInput.PROBLEM_TYPE): str(problem_type),
-            str(EvaluationInput.METADATA): sdmetrics_metadata,
-            str(EvaluationInput.REAL_VALIDATION_DATA): validation_df,
+            str(EvaluationInput.PROBLEM_TYPE): str(context.problem_type),
+            str(EvaluationInput.METADATA): context.sdmetrics_metadata,
+            str(EvaluationInput.REAL_VALIDATION_DATA): context.validation_df.copy(),
             str(EvaluationInput.NOTES): True,
-            str(EvaluationInput.PREDICTION_COLUMN_NAME): target_column_name,
-            str(EvaluationInput.KNOWN_COLUMN_NAMES): self.params.get(str(EvaluationInput.KNOWN_COLUMN_NAMES), list(training_df.columns)),
+            str(EvaluationInput.PREDICTION_COLUMN_NAME): context.target_column_name,
+            str(EvaluationInput.KNOWN_COLUMN_NAMES): self.params.get(str(EvaluationInput.KNOWN_COLUMN_NAMES), list(context.training_df.columns)),
             str(EvaluationInput.SENSITIVE_COLUMN_NAMES): self.params.get(str(EvaluationInput.SENSITIVE_COLUMN_NAMES), []),
             str(EvaluationInput.REAL_TRAINING_DATA): evaluation_target_dfs[0], # used by dual evaluators
             str(EvaluationInput.DATA): evaluation_target_dfs[0],               # used by singular evaluators
             str(EvaluationInput.SYNTHETIC_DATA): evaluation_target_dfs[1] if len(evaluation_target_dfs) > 1 else None,
-            str(EvaluationInput.MINORITY_CLASS_LABEL): minority_class,
+            str(EvaluationInput.MINORITY_CLASS_LABEL): context.minority_class,
+            str(EvaluationInput.FEATURE_ENCODER): context.outlier_feature_encoder, # used by the outlier evaluators
         }
         
         evaluator_instance = EVALUATION_METHOD_TO_EVALUATION_CLASS.get(self.evaluation_method)(params)
@@ -170,18 +127,34 @@ class Evaluation():
         )
         return True
     
-    # IMPORTANT: Keep this method aligned with the from_str_and_experiment() method!
     def _get_evaluation_id_parts(self):
-        from synqtab.reproducibility.ReproducibleOperations import ReproducibleOperations
+        return self._compose_evaluation_id_parts(self.evaluation_method, *self.evaluation_targets)
+    
+    # IMPORTANT: Keep this method aligned with the from_str_and_experiment() method!
+    @classmethod
+    def _compose_evaluation_id_parts(
+        cls, evaluation_method: EvaluationMethod, *evaluation_targets: EvaluationTarget
+    ) -> list[str]:
         return [
-            str(self.evaluation_method), # Evaluator short name, e.g., 'IFO' for Isolation Forest Evaluator
-            str(self.evaluation_targets[0]), # Type of the first evaluation target, e.g, 'R' for real data, or 'SH' for imperfect synthetic
-            str(self.evaluation_targets[1]) if len(self.evaluation_targets) > 1 else self._NULL, # Type of the second evaluation target if it exists, else standardized NULL placeholder
+            str(evaluation_method), # Evaluator short name, e.g., 'IFO' for Isolation Forest Evaluator
+            str(evaluation_targets[0]), # Type of the first evaluation target, e.g, 'R' for real data, or 'SH' for imperfect synthetic
+            str(evaluation_targets[1]) if len(evaluation_targets) > 1 else cls._NULL, # Type of the second evaluation target if it exists, else standardized NULL placeholder
         ]
     
+    @classmethod
+    def compose_id(cls, evaluation_method: EvaluationMethod, *evaluation_targets: EvaluationTarget) -> str:
+        """Returns the id that an evaluation with the given method and targets would have, without building it."""
+        return cls._delimiter.join(cls._compose_evaluation_id_parts(evaluation_method, *evaluation_targets))
+    
     # IMPORTANT: Keep this method aligned with the _get_evaluation_id_parts() method!
     @classmethod
-    def from_str_and_experiment(cls, evaluation_id: str, experiment: Experiment) -> Self:
+    def from_str_and_experiment(
+        cls,
+        evaluation_id: str,
+        experiment: Experiment,
+        params: Optional[Dict[str, Any]] = None,
+        context: Optional['EvaluationContext'] = None,
+    ) -> Self:
                 
         evaluation_id_parts = evaluation_id.split(cls._delimiter)
         evaluator_shortname = evaluation_id_parts[0]
@@ -194,6 +167,8 @@ class Evaluation():
             *evaluation_targets,
             evaluation_method=EvaluationMethod(evaluator_shortname),
             experiment=experiment,
+            params=params,
+            context=context,
         )
     
     def __str__(self):
@@ -208,6 +183,7 @@ class Evaluation():
             PostgresClient.write_skipped_computation(
                 computation_id=str(self) + '/' + str(self.experiment),
                 reason=f"Already exists in Postgres.")
+            self.was_skipped = True
             return self
         
         # Skip evaluation if it is the perfect baseline of a non-perfect experiment
@@ -229,6 +205,7 @@ class Evaluation():
                 PostgresClient.write_skipped_computation(
                     computation_id=str(self) + '/' + str(self.experiment),
                     reason=f"The perfect baseline is only computed for error rate: {first_data_error_rate}.")
+                self.was_skipped = True
                 return self
         
         self._run()
@@ -0,0 +1,167 @@
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Self
+
+from synqtab.enums import EvaluationMethod, EvaluationTarget
+from synqtab.evaluators.Evaluation import Evaluation
+from synqtab.experiments.Experiment import Experiment
+from synqtab.utils import get_logger
+
+if TYPE_CHECKING:
+    from synqtab.evaluators.EvaluationContext import EvaluationContext
+
+
+LOG = get_logger(__file__)
+
+
+class EvaluationBatch():
+    """The evaluations of an experiment with different evaluation methods on the same evaluation targets, e.g., all
+    singular evaluators on R, published and run as a single task. The evaluations share an `EvaluationContext`, so
+    the data of the targets are loaded once, and each of them is still run, skipped and written to Postgres on its
+    own, exactly like a stand-alone `Evaluation`. An evaluation that fails does not stop the ones after it.
+    """
+
+    _batch_prefix: str = 'BATCH'
+
+    def __init__(
+        self,
+        *evaluation_targets: EvaluationTarget,
+        experiment: Experiment,
+        evaluation_methods: list[EvaluationMethod],
+        params: Optional[Dict[str, Any]] = None,
+        context: Optional['EvaluationContext'] = None,
+        existing_evaluation_ids: Optional[set[str]] = None,
+    ):
+        """
+        Args:
+            evaluation_methods (list[EvaluationMethod]): the evaluation methods to run on the evaluation targets.
+            context (EvaluationContext, optional): the data shared among the evaluations. If None, a new context is
+                created for the batch.
+            existing_evaluation_ids (set[str], optional): the ids of the evaluations of the experiment that already
+                exist in Postgres, if the caller already knows them. If None, Postgres is queried once for the batch.
+        """
+        from synqtab.data import PostgresClient
+        from synqtab.evaluators.EvaluationContext import EvaluationContext
+
+        self.evaluation_targets = evaluation_targets
+        self.experiment = experiment
+        self.params = params if params is not None else dict()
+        self.context = context if context is not None else EvaluationContext(experiment)
+
+        if existing_evaluation_ids is None:
+            # one round trip for the whole batch, instead of one per evaluation
+            existing_evaluation_ids = PostgresClient.existing_ids(
+                [Evaluation.compose_id(evaluation_method, *evaluation_targets) for evaluation_method in evaluation_methods],
+                id_columns_by_table={'evaluations': 'evaluation_id'},
+                filters={'experiment_id': str(experiment)},
+            )
+        self.evaluations = [
+            Evaluation(
+                *evaluation_targets,
+                experiment=experiment,
+                evaluation_method=evaluation_method,
+                params=self.params,
+                context=self.context,
+                should_compute=Evaluation.compose_id(evaluation_method, *evaluation_targets) not in existing_evaluation_ids,
+            )
+            for evaluation_method in evaluation_methods
+        ]
+        self.ran_evaluations: list[Evaluation] = [] # the evaluations that the last run() got to, failed ones included
+        self.failed_evaluations: list[Evaluation] = []
+        self.lease_lost: bool = False
+
+    @classmethod
+    def from_ids_and_experiment(
+        cls,
+        evaluation_ids: list[str],
+        experiment: Experiment,
+        params: Optional[Dict[str, Any]] = None,
+        context: Optional['EvaluationContext'] = None,
+    ) -> Self:
+        """Recreates a batch from the evaluation ids of its task, see `publish_task_if_valid()`."""
+        # IMPORTANT: Keep this parsing aligned with Evaluation.from_str_and_experiment()!
+        evaluation_methods, evaluation_targets = [], None
+        for evaluation_id in evaluation_ids:
+            evaluation_id_parts = evaluation_id.split(Evaluation._delimiter)
+            targets = tuple(
+                EvaluationTarget(part) for part in evaluation_id_parts[1:] if part != Evaluation._NULL
+            )
+            if evaluation_targets is not None and targets != evaluation_targets:
+                raise ValueError(f"The evaluations of a batch must share their targets. Got {evaluation_ids}.")
+            evaluation_targets = targets
+            evaluation_methods.append(EvaluationMethod(evaluation_id_parts[0]))
+
+        return cls(
+            *evaluation_targets,
+            experiment=experiment,
+            evaluation_methods=evaluation_methods,
+            params=params,
+            context=context,
+        )
+
+    def __str__(self):
+        return Evaluation._delimiter.join(
+            Evaluation._compose_evaluation_id_parts(self._batch_prefix, *self.evaluation_targets)
+        )
+
+    def publish_task_if_valid(self) -> int:
+        """Publishes a single task for the valid evaluations of the batch, e.g., without R2 on classification data.
+
+        Returns:
+            int: the number of evaluations that the published task covers; 0 if no task was published.
+        """
+        from synqtab.data import MinioClient
+        from synqtab.enums import MinioBucket, MinioFolder
+
+        valid_evaluations = [evaluation for evaluation in self.evaluations if evaluation._is_valid()]
+        if not valid_evaluations:
+            return 0
+
+        task_dict = {
+            'evaluation_ids': [str(evaluation) for evaluation in valid_evaluations],
+            'experiment_id': str(self.experiment),
+            'params': self.params,
+        }
+        MinioClient.upload_json_to_bucket(
+            data=task_dict,
+            bucket_name=MinioBucket.TASKS,
+            file_name=MinioFolder.create_prefix(str(self.experiment), str(self)),
+            folder=None # we handle folders in the file name for consistency
+        )
+        return len(valid_evaluations)
+
+    @property
+    def was_skipped(self) -> bool:
+        """Whether all evaluations that ran were skipped. Only meaningful after a `run()` that kept its lease."""
+        return bool(self.ran_evaluations) and all(evaluation.was_skipped for evaluation in self.ran_evaluations)
+
+    def run(self, force: bool = False, renew_lease: Optional[Callable[[], bool]] = None) -> Self:
+        """Runs the evaluations one after the other.
+
+        Args:
+            force (bool, optional): whether to also compute the evaluations that exist in Postgres. Defaults to False.
+            renew_lease (Callable[[], bool], optional): called between the evaluations to renew the lease of the task,
+            e.g., `TaskLease.renew`. If it returns False, the lease was taken over, `lease_lost` is set and the
+            remaining evaluations are left to the worker that holds it now. Defaults to None.
+        """
+        from synqtab.tasks.TaskWorker import TaskWorker
+
+        self.ran_evaluations, self.failed_evaluations, self.lease_lost = [], [], False
+        for position, evaluation in enumerate(self.evaluations):
+            if position > 0 and renew_lease is not None and not renew_lease():
+                LOG.warning(
+                    f"Batch {str(self)}/{str(self.experiment)} lost its lease. It stops before {str(evaluation)}.",
+                    extra={'experiment_id': str(self.experiment)}
+                )
+                self.lease_lost = True
+                break
+            self.ran_evaluations.append(evaluation)
+            try:
+                evaluation.run(force=force)
+            except Exception as e:
+                if TaskWorker.is_infrastructure_error(e):
+                    raise # the whole task is retried; the finished evaluations are skipped then
+                LOG.error(
+                    f"Evaluation {str(evaluation)}/{str(self.experiment)} of batch {str(self)} failed. Error: {e}",
+                    extra={'experiment_id': str(self.experiment)}
+                )
+                self.failed_evaluations.append(evaluation)
+        return self
@@ -0,0 +1,145 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+import pandas as pd
+
+from synqtab.enums import DataPerfectness, EvaluationTarget, ProblemType
+from synqtab.experiments.Experiment import Experiment
+from synqtab.utils import get_logger
+
+if TYPE_CHECKING:
+    from synqtab.utils.outlier_utils import OneHotFeatureEncoder
+
+
+LOG = get_logger(__file__)
+
+
+class EvaluationContext():
+    """Everything that the evaluations of the same experiment need and that is identical among them: the real data and
+    its training/validation split, the sdmetrics metadata, the corrupted real data (RH) and the synthetic data (S, SH).
+    Each of them is computed (or downloaded) at most once, the first time an evaluation asks for it, and is then
+    shared by all evaluations that were given the same context.
+
+    The evaluation target data are handed out as copies, so that an evaluator cannot affect the evaluations that run
+    after it. The random seed of the experiment must be set before the context is first used, exactly as it would
+    for a stand-alone evaluation.
+    """
+
+    def __init__(self, experiment: Experiment):
+        self.experiment = experiment
+        self._evaluation_target_dfs: dict[EvaluationTarget, pd.DataFrame] = dict()
+
+    @cached_property
+    def real_perfect_df(self) -> pd.DataFrame:
+        return self.experiment.dataset._fetch_real_perfect_dataframe()
+
+    @cached_property
+    def problem_type(self) -> ProblemType:
+        return ProblemType(self.experiment.dataset.problem_type)
+
+    @cached_property
+    def target_column_name(self) -> str:
+        return self.experiment.dataset.target_feature
+
+    @cached_property
+    def sdmetrics_metadata(self) -> dict[str, Any]:
+        return self.experiment.dataset.get_sdmetrics_single_table_metadata(columns=self.real_perfect_df.columns)
+
+    @cached_property
+    def outlier_feature_encoder(self) -> 'OneHotFeatureEncoder':
+        """The one-hot encoder of the outlier evaluators, fitted (lazily) on the real data, with the categorical
+        columns typed as categories like in the evaluation target data."""
+        from synqtab.utils.outlier_utils import OneHotFeatureEncoder
+
+        schema_df = self.real_perfect_df.copy()
+        for column in schema_df.columns:
+            if column in self.experiment.dataset.categorcal_features:
+                schema_df[column] = schema_df[column].astype('category')
+        return OneHotFeatureEncoder(schema_df)
+
+    @cached_property
+    def _training_and_validation_dfs(self) -> tuple[pd.DataFrame, pd.DataFrame]:
+        from synqtab.reproducibility import ReproducibleOperations
+
+        training_df, validation_df = ReproducibleOperations.train_test_split(
+            self.real_perfect_df,
+            test_size=0.5,
+            stratify=self.real_perfect_df[self.target_column_name],
+            problem_type=self.problem_type,
+        )
+        for column in validation_df.columns:
+            if column in self.experiment.dataset.categorcal_features:
+                validation_df[column] = validation_df[column].astype('category')
+        return training_df, validation_df
+
+    @property
+    def training_df(self) -> pd.DataFrame:
+        return self._training_and_validation_dfs[0]
+
+    @property
+    def validation_df(self) -> pd.DataFrame:
+        return self._training_and_validation_dfs[1]
+
+    @cached_property
+    def minority_class(self) -> Any:
+        # use the class with the least frequency as minority class. If it is a regression problem, this
+        # EvaluationInput key is not used downstream. So, this implementation targets only classification datasets.
+        return self.validation_df[self.target_column_name].value_counts(sort=True, ascending=True).index[0]
+
+    def get_evaluation_target_df(self, evaluation_target: EvaluationTarget) -> pd.DataFrame:
+        """Returns a copy of the data of the given evaluation target, e.g., the synthetic data for EvaluationTarget.S
+
+        Args:
+            evaluation_target (EvaluationTarget): the evaluation target to get the data of.
+
+        Returns:
+            pd.DataFrame: the data of the evaluation target, with its categorical columns typed as categories.
+        """
+        if evaluation_target not in self._evaluation_target_dfs:
+            self._evaluation_target_dfs[evaluation_target] = self._load_evaluation_target_df(evaluation_target)
+        return self._evaluation_target_dfs[evaluation_target].copy()
+
+    def _load_evaluation_target_df(self, evaluation_target: EvaluationTarget) -> pd.DataFrame:
+        from synqtab.data import MinioClient
+        from synqtab.enums import MinioBucket
+
+        data = None
+        match evaluation_target:
+            case EvaluationTarget.R:
+                LOG.info("Getting perfect R data from dataset + train test split")
+                data = self.training_df.copy()
+
+            case EvaluationTarget.RH:
+                if self.experiment.data_perfectness == DataPerfectness.PERFECT:
+                    raise ValueError("Cannot create real corrupted data from a perfect experiment object.")
+
+                LOG.info("Getting imperfect data as perfect + corruption (or its stored artifact)")
+                data, corrupted_rows, corrupted_cols = self.experiment.corrupt_training_data(self.training_df)
+                if self.experiment.data_perfectness == DataPerfectness.SEMIPERFECT:
+                    data.drop(corrupted_rows)
+
+            case EvaluationTarget.S:
+                perfect_counterpart_experiment = self.experiment.perfect_counterpart()
+                LOG.info("Getting S data from Synthetic bucket " + perfect_counterpart_experiment.minio_path())
+                data = MinioClient.read_parquet_from_bucket(
+                    bucket_name=MinioBucket.SYNTHETIC,
+                    object_name=perfect_counterpart_experiment.minio_path(),
+                )
+
+            case EvaluationTarget.SH:
+                data = MinioClient.read_parquet_from_bucket(
+                    bucket_name=MinioBucket.SYNTHETIC,
+                    object_name=self.experiment.minio_path(),
+                )
+
+            case _ as not_implemented_evaluation_target:
+                raise NotImplementedError(
+                    f"Unknown evaluation target type. Got {not_implemented_evaluation_target}. " +
+                    f"Valid options: {[str(option) for option in EvaluationTarget]}."
+                )
+
+        for column in data.columns:
+            if column in self.experiment.dataset.categorcal_features:
+                data[column] = data[column].astype('category')
+
+        return data
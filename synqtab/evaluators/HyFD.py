@@ -23,42 +23,48 @@ class HyFD(Evaluator):
         return "HyFD Functional Dependencies Discovery"
     
     def compute_result(self):
+        import tempfile
         from synqtab.enums import EvaluationInput
+        from synqtab.utils.fd_utils import encode_as_dictionary_codes
         
         data = self.params.get('data') or self.params.get(EvaluationInput.DATA)
         
-        # Use absolute path for temp file in jars directory
-        temp_csv_path = _JARS_DIR / "temp_data.csv"
-        data.to_csv(temp_csv_path, index=False)
-        
-        try:
+        # Every evaluation writes its data and gets its results in a directory of its own, so that concurrent
+        # evaluations never read each other's results
+        with tempfile.TemporaryDirectory(prefix='hyfd-') as working_directory:
+            temp_csv_path = Path(working_directory) / "data.csv"
+            # the codes have the same FDs as the data and are much cheaper to write and for HyFD to parse
+            encode_as_dictionary_codes(data).to_csv(temp_csv_path, index=False)
+            
             # Run HyFD on the temporary CSV file
-            self.run_hyfd(data_path=str(temp_csv_path))
+            results_directory = self.run_hyfd(data_path=str(temp_csv_path), working_directory=working_directory)
 
             # Parse the results and return simplified JSON format
-            results = self.parse_hyfd_results()
+            results = self.parse_hyfd_results(results_directory)
 
-            notes_enabled = self.params.get('notes', False) or self.params.get(EvaluationInput.NOTES, False)
-            if notes_enabled:
-                return results["num_fds"], {'FDs': results['fds']}
-            return results["num_fds"]
-            
-        finally:
-            # Clean up the temporary CSV file
-            temp_csv_path.unlink(missing_ok=True)
+        notes_enabled = self.params.get('notes', False) or self.params.get(EvaluationInput.NOTES, False)
+        if notes_enabled:
+            return results["num_fds"], {'FDs': results['fds']}
+        return results["num_fds"]
+
+    def run_hyfd(self, data_path: str, working_directory: str) -> Path:
+        """Runs HyFD on the given CSV file. With `HYFD_BACKEND=jvm`, HyFD runs in a JVM that is kept alive across
+        evaluations (see `HyFDJvm`); otherwise, or if that JVM is not available, in a `java` subprocess.
 
-    def run_hyfd(self, data_path: str):
+        Args:
+            data_path (str): the path of the CSV file to discover the FDs of.
+            working_directory (str): the directory that the results are written (or, from the JVM, moved) into.
+
+        Returns:
+            Path: the directory that contains the results file.
+        """
         import subprocess
+        from synqtab.environment import HYFD_BACKEND, HYFD_JVM_MAX_HEAP
+        from synqtab.evaluators.HyFDJvm import HyFDJvm
         
         # Build classpath with absolute paths
-        metanome_jar = _JARS_DIR / "metanome-cli.jar"
-        hyfd_jar = _JARS_DIR / "HyFD.jar"
-        classpath = f"{metanome_jar}:{hyfd_jar}"
-        
-        # Call the Java executable directly from Python
-        cmd = [
-            "java", "-Xmx16g", "-cp", classpath,
-            "de.metanome.cli.App",
+        classpath = [str(_JARS_DIR / "metanome-cli.jar"), str(_JARS_DIR / "HyFD.jar")]
+        arguments = [
             "--algorithm", "de.metanome.algorithms.hyfd.HyFD",
             "--file-key", "INPUT_GENERATOR",
             "--files", data_path,
@@ -66,13 +72,27 @@ class HyFD(Evaluator):
             "--header",  # Indicate that first row is a header
             "--output", "file"
         ]
-        # Run from jars directory so results go there
-        subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, cwd=_JARS_DIR)
 
-    def parse_hyfd_results(self) -> dict:
+        if HYFD_BACKEND == 'jvm':
+            results_directory = HyFDJvm.get(classpath=classpath, max_heap=HYFD_JVM_MAX_HEAP).run(
+                arguments, results_directory=Path(working_directory) / "results"
+            )
+            if results_directory is not None:
+                return results_directory
+
+        # Call the Java executable directly from Python
+        cmd = ["java", f"-Xmx{HYFD_JVM_MAX_HEAP}", "-cp", ":".join(classpath), "de.metanome.cli.App", *arguments]
+        # Run from the working directory so results go there
+        subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, cwd=working_directory)
+        return Path(working_directory) / "results"
+
+    def parse_hyfd_results(self, results_dir: Path) -> dict:
         """
         Parse the HyFD results file and return a simplified JSON format.
 
+        Args:
+            results_dir (Path): the directory that HyFD wrote its results into.
+
         Returns:
             dict: A dictionary containing:
                 - 'num_fds': The number of functional dependencies found
@@ -80,8 +100,6 @@ class HyFD(Evaluator):
         """
         import json, os
         
-        # Results are created in jars/results/ since we run subprocess with cwd=_JARS_DIR
-        results_dir = _JARS_DIR / "results"
         if not results_dir.exists():
             return {"num_fds": 0, "fds": []}
 
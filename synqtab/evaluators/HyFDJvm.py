@@ -0,0 +1,146 @@
+import atexit
+import os
+import shutil
+import tempfile
+import threading
+from pathlib import Path
+from typing import Optional
+
+from synqtab.utils import get_logger
+
+
+LOG = get_logger(__file__)
+
+
+def _serve_metanome_requests(connection, classpath: list[str], max_heap: str, working_directory: str) -> None:
+    """Entry point of the JVM host process: starts the JVM once and then runs the Metanome CLI for every request.
+    Lives at module level, so that it can be pickled by the spawn start method.
+    """
+    try:
+        os.chdir(working_directory) # the Metanome CLI writes its results relative to the working directory
+        import jpype
+
+        jpype.startJVM(f"-Xmx{max_heap}", classpath=classpath)
+        metanome_cli = jpype.JClass('de.metanome.cli.App')
+    except Exception as e:
+        connection.send(('failed', repr(e)))
+        return
+
+    connection.send(('ready', working_directory))
+    while True:
+        try:
+            arguments = connection.recv()
+        except EOFError:
+            return
+        try:
+            metanome_cli.main(jpype.JArray(jpype.JString)(arguments))
+            connection.send(('ok', working_directory))
+        except Exception as e:
+            connection.send(('error', repr(e)))
+
+
+class HyFDJvm():
+    """A child process that hosts a JVM (through JPype) with Metanome and HyFD on its classpath and runs the Metanome
+    CLI on request, so that the JVM starts and warms up its JIT once per process instead of once per evaluation. The
+    JVM writes its results into a working directory of its own and serves one request at a time; the results of a
+    request are moved out to the caller before the next request runs, so concurrent callers never see each other's.
+
+    `run()` returns None whenever the JVM is not available, e.g., JPype is not installed or the JVM died, and the
+    caller is expected to fall back to a `java` subprocess. A JVM that died is started anew on the next request.
+    """
+
+    _instances: dict[int, 'HyFDJvm'] = dict() # one JVM per process
+    _instances_lock = threading.Lock()
+
+    def __init__(self, classpath: list[str], max_heap: str):
+        self.classpath = classpath
+        self.max_heap = max_heap
+        self._lock = threading.Lock()
+        self._process = None
+        self._connection = None
+        self._working_directory: Optional[Path] = None
+        self._unavailable = False
+        atexit.register(self._stop)
+
+    @classmethod
+    def get(cls, classpath: list[str], max_heap: str) -> 'HyFDJvm':
+        with cls._instances_lock:
+            if os.getpid() not in cls._instances:
+                cls._instances[os.getpid()] = cls(classpath, max_heap)
+            return cls._instances[os.getpid()]
+
+    def run(self, arguments: list[str], results_directory: Path) -> Optional[Path]:
+        """Runs the Metanome CLI with the given arguments in the JVM and moves its results into the given directory
+        before the next request can replace them.
+
+        Args:
+            arguments (list[str]): the command line arguments of `de.metanome.cli.App`.
+            results_directory (Path): the directory to move the results into, e.g., in the working directory of the
+            caller. It must not exist yet.
+
+        Returns:
+            Optional[Path]: the results directory, or None if the JVM is not available.
+        """
+        with self._lock:
+            if self._unavailable or not self._ensure_started():
+                return None
+
+            # leftovers of a request that failed before its results were moved out
+            shutil.rmtree(self._working_directory / 'results', ignore_errors=True)
+            try:
+                self._connection.send(arguments)
+                status, payload = self._connection.recv()
+            except (EOFError, OSError) as e:
+                LOG.warning(f"The HyFD JVM exited unexpectedly; it will be restarted on the next request. Error: {e}")
+                self._stop()
+                return None
+
+            if status == 'error':
+                raise RuntimeError(f"HyFD failed in the JVM: {payload}")
+            if (Path(payload) / 'results').exists():
+                shutil.move(Path(payload) / 'results', results_directory)
+            return results_directory
+
+    def _ensure_started(self) -> bool:
+        import multiprocessing
+
+        if self._process is not None and self._process.is_alive():
+            return True
+
+        self._stop()
+        self._working_directory = Path(tempfile.mkdtemp(prefix='hyfd-jvm-'))
+        context = multiprocessing.get_context('spawn')
+        self._connection, child_connection = context.Pipe()
+        self._process = context.Process(
+            target=_serve_metanome_requests,
+            args=(child_connection, self.classpath, self.max_heap, str(self._working_directory)),
+            name='hyfd-jvm',
+            daemon=True,
+        )
+        self._process.start()
+        child_connection.close()
+
+        try:
+            status, payload = self._connection.recv()
+        except EOFError:
+            status, payload = 'failed', "the JVM host process exited during start-up"
+        if status != 'ready':
+            LOG.warning(f"Could not start a JVM for HyFD; falling back to a java subprocess per evaluation. {payload}")
+            self._unavailable = True
+            self._stop()
+            return False
+
+        LOG.info(f"Started a JVM for HyFD (process {self._process.pid}).")
+        return True
+
+    def _stop(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+        if self._process is not None:
+            self._process.terminate()
+            self._process.join(timeout=5)
+            self._process = None
+        if self._working_directory is not None:
+            shutil.rmtree(self._working_directory, ignore_errors=True)
+            self._working_directory = None
@@ -1,5 +1,5 @@
 from synqtab.evaluators.Evaluator import Evaluator
-from synqtab.utils.outlier_utils import handle_categorical
+from synqtab.utils.outlier_utils import OneHotFeatureEncoder
 
 class IsolationForestEvaluator(Evaluator):
     """ Isolation Forest Outlier Detection Evaluator. Leverages
@@ -9,6 +9,8 @@ class IsolationForestEvaluator(Evaluator):
         model. If absent, defaults to 100. See the original implementation for details.
         - [*optional*] `'contamination'`: the amount of contamination of the dat set. 
         If absent, defaults to 'auto'. See the original implementation for details.
+        - [*optional*] `'feature_encoder'`: the `OneHotFeatureEncoder` shared by the evaluations of the dataset.
+        If absent, the data is encoded on its own.
         - [*optional*] `'notes'`: True/False on whether to include notes in the result or not.
         If absent, defaults to False.
     """
@@ -21,10 +23,14 @@ class IsolationForestEvaluator(Evaluator):
         return "Isolation Forest Outlier Detection"
 
     def compute_result(self):
+        import numpy as np
         from synqtab.reproducibility import ReproducibleOperations
         
         data = self.params.get('data')
-        data = handle_categorical(data, method = 'onehot')
+        feature_encoder = self.params.get('feature_encoder') or OneHotFeatureEncoder(data)
+        # the forest works on float32 anyway, so encoding straight to float32 saves it a copy. The forest samples
+        # among all columns, so the categories that the data lack are left out, exactly like handle_categorical()
+        data = feature_encoder.transform(data, dtype=np.float32, observed_categories_only=True)
         iso_forest = ReproducibleOperations.get_isolation_forest_model(
             n_estimators=self.params.get('n_estimators', 100),
             contamination=self.params.get('contamination', 'auto'),
@@ -1,5 +1,12 @@
+import numpy as np
+
 from synqtab.evaluators.Evaluator import Evaluator
-from synqtab.utils.outlier_utils import handle_categorical
+from synqtab.utils import get_logger
+from synqtab.utils.outlier_utils import OneHotFeatureEncoder, hnsw_neighbors_graph
+
+
+LOG = get_logger(__file__)
+
 
 class LofEvaluator(Evaluator):
     """ Local Outlier Factor (LOF) Outlier Detection Evaluator. Leverages
@@ -9,6 +16,14 @@ class LofEvaluator(Evaluator):
         model. If absent, defaults to 5. See the original implementation for details.
         - [*optional*] `'contamination'`: the amount of contamination of the dat set. 
         If absent, defaults to 'auto'. See the original implementation for details.
+        - [*optional*] `'neighbor_backend'`: how to search the nearest neighbors. `'exact'` searches the encoded
+        data exactly, `'tree'` searches a KD-tree on the first `'n_components'` truncated-SVD components of it and
+        `'hnsw'` an approximate HNSW index of it (requires hnswlib; falls back to `'exact'` without it). If absent,
+        defaults to `LOF_NEIGHBOR_BACKEND`.
+        - [*optional*] `'n_components'`: the dimensions of the `'tree'` backend. If absent, defaults to
+        `LOF_TREE_COMPONENTS`.
+        - [*optional*] `'feature_encoder'`: the `OneHotFeatureEncoder` shared by the evaluations of the dataset.
+        If absent, the data is encoded on its own.
         - [*optional*] `'notes'`: True/False on whether to include notes in the result or not.
         If absent, defaults to False.
     """
@@ -25,16 +40,25 @@ class LofEvaluator(Evaluator):
         return "Local Outlier Factor Outlier Detection"
         
     def compute_result(self):
-        from sklearn.neighbors import LocalOutlierFactor
+        from synqtab.environment import LOF_NEIGHBOR_BACKEND
         
         data = self.params.get('data')
-        data = handle_categorical(data, method= 'onehot')
-        lof = LocalOutlierFactor(
-            n_neighbors=self.params.get('n_neighbors', 20),
-            contamination=self.params.get('contamination', 'auto'),
-            metric='euclidean',
-            n_jobs=-1,
-        )
+        feature_encoder = self.params.get('feature_encoder') or OneHotFeatureEncoder(data)
+        n_neighbors = min(self.params.get('n_neighbors', 20), len(data) - 1)
+        neighbor_backend = self.params.get('neighbor_backend', LOF_NEIGHBOR_BACKEND)
+
+        match neighbor_backend:
+            case 'exact':
+                lof, data = self._exact_lof(feature_encoder, data, n_neighbors)
+            case 'tree':
+                lof, data = self._tree_lof(feature_encoder, data, n_neighbors)
+            case 'hnsw':
+                lof, data = self._hnsw_lof(feature_encoder, data, n_neighbors)
+            case _:
+                raise ValueError(
+                    f"Unknown neighbor backend {neighbor_backend}. Valid options: ['exact', 'tree', 'hnsw']."
+                )
+
         # Fit and predict (-1 for outliers, 1 for inliers)
         predictions = lof.fit_predict(data)
 
@@ -48,3 +72,42 @@ class LofEvaluator(Evaluator):
                 'outlier_scores': scores.tolist(),
             }
         return nof_outliers
+
+    def _local_outlier_factor(self, **kwargs):
+        from sklearn.neighbors import LocalOutlierFactor
+
+        return LocalOutlierFactor(contamination=self.params.get('contamination', 'auto'), n_jobs=-1, **kwargs)
+
+    def _exact_lof(self, feature_encoder: OneHotFeatureEncoder, data, n_neighbors: int):
+        # scikit-learn searches the neighbors by brute force beyond 15 features anyway, and that search takes sparse
+        # input, so wide one-hot encodings stay sparse
+        data = feature_encoder.transform(data, sparse=feature_encoder.n_encoded_columns > 15)
+        return self._local_outlier_factor(n_neighbors=n_neighbors, metric='euclidean'), data
+
+    def _tree_lof(self, feature_encoder: OneHotFeatureEncoder, data, n_neighbors: int):
+        from sklearn.decomposition import TruncatedSVD
+        from synqtab.environment import LOF_TREE_COMPONENTS
+        from synqtab.reproducibility import ReproducibleOperations
+
+        n_components = self.params.get('n_components', LOF_TREE_COMPONENTS)
+        data = feature_encoder.transform(data, sparse=True)
+        if n_components < data.shape[1]:
+            # TruncatedSVD works on the sparse one-hot encoding directly, unlike PCA
+            data = TruncatedSVD(
+                n_components=n_components,
+                random_state=ReproducibleOperations.derive_seed('lof-tree-svd'),
+            ).fit_transform(data)
+        else:
+            data = data.toarray()
+        lof = self._local_outlier_factor(n_neighbors=n_neighbors, metric='euclidean', algorithm='kd_tree')
+        return lof, data
+
+    def _hnsw_lof(self, feature_encoder: OneHotFeatureEncoder, data, n_neighbors: int):
+        try:
+            import hnswlib # noqa: F401
+        except ImportError:
+            LOG.warning("hnswlib is not installed; searching the LOF neighbors exactly instead.")
+            return self._exact_lof(feature_encoder, data, n_neighbors)
+
+        neighbors_graph = hnsw_neighbors_graph(feature_encoder.transform(data, dtype=np.float32), n_neighbors)
+        return self._local_outlier_factor(n_neighbors=n_neighbors, metric='precomputed'), neighbors_graph
@@ -6,6 +6,8 @@ from .DCREvaluator import DCREvaluator
 from .DesbordanteFDs import DesbordanteFDs
 from .DisclosureProtectionEvaluator import DisclosureProtectionEvaluator
 from .Evaluation import Evaluation
+from .EvaluationBatch import EvaluationBatch
+from .EvaluationContext import EvaluationContext
 from .Evaluator import Evaluator
 from .HyFD import HyFD
 from .IsolationForestEvaluator import IsolationForestEvaluator
@@ -22,6 +24,8 @@ __all__ = [
     'DesbordanteFDs',
     'DisclosureProtectionEvaluator',
     'Evaluation',
+    'EvaluationBatch',
+    'EvaluationContext',
     'Evaluator',
     'HyFD',
     'IsolationForestEvaluator',
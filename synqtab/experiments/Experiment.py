@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional, Self
+from typing import Any, Dict, Iterable, List, Optional, Self, Tuple
+
+import pandas as pd
 
 from synqtab.data.Dataset import Dataset
 from synqtab.enums import (
@@ -19,6 +21,13 @@ class Experiment(ABC):
     
     _delimiter: str = '#'
     _NULL: str = 'NULL'
+    
+    # An experiment is considered done if its id is found in any of these tables (mapped to their id column)
+    _done_id_columns_by_table: dict[str, str] = {
+        'experiments': 'experiment_id',                # experiments that have already been executed before
+        'errors': 'experiment_id',                     # experiments that are known to fail
+        'skipped_computations': 'computation_id',      # experiments that have already been skipped at least once in the past
+    }
 
     def __init__(
         self,
@@ -29,7 +38,13 @@ class Experiment(ABC):
         data_perfectness: DataPerfectness = DataPerfectness.PERFECT,
         evaluation_methods: Optional[list[EvaluationMethod]] = None,
         options: Optional[Dict[Any, Any]] = None,
+        should_compute: Optional[bool] = None,
     ):
+        """
+        Args:
+            should_compute (bool, optional): Whether the experiment still has to be computed, if the caller already
+            knows it, e.g., from a bulk `Experiment.existing_ids()` pre-check. If None, Postgres is queried.
+        """
         self.dataset = dataset
         self.generator = generator
         self.data_error = data_error_type
@@ -38,7 +53,7 @@ class Experiment(ABC):
         self.evaluators = evaluation_methods
         self.options = options
         
-        self._should_compute = (not self._exists_in_postgres())
+        self._should_compute = should_compute if should_compute is not None else (not self._exists_in_postgres())
         
         self.training_X = None
         y = None
@@ -67,19 +82,58 @@ class Experiment(ABC):
         """
         pass
     
-    # IMPORTANT: Keep this method aligned with the from_str() method!
     def _get_experiment_id_parts(self):
         from synqtab.reproducibility.ReproducibleOperations import ReproducibleOperations
+        return self._compose_experiment_id_parts(
+            dataset_name=self.dataset.dataset_name,
+            random_seed=ReproducibleOperations.get_current_random_seed(),
+            data_perfectness=self.data_perfectness,
+            data_error=self.data_error,
+            data_error_rate=self.data_error_rate,
+            generator=self.generator,
+        )
+    
+    # IMPORTANT: Keep this method aligned with the from_str() method!
+    @classmethod
+    def _compose_experiment_id_parts(
+        cls,
+        dataset_name: str,
+        random_seed: int,
+        data_perfectness: DataPerfectness,
+        data_error: Optional[DataErrorType],
+        data_error_rate: Optional[float],
+        generator: GeneratorModel,
+    ) -> list[str]:
         return [
-            str(self.short_name()),  # Experiment shortname, e.g., 'NOR' for Normal Experiment
-            str(self.dataset.dataset_name),  # Dataset name, e.g., 'anneal'
-            str(ReproducibleOperations.get_current_random_seed()),  # Random seed
-            str(self.data_perfectness), # Data perfectness level, e.g., 'PERF' for perfect
-            str(self.data_error) if self.data_error else self._NULL,    # Data error type, e.g., 'OUT' for outliers
-            str(int(self.data_error_rate * 100)) if self.data_error_rate else self._NULL, # Data error rate multiplied by 100, e.g., 0.2 -> 20 -> '20'
-            str(self.generator),   # Generator type, e.g., 'tabpfn' 
+            str(cls.short_name()),  # Experiment shortname, e.g., 'NOR' for Normal Experiment
+            str(dataset_name),  # Dataset name, e.g., 'anneal'
+            str(random_seed),  # Random seed
+            str(data_perfectness), # Data perfectness level, e.g., 'PERF' for perfect
+            str(data_error) if data_error else cls._NULL,    # Data error type, e.g., 'OUT' for outliers
+            str(int(data_error_rate * 100)) if data_error_rate else cls._NULL, # Data error rate multiplied by 100, e.g., 0.2 -> 20 -> '20'
+            str(generator),   # Generator type, e.g., 'tabpfn' 
         ]
     
+    @classmethod
+    def compose_id(
+        cls,
+        dataset_name: str,
+        random_seed: int,
+        generator: GeneratorModel,
+        data_error_type: Optional[DataErrorType] = None,
+        data_error_rate: Optional[float] = None,
+        data_perfectness: DataPerfectness = DataPerfectness.PERFECT,
+    ) -> str:
+        """Returns the id that an experiment of this class with the given parameters would have, without building it."""
+        return cls._delimiter.join(cls._compose_experiment_id_parts(
+            dataset_name=dataset_name,
+            random_seed=random_seed,
+            data_perfectness=data_perfectness,
+            data_error=data_error_type,
+            data_error_rate=data_error_rate,
+            generator=generator,
+        ))
+    
     # IMPORTANT: Keep this method aligned with the _get_experiment_parts() method!
     @classmethod
     def from_str(cls, experiment_id: str) -> tuple[Self, int]:
@@ -88,10 +142,15 @@ class Experiment(ABC):
         from synqtab.enums.data import DataPerfectness
         from synqtab.enums.generators import GeneratorModel
         
+        from synqtab.reproducibility.ReproducibleOperations import ReproducibleOperations
+
         experiment_id_parts = experiment_id.split(cls._delimiter)
         experiment_short_name = experiment_id_parts[0]
         dataset = Dataset(experiment_id_parts[1])
         random_seed = int(experiment_id_parts[2])
+        # The random seed is part of the experiment's identity (see _get_experiment_id_parts()), so it has to be
+        # in place before the experiment is constructed, otherwise str(experiment) would not match experiment_id
+        ReproducibleOperations.set_random_seed(random_seed)
         data_perfectness = DataPerfectness(experiment_id_parts[3])
         data_error = None if experiment_id_parts[4] == cls._NULL else DataErrorType(experiment_id_parts[4])
         data_error_rate = None if experiment_id_parts[5] == cls._NULL else float(int(experiment_id_parts[5]) / 100)
@@ -112,6 +171,17 @@ class Experiment(ABC):
         experiment_id_parts = self._get_experiment_id_parts()
         return self._delimiter.join(experiment_id_parts)
     
+    def corruption_stream_id(self) -> str:
+        """Identifies the corruption of the experiment for `ReproducibleOperations.random_stream()`. It leaves out the
+        generator and the data perfectness, so that all experiments that start from the same corrupted data (and the
+        evaluations that reproduce it) draw the same randomness.
+        """
+        return self._delimiter.join([
+            str(self.dataset.dataset_name),
+            str(self.data_error) if self.data_error else self._NULL,
+            str(int(self.data_error_rate * 100)) if self.data_error_rate else self._NULL,
+        ])
+    
     def perfect_counterpart(self) -> Self:
         from copy import deepcopy
         
@@ -121,6 +191,52 @@ class Experiment(ABC):
         perfect_experiment.data_error_rate = None
         return perfect_experiment
     
+    def corrupt_training_data(self, training_df: pd.DataFrame) -> Tuple[pd.DataFrame, List, List]:
+        """Corrupts the training data with the data error of the experiment. The result is stored as a
+        `CorruptionArtifact` the first time, and loaded from there afterwards, e.g., by the RH evaluations.
+
+        Args:
+            training_df (pd.DataFrame): the (perfect) training data of the experiment. It is not modified.
+
+        Returns:
+            Tuple[pd.DataFrame, List, List]: the corrupted data, the corrupted rows and the corrupted columns.
+        """
+        from synqtab.data import CorruptionArtifact
+        from synqtab.enums import MinioFolder
+        from synqtab.environment import CORRUPTION_ARTIFACTS
+        from synqtab.reproducibility import ReproducibleOperations
+
+        corruption_artifact = None
+        if CORRUPTION_ARTIFACTS:
+            corruption_artifact = CorruptionArtifact(
+                object_prefix=MinioFolder.create_prefix(MinioFolder.IMPERFECT, self.minio_path()),
+                fingerprint=CorruptionArtifact.compute_fingerprint(
+                    training_df, experiment_id=str(self), stream_id=self.corruption_stream_id()
+                ),
+            )
+            try:
+                corruption_result = corruption_artifact.load()
+                if corruption_result is not None:
+                    return corruption_result
+            except Exception as e:
+                LOG.warning(f"Could not load the corruption artifact of experiment {str(self)}; corrupting again. Error: {e}")
+
+        data_error_instance = self.data_error.get_class()(row_fraction=self.data_error_rate)
+        with ReproducibleOperations.random_stream('corruption', self.corruption_stream_id()):
+            corrupted_df, corrupted_rows, corrupted_cols = data_error_instance.corrupt(
+                data=training_df,
+                categorical_columns=self.dataset.categorcal_features,
+                target_column=self.dataset.target_feature,
+            )
+
+        if corruption_artifact is not None and len(corrupted_cols) > 0:
+            try:
+                corruption_artifact.store(corrupted_df, corrupted_rows, corrupted_cols)
+            except Exception as e:
+                # the artifact only saves time, so the experiment goes on without it
+                LOG.warning(f"Could not store the corruption artifact of experiment {str(self)}. Error: {e}")
+        return corrupted_df, corrupted_rows, corrupted_cols
+
     def minio_path(self):
         from synqtab.enums import MinioFolder
         
@@ -146,26 +262,12 @@ class Experiment(ABC):
         
         return self._publish_tasks()
 
-    def _exists_in_postgres(self) -> bool:
+    @classmethod
+    def existing_ids(cls, experiment_ids: Iterable[str]) -> set[str]:
+        """Returns the subset of the given experiment ids that are already done, in a single Postgres round trip."""
         from synqtab.data import PostgresClient
         
-        # skip experiments that have already been executed before
-        if PostgresClient.experiment_exists(str(self)):
-            return True
-
-        # skip experiments that are known to fail
-        if PostgresClient.experiment_exists(
-            str(self),
-            experiments_table_name='errors',
-        ):
-            return True
-
-        # skip experiments that have already been skipped at least once in the past
-        if PostgresClient.experiment_exists(
-            str(self),
-            experiments_table_name='skipped_computations',
-            experiment_id_column_name='computation_id',
-        ):
-            return True
-
-        return False
+        return PostgresClient.existing_ids(experiment_ids, id_columns_by_table=cls._done_id_columns_by_table)
+
+    def _exists_in_postgres(self) -> bool:
+        return str(self) in self.existing_ids([str(self)])
@@ -0,0 +1,182 @@
+from collections import Counter, deque
+from typing import Any, Optional
+
+from synqtab.enums import ResourceClass
+from synqtab.utils import get_logger
+
+
+LOG = get_logger(__file__)
+
+
+class GridRunner():
+    """Runs the (imperfect and semi-perfect) normal experiments of a grid in parallel. The grid is expanded into
+    experiment descriptors (see `get_normal_experiment_grid()`), the ones that are already done are dropped with a
+    single Postgres query, and the rest are scheduled on one process pool per `ResourceClass` of their generator, so
+    that light CPU-only generators run many at a time while heavy generators do not compete for the same accelerator.
+    Every experiment seeds its process itself (see `_run_grid_experiment()`), so its outcome does not depend on the
+    process it lands on or on the order in which experiments run.
+    """
+
+    def __init__(
+        self,
+        experimental_params: dict[str, Any],
+        cpu_processes: Optional[int] = None,
+        gpu_processes: Optional[int] = None,
+    ):
+        """
+        Args:
+            experimental_params (dict[str, Any]): the parameters of the grid, as returned by
+            `get_experimental_params_for_normal()`.
+            cpu_processes (int, optional): concurrent experiments of CPU-only generators. Defaults to `GRID_CPU_PROCESSES`.
+            gpu_processes (int, optional): concurrent experiments of heavy generators. Defaults to `GRID_GPU_PROCESSES`.
+        """
+        from synqtab.environment import GRID_CPU_PROCESSES, GRID_GPU_PROCESSES
+
+        self.experimental_params = experimental_params
+        self.processes = {
+            ResourceClass.CPU: cpu_processes or GRID_CPU_PROCESSES,
+            ResourceClass.GPU: gpu_processes or GRID_GPU_PROCESSES,
+        }
+
+    def experiment_descriptors(self) -> list[dict[str, Any]]:
+        """Expands the grid into the descriptors of the experiments that still have to run, in grid order.
+
+        Returns:
+            list[dict[str, Any]]: the experiment parameters of the grid, extended with the `experiment_id`, whether
+            it `should_compute` (i.e., it is not done yet) and whether to `force` it (regression datasets are always
+            recomputed).
+        """
+        from synqtab.data import Dataset
+        from synqtab.enums import ProblemType
+        from synqtab.experiments.Experiment import Experiment
+        from synqtab.experiments.NormalExperiment import NormalExperiment
+        from synqtab.utils import get_normal_experiment_grid
+
+        experiment_grid = get_normal_experiment_grid(self.experimental_params)
+        experiment_ids = [NormalExperiment.compose_id(**experiment_params) for experiment_params in experiment_grid]
+        done_experiment_ids = Experiment.existing_ids(experiment_ids) # loaded once, in a single round trip
+        LOG.info(f"{len(done_experiment_ids)} out of {len(experiment_ids)} experiments of the grid are already done.")
+
+        forced_dataset_names = dict()
+        descriptors = []
+        for experiment_params, experiment_id in zip(experiment_grid, experiment_ids):
+            dataset_name = experiment_params.get('dataset_name')
+            if dataset_name not in forced_dataset_names:
+                forced_dataset_names[dataset_name] = (
+                    Dataset(dataset_name).problem_type == str(ProblemType.REGRESSION)
+                )
+
+            force = forced_dataset_names[dataset_name]
+            should_compute = experiment_id not in done_experiment_ids
+            if not should_compute and not force:
+                continue
+
+            descriptors.append({
+                **experiment_params,
+                'experiment_id': experiment_id,
+                'should_compute': should_compute,
+                'force': force,
+            })
+        return descriptors
+
+    def run(self) -> Counter:
+        """Runs all experiments of the grid that still have to run.
+
+        Returns:
+            Counter: number of experiments that succeeded (True) and failed (False).
+        """
+        from concurrent.futures import FIRST_COMPLETED, wait
+        from concurrent.futures.process import BrokenProcessPool
+
+        pending = {resource_class: deque() for resource_class in self.processes}
+        for descriptor in self.experiment_descriptors():
+            pending[descriptor['generator'].resource_class()].append(descriptor)
+        LOG.info(f"Running { {str(rc): len(descriptors) for rc, descriptors in pending.items()} } experiments with " +
+                 f"{ {str(rc): processes for rc, processes in self.processes.items()} } processes.")
+
+        outcomes = Counter()
+        pools = {resource_class: self._create_pool(resource_class) for resource_class in self.processes}
+        in_flight = dict() # future -> (resource class, descriptor, pool)
+        in_flight_per_resource_class = Counter()
+
+        def submit_pending(resource_class: ResourceClass) -> None:
+            # a bounded number of experiments in flight per pool, so that a crashed process only takes them down
+            while pending[resource_class] and in_flight_per_resource_class[resource_class] < self.processes[resource_class]:
+                descriptor = pending[resource_class].popleft()
+                pool = pools[resource_class]
+                future = pool.submit(
+                    _run_grid_experiment, descriptor, self.experimental_params.get('evaluation_methods')
+                )
+                in_flight[future] = (resource_class, descriptor, pool)
+                in_flight_per_resource_class[resource_class] += 1
+
+        try:
+            for resource_class in self.processes:
+                submit_pending(resource_class)
+
+            while in_flight:
+                done_futures, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done_futures:
+                    resource_class, descriptor, pool = in_flight.pop(future)
+                    in_flight_per_resource_class[resource_class] -= 1
+                    try:
+                        outcomes[future.result()] += 1
+                    except BrokenProcessPool as e:
+                        # a process died (e.g., out of memory). The experiment is not done, so the next run retries it
+                        LOG.error(
+                            f"The process of experiment {descriptor['experiment_id']} died unexpectedly. Error: {e}",
+                            extra={'experiment_id': descriptor['experiment_id']}
+                        )
+                        outcomes[False] += 1
+                        if pools[resource_class] is pool:
+                            pool.shutdown(wait=False, cancel_futures=True)
+                            pools[resource_class] = self._create_pool(resource_class)
+                    submit_pending(resource_class)
+        finally:
+            for pool in pools.values():
+                pool.shutdown()
+
+        LOG.info(f"The grid run is complete: {outcomes[True]} experiments succeeded and {outcomes[False]} failed.")
+        return outcomes
+
+    def _create_pool(self, resource_class: ResourceClass):
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        # spawn, so that every process creates its own MinIO and Postgres connections (and CUDA context)
+        return ProcessPoolExecutor(
+            max_workers=self.processes[resource_class], mp_context=multiprocessing.get_context('spawn')
+        )
+
+
+def _run_grid_experiment(descriptor: dict[str, Any], evaluation_methods: Optional[list]) -> bool:
+    """Entry point of the pool processes. Lives at module level, so that it can be pickled.
+    The random seed of the experiment is set (and all libraries are seeded with it) right before the experiment is
+    built, exactly like the serial loop does, so that results are reproducible regardless of the process.
+    """
+    from synqtab.data import Dataset, PostgresClient
+    from synqtab.experiments.NormalExperiment import NormalExperiment
+    from synqtab.reproducibility import ReproducibleOperations
+
+    experiment_id = descriptor['experiment_id']
+    try:
+        ReproducibleOperations.set_random_seed(descriptor['random_seed'])
+        ReproducibleOperations.seed_everything()
+        normal_experiment = NormalExperiment(
+            dataset=Dataset(descriptor['dataset_name']),
+            generator=descriptor['generator'],
+            data_error_type=descriptor['data_error_type'],
+            data_error_rate=descriptor['data_error_rate'],
+            data_perfectness=descriptor['data_perfectness'],
+            evaluation_methods=evaluation_methods,
+            should_compute=descriptor['should_compute'],
+        )
+        normal_experiment.run(force=descriptor['force']).publish_tasks()
+        PostgresClient.flush()
+        return True
+    except Exception as e:
+        LOG.error(
+            f"The experiment failed but I will continue to the next one. Error: {e}",
+            extra={'experiment_id': experiment_id}
+        )
+        return False
@@ -18,7 +18,7 @@ class NormalExperiment(Experiment):
         from synqtab.data import PostgresClient, MinioClient
         from synqtab.enums import MinioBucket, ProblemType, DataPerfectness
         from synqtab.environment import MAX_TRAINING_ROWS
-        from synqtab.mappings.mappings import GENERATOR_MODEL_TO_GENERATOR_INSTANCE
+        from synqtab.generators import get_generator_instance
         from synqtab.reproducibility import ReproducibleOperations
         from synqtab.utils import timed_computation
 
@@ -41,18 +41,13 @@ class NormalExperiment(Experiment):
         corrupted_rows = corrupted_cols = []
         if self.data_error:
             if self.data_error_rate:
-                data_error_instance = self.data_error.get_class()(row_fraction=self.data_error_rate)
-                training_df, corrupted_rows, corrupted_cols = data_error_instance.corrupt(
-                    data=training_df,
-                    categorical_columns=self.dataset.categorcal_features,
-                    target_column=self.dataset.target_feature,
-                )
+                training_df, corrupted_rows, corrupted_cols = self.corrupt_training_data(training_df)
                 LOG.info(f"Data Corruption was completed successfully for experiment {str(self)}")
                 
                 if len(corrupted_cols) == 0:
                     from synqtab.data import PostgresClient
                     LOG.info(f"Experiment {str(self)} will be skipped, because no columns to corrupt were found.")
-                    LOG.info(f"Experiment {str(self)}. Categorical: {self.dataset.categorcal_features}, All: {training_df.columns}, Error Applicability: {data_error_instance.data_error_applicability()}.")
+                    LOG.info(f"Experiment {str(self)}. Categorical: {self.dataset.categorcal_features}, All: {training_df.columns}, Error Applicability: {self.data_error.get_class()(row_fraction=self.data_error_rate).data_error_applicability()}.")
                     self._should_compute = False
                     PostgresClient.write_skipped_computation(computation_id=str(self), reason="No columns to corrupt.")
                     return
@@ -63,7 +58,7 @@ class NormalExperiment(Experiment):
         LOG.info(f"Initializing {self.generator} generator for experiment {str(self)}")
         y = training_df[target_column_name]
         X = training_df.drop(columns=[target_column_name])
-        generator_instance = GENERATOR_MODEL_TO_GENERATOR_INSTANCE.get(self.generator)
+        generator_instance = get_generator_instance(self.generator)
         
         synthetic_df, elapsed_time = timed_computation(
             computation=generator_instance.generate,
@@ -112,6 +107,7 @@ class NormalExperiment(Experiment):
         # TODO FIND A WAY TO POPULATE THE PARAMS AS THE SDMETRICS ARE EXPECTING TO GET THESE
         params = dict()
         
+        from synqtab.data import PostgresClient
         from synqtab.enums import SINGULAR_EVALUATORS, DUAL_EVALUATORS
         from synqtab.evaluators import Evaluation
         from synqtab.mappings import (
@@ -119,8 +115,7 @@ class NormalExperiment(Experiment):
             SINGULAR_EVALUATION_TARGETS, DUAL_EVALUATION_TARGETS
         )
         
-        published_tasks = 0
-        skipped_tasks = 0
+        evaluation_pairs_per_method = dict()
         for evaluation_method in self.evaluators:
             
             evaluation_pairs = []
@@ -130,12 +125,36 @@ class NormalExperiment(Experiment):
                 evaluation_pairs = DUAL_EVALUATION_TARGETS
             else:
                 raise ValueError(f"Evaluation method {str(evaluation_method)} was not found in neither the singular nor dual evaluators.")
-            
+            evaluation_pairs_per_method[evaluation_method] = evaluation_pairs
+        
+        # one round trip for all evaluations of the experiment, instead of one per evaluation
+        existing_evaluation_ids = PostgresClient.existing_ids(
+            [
+                Evaluation.compose_id(evaluation_method, *evaluation_pair)
+                for evaluation_method, evaluation_pairs in evaluation_pairs_per_method.items()
+                for evaluation_pair in evaluation_pairs
+            ],
+            id_columns_by_table={'evaluations': 'evaluation_id'},
+            filters={'experiment_id': str(self)},
+        )
+        
+        from synqtab.environment import EVALUATION_BATCHING
+        if EVALUATION_BATCHING:
+            return self._publish_batched_tasks(evaluation_pairs_per_method, existing_evaluation_ids)
+        
+        published_tasks = 0
+        skipped_tasks = 0
+        for evaluation_method, evaluation_pairs in evaluation_pairs_per_method.items():
             for evaluation_pair in evaluation_pairs:
+                if Evaluation.compose_id(evaluation_method, *evaluation_pair) in existing_evaluation_ids:
+                    skipped_tasks += 1
+                    continue
+                
                 evaluation = Evaluation(
                     *evaluation_pair,
                     experiment=self,
                     evaluation_method=evaluation_method,
+                    should_compute=True,
                 )
                 was_published = evaluation.publish_task_if_valid()
                 if was_published:
@@ -145,4 +164,38 @@ class NormalExperiment(Experiment):
                     skipped_tasks += 1
                 
         LOG.info(f"Successfully published {published_tasks} and skipped {skipped_tasks} tasks for experiment {str(self)}")        
+        return self
+    
+    def _publish_batched_tasks(self, evaluation_pairs_per_method: dict, existing_evaluation_ids: set[str]) -> Self:
+        """Publishes one `EvaluationBatch` task per evaluation target pair, covering all the evaluation methods of
+        that pair that do not exist in Postgres yet."""
+        from synqtab.evaluators import Evaluation, EvaluationBatch
+        
+        evaluation_methods_per_pair = dict()
+        skipped_evaluations = 0
+        for evaluation_method, evaluation_pairs in evaluation_pairs_per_method.items():
+            for evaluation_pair in evaluation_pairs:
+                if Evaluation.compose_id(evaluation_method, *evaluation_pair) in existing_evaluation_ids:
+                    skipped_evaluations += 1
+                    continue
+                evaluation_methods_per_pair.setdefault(tuple(evaluation_pair), []).append(evaluation_method)
+        
+        published_tasks = 0
+        published_evaluations = 0
+        for evaluation_pair, evaluation_methods in evaluation_methods_per_pair.items():
+            evaluation_batch = EvaluationBatch(
+                *evaluation_pair,
+                experiment=self,
+                evaluation_methods=evaluation_methods,
+                existing_evaluation_ids=existing_evaluation_ids,
+            )
+            covered_evaluations = evaluation_batch.publish_task_if_valid()
+            # evaluations that are not valid, e.g., R2 evaluation on classification dataset, are left out
+            skipped_evaluations += len(evaluation_methods) - covered_evaluations
+            published_evaluations += covered_evaluations
+            if covered_evaluations > 0:
+                published_tasks += 1
+        
+        LOG.info(f"Successfully published {published_tasks} batched tasks of {published_evaluations} evaluations " +
+                 f"and skipped {skipped_evaluations} evaluations for experiment {str(self)}")
         return self
\ No newline at end of file
@@ -1,4 +1,5 @@
 from .AugmentationExperiment import AugmentationExperiment
+from .GridRunner import GridRunner
 from .NormalExperiment import NormalExperiment
 from .PrivacyExperiment import PrivacyExperiment
 from .RebalancingExperiment import RebalancingExperiment
@@ -6,6 +7,7 @@ from .RebalancingExperiment import RebalancingExperiment
 
 __all__ = [
     'AugmentationExperiment',
+    'GridRunner',
     'NormalExperiment',
     'PrivacyExperiment',
     'RebalancingExperiment'
@@ -0,0 +1,195 @@
+import os
+import threading
+from multiprocessing.managers import BaseManager
+from typing import Any, Optional
+
+import pandas as pd
+
+from synqtab.enums import GeneratorModel
+from synqtab.generators.Generator import Generator
+from synqtab.utils import get_logger
+
+
+LOG = get_logger(__file__)
+
+
+class _GeneratorServerManager(BaseManager):
+    pass
+
+
+class _GeneratorClientManager(BaseManager):
+    pass
+
+
+_GeneratorClientManager.register('generator_host')
+
+
+def _parse_address(address: str, allow_remote: bool = False) -> tuple[str, int]:
+    """Parses a `host:port` address; the host defaults to the loopback interface. The managers pickle their requests
+    and responses, so a host other than loopback is refused unless `allow_remote` is set.
+    """
+    import ipaddress
+
+    host, _, port = address.rpartition(':')
+    host = host or '127.0.0.1'
+    if not allow_remote:
+        try:
+            is_loopback = host == 'localhost' or ipaddress.ip_address(host).is_loopback
+        except ValueError: # a host name
+            is_loopback = False
+        if not is_loopback:
+            raise ValueError(
+                f"The generator server address {address} is not a loopback address. "
+                "Set GENERATOR_SERVER_ALLOW_REMOTE=true to use it on a trusted network."
+            )
+    return host, int(port)
+
+
+def _require_authkey(authkey: str) -> bytes:
+    if not authkey:
+        raise ValueError(
+            "The generator server and its clients need a shared secret. Set GENERATOR_SERVER_AUTHKEY or pass one."
+        )
+    return authkey.encode('utf-8')
+
+
+class _GeneratorHost():
+    """Runs the generation requests in the server process, one at a time: the warm models are shared and the random
+    state of the libraries is global, so two requests cannot run side by side.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+
+    def generate(
+        self,
+        generator_model: str,
+        X_initial: pd.DataFrame,
+        y_initial: pd.DataFrame,
+        n_samples: int,
+        metadata: dict[str, Any],
+        random_seed: int,
+    ) -> pd.DataFrame:
+        from synqtab.mappings.mappings import GENERATOR_MODEL_TO_GENERATOR_INSTANCE
+        from synqtab.reproducibility import ReproducibleOperations
+
+        with self._lock:
+            # seeded exactly like an experiment process that is about to generate
+            ReproducibleOperations.set_random_seed(random_seed)
+            ReproducibleOperations.seed_everything()
+            LOG.info(f"Generating {n_samples} rows with {generator_model} for random seed {random_seed}.")
+            return GENERATOR_MODEL_TO_GENERATOR_INSTANCE[GeneratorModel(generator_model)].generate(
+                X_initial=X_initial,
+                y_initial=y_initial,
+                n_samples=n_samples,
+                metadata=metadata,
+            )
+
+
+class GeneratorServer():
+    """A long-lived process that serves the `generate()` requests of `RemoteGenerator`s over a local socket. Its
+    prior-fitted models (TabPFN, TabEBM) stay warm (see `ReproducibleOperations.keep_models_warm()`), so that their
+    weights are loaded once per node instead of once per experiment. Requests are served one at a time.
+
+    The requests are pickled, so whoever can connect can run code in the server. It therefore refuses to start
+    without a `GENERATOR_SERVER_AUTHKEY` and listens on loopback only, unless `GENERATOR_SERVER_ALLOW_REMOTE` is set.
+    """
+
+    def __init__(
+        self, address: Optional[str] = None, authkey: Optional[str] = None, allow_remote: Optional[bool] = None
+    ):
+        """
+        Args:
+            address (str, optional): the `host:port` to listen on. Defaults to `GENERATOR_SERVER_ADDRESS`.
+            authkey (str, optional): the key that clients must present. Defaults to `GENERATOR_SERVER_AUTHKEY`.
+            allow_remote (bool, optional): whether to listen on a host other than loopback. Defaults to
+            `GENERATOR_SERVER_ALLOW_REMOTE`.
+        """
+        from synqtab.environment import (
+            GENERATOR_SERVER_ADDRESS, GENERATOR_SERVER_ALLOW_REMOTE, GENERATOR_SERVER_AUTHKEY
+        )
+
+        self.address = address or GENERATOR_SERVER_ADDRESS
+        self.authkey = authkey or GENERATOR_SERVER_AUTHKEY
+        self.allow_remote = GENERATOR_SERVER_ALLOW_REMOTE if allow_remote is None else allow_remote
+        if not self.address:
+            raise ValueError("The generator server needs an address. Set GENERATOR_SERVER_ADDRESS or pass one.")
+        # fail before the models are loaded
+        _require_authkey(self.authkey)
+        _parse_address(self.address, self.allow_remote)
+
+    def serve_forever(self) -> None:
+        from synqtab.reproducibility import ReproducibleOperations
+
+        ReproducibleOperations.keep_models_warm()
+        generator_host = _GeneratorHost()
+        _GeneratorServerManager.register('generator_host', callable=lambda: generator_host, exposed=('generate',))
+        manager = _GeneratorServerManager(
+            address=_parse_address(self.address, self.allow_remote), authkey=_require_authkey(self.authkey)
+        )
+        server = manager.get_server()
+        LOG.info(f"The generator server is listening on {self.address}.")
+        server.serve_forever()
+
+
+class RemoteGenerator(Generator):
+    """Forwards `generate()` to the `GeneratorServer`, together with the current random seed. If the server cannot
+    be reached, the generator runs in-process instead, exactly as it would without a server.
+    """
+
+    _generator_hosts: dict[tuple[int, str], Any] = dict() # one connection per process and address
+
+    def __init__(self, generator_model: GeneratorModel, address: Optional[str] = None, authkey: Optional[str] = None):
+        from synqtab.environment import (
+            GENERATOR_SERVER_ADDRESS, GENERATOR_SERVER_ALLOW_REMOTE, GENERATOR_SERVER_AUTHKEY
+        )
+
+        super().__init__()
+        self.generator_model = generator_model
+        self.address = address or GENERATOR_SERVER_ADDRESS
+        self.authkey = authkey or GENERATOR_SERVER_AUTHKEY
+        self.allow_remote = GENERATOR_SERVER_ALLOW_REMOTE
+
+    def generate(self, X_initial: pd.DataFrame, y_initial: pd.DataFrame, n_samples: int, metadata: dict[str, Any]):
+        from synqtab.mappings.mappings import GENERATOR_MODEL_TO_GENERATOR_INSTANCE
+        from synqtab.reproducibility import ReproducibleOperations
+
+        try:
+            generator_host = self._get_generator_host()
+        except OSError as e:
+            LOG.warning(f"The generator server at {self.address} is unreachable; generating in-process. Error: {e}")
+            return GENERATOR_MODEL_TO_GENERATOR_INSTANCE[self.generator_model].generate(
+                X_initial=X_initial, y_initial=y_initial, n_samples=n_samples, metadata=metadata
+            )
+
+        try:
+            return generator_host.generate(
+                str(self.generator_model), X_initial, y_initial, n_samples, metadata,
+                ReproducibleOperations.get_current_random_seed(),
+            )
+        except (EOFError, OSError):
+            # the server went away; connect anew on the next request
+            self._generator_hosts.pop((os.getpid(), self.address), None)
+            raise
+
+    def _get_generator_host(self):
+        key = (os.getpid(), self.address)
+        if key not in self._generator_hosts:
+            manager = _GeneratorClientManager(
+                address=_parse_address(self.address, self.allow_remote), authkey=_require_authkey(self.authkey)
+            )
+            manager.connect()
+            self._generator_hosts[key] = manager.generator_host()
+        return self._generator_hosts[key]
+
+
+def get_generator_instance(generator_model: GeneratorModel) -> Generator:
+    """Returns the generator to use for the given generator model: a `RemoteGenerator` if a generator server is
+    configured to serve it, otherwise the in-process generator instance.
+    """
+    from synqtab.environment import GENERATOR_SERVER_ADDRESS, GENERATOR_SERVER_MODELS
+    from synqtab.mappings.mappings import GENERATOR_MODEL_TO_GENERATOR_INSTANCE
+
+    if GENERATOR_SERVER_ADDRESS and str(generator_model) in GENERATOR_SERVER_MODELS:
+        return RemoteGenerator(generator_model)
+    return GENERATOR_MODEL_TO_GENERATOR_INSTANCE.get(generator_model)
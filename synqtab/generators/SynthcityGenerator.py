@@ -1,8 +1,6 @@
 from typing import Any
 
 import pandas as pd
-from synthcity.plugins import Plugins
-from synthcity.plugins.core.dataloader import GenericDataLoader
 
 from synqtab.enums.generators import GeneratorModel
 from synqtab.generators.Generator import Generator
@@ -19,6 +17,9 @@ class SynthcityGenerator(Generator):
         self.generator = None
     
     def generate(self, X_initial: pd.DataFrame, y_initial: pd.Series, n_samples: int, metadata: dict[str, Any]):
+        from synthcity.plugins import Plugins
+        from synthcity.plugins.core.dataloader import GenericDataLoader
+
         loader = GenericDataLoader(
             pd.concat([X_initial, y_initial], axis=1),
             target_column=y_initial.name
@@ -7,6 +7,10 @@ class TabPFN(Generator):
     """
     TabPFN synthetic data generator using TabPFN Unsupervised Model.
     """
+    # rough peak of the float32 activations of TabPFN per generated cell (embedding size 192, with the attention
+    # buffers of a layer on top), used to turn a memory budget into a number of rows to generate at a time
+    _activation_bytes_per_cell: int = 4 * 192 * 4
+
     def __init__(self):
         super().__init__()
         self.generator = None
@@ -25,7 +29,7 @@ class TabPFN(Generator):
 
         X_numeric = df[numeric_columns].values
 
-        _categorical_encoded = None
+        X_categorical_encoded = None
         encoder = None
 
         if len(categorical_columns) > 0:
@@ -53,10 +57,8 @@ class TabPFN(Generator):
         # Reversing Ordinal Encoding
         if encoder:
             # Clip values to valid range for each categorical column before inverse_transform
-            synth_cat_clipped = synth_cat_part.copy()
-            for i, categories in enumerate(encoder.categories_):
-                max_idx = len(categories) - 1
-                synth_cat_clipped[:, i] = np.clip(synth_cat_clipped[:, i], 0, max_idx)
+            max_indices = np.array([len(categories) - 1 for categories in encoder.categories_])
+            synth_cat_clipped = np.clip(synth_cat_part, 0, max_indices)
             synth_cat_decoded = encoder.inverse_transform(synth_cat_clipped.astype(int))
             synth_cat_df = pd.DataFrame(synth_cat_decoded, columns=categorical_columns)
         else:
@@ -77,10 +79,42 @@ class TabPFN(Generator):
         return synth_final
 
     def _generate_synthetic_data(self, data_tensor, n_samples):
+        import numpy as np
+        import torch
+        from synqtab.environment import TABPFN_NUM_THREADS
         from synqtab.reproducibility import ReproducibleOperations
 
         self.generator = ReproducibleOperations.get_tabpfn_unsupervised_model()
         self.generator.fit(data_tensor)
-        synthetic_tensor = self.generator.generate_synthetic_data(n_samples=n_samples)
-        synthetic_data = synthetic_tensor.detach().numpy()
-        return synthetic_data
+
+        previous_num_threads = torch.get_num_threads()
+        if TABPFN_NUM_THREADS > 0:
+            torch.set_num_threads(TABPFN_NUM_THREADS)
+        try:
+            batch_rows = self._generation_batch_rows(n_samples, n_features=data_tensor.shape[1])
+            if batch_rows >= n_samples:
+                synthetic_tensor = self.generator.generate_synthetic_data(n_samples=n_samples)
+                return synthetic_tensor.detach().numpy()
+
+            # generate the rows chunk by chunk, so that the peak memory depends on the chunk and not on n_samples
+            synthetic_data = np.empty((n_samples, data_tensor.shape[1]), dtype=np.float32)
+            for start in range(0, n_samples, batch_rows):
+                stop = min(start + batch_rows, n_samples)
+                with torch.no_grad():
+                    synthetic_tensor = self.generator.generate_synthetic_data(n_samples=stop - start)
+                synthetic_data[start:stop] = synthetic_tensor.detach().cpu().numpy()
+            return synthetic_data
+        finally:
+            torch.set_num_threads(previous_num_threads)
+
+    def _generation_batch_rows(self, n_samples: int, n_features: int) -> int:
+        """The number of rows to generate at a time: `TABPFN_GENERATION_BATCH_ROWS`, further capped so that the
+        estimated activations of a chunk fit in `TABPFN_GENERATION_MEMORY_BYTES`. All rows at once if neither is set.
+        """
+        from synqtab.environment import TABPFN_GENERATION_BATCH_ROWS, TABPFN_GENERATION_MEMORY_BYTES
+
+        batch_rows = TABPFN_GENERATION_BATCH_ROWS if TABPFN_GENERATION_BATCH_ROWS > 0 else n_samples
+        if TABPFN_GENERATION_MEMORY_BYTES > 0:
+            bytes_per_row = max(1, n_features) * self._activation_bytes_per_cell
+            batch_rows = min(batch_rows, TABPFN_GENERATION_MEMORY_BYTES // bytes_per_row)
+        return max(1, min(batch_rows, n_samples))
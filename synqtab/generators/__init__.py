@@ -4,6 +4,7 @@ Contains classes for generating synthetic tabular data.
 """
 
 from .Generator import Generator
+from .GeneratorServer import GeneratorServer, RemoteGenerator, get_generator_instance
 from .RealTabTransformer import RealTabTransformer
 from .SynthcityGenerator import SynthcityGenerator
 from .TabEBM import TabEBM
@@ -11,6 +12,9 @@ from .TabPFN import TabPFN
 
 __all__ = [
     'Generator',
+    'GeneratorServer',
+    'RemoteGenerator',
+    'get_generator_instance',
     'SynthcityGenerator',
     'RealTabTransformer',
     'SynthcityGenerator',
@@ -0,0 +1,70 @@
+import threading
+from collections.abc import Mapping
+from importlib import import_module
+from typing import Any, Hashable, Iterator
+
+
+class LazyReference():
+    """An entry-point-style reference to an attribute of a module, e.g., `'synqtab.generators.TabPFN:TabPFN'`."""
+
+    def __init__(self, target: str):
+        self.target = target
+
+    def resolve(self) -> Any:
+        module_name, _, attribute_name = self.target.partition(':')
+        return getattr(import_module(module_name), attribute_name)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.target!r})"
+
+
+class LazyInstance(LazyReference):
+    """A `LazyReference` to a class (or any callable) that resolves to the result of calling it with the given
+    arguments, e.g., `LazyInstance('synqtab.generators.TabPFN:TabPFN')` resolves to `TabPFN()`.
+    """
+
+    def __init__(self, target: str, *args, **kwargs):
+        super().__init__(target)
+        self.args = args
+        self.kwargs = kwargs
+
+    def resolve(self) -> Any:
+        return super().resolve()(*self.args, **self.kwargs)
+
+
+class LazyRegistry(Mapping):
+    """A read-only mapping whose values are given as `LazyReference`s (or plain `'module:attribute'` strings) and
+    are only imported the first time they are looked up. Importing the registry thus costs nothing, and looking up
+    a single entry only imports the module of that entry, e.g., a task-listing script that only needs the
+    experiment classes never imports torch through the generators. Resolved values are kept, so every lookup
+    returns the same object, exactly like a plain dict would.
+    """
+
+    def __init__(self, references: dict[Hashable, LazyReference | str]):
+        self._references = {
+            key: reference if isinstance(reference, LazyReference) else LazyReference(reference)
+            for key, reference in references.items()
+        }
+        self._values: dict[Hashable, Any] = dict()
+        self._lock = threading.RLock()
+
+    def __getitem__(self, key: Hashable) -> Any:
+        if key in self._values:
+            return self._values[key]
+        reference = self._references[key] # raises KeyError for unknown keys, like a dict
+        with self._lock:
+            if key not in self._values:
+                self._values[key] = reference.resolve()
+            return self._values[key]
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self._references)
+
+    def __len__(self) -> int:
+        return len(self._references)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._references
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._references!r})"
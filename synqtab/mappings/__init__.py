@@ -1,3 +1,4 @@
+from .LazyRegistry import LazyInstance, LazyReference, LazyRegistry
 from .mappings import (
     DATA_ERROR_TYPE_TO_DATA_ERROR_CLASS,
     EXPERIMENT_TYPE_TO_EXPERIMENT_CLASS,
@@ -8,6 +9,9 @@ from .mappings import (
 )
 
 __all__ = [
+    'LazyInstance',
+    'LazyReference',
+    'LazyRegistry',
     'DATA_ERROR_TYPE_TO_DATA_ERROR_CLASS',
     'EXPERIMENT_TYPE_TO_EXPERIMENT_CLASS',
     'GENERATOR_MODEL_TO_GENERATOR_INSTANCE',
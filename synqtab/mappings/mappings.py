@@ -3,81 +3,68 @@ from synqtab.enums import (
     GeneratorModel, EvaluationMethod,
     EvaluationTarget
 )
-from synqtab.errors import (
-    DataError, CategoricalShift, GaussianNoise, LabelError,
-    Placeholder, NearDuplicateRow, Outlier, Inconsistency
-)
-from synqtab.evaluators import (
-    Evaluator, DCREvaluator, DesbordanteFDs,
-    DisclosureProtectionEvaluator, HyFD,
-    IsolationForestEvaluator, LofEvaluator,
-    MLAugmentationPrecision, MLAugmentationRecall,
-    MLAugmentationRegression, MLEfficacy, QualityEvaluator,
-)
-from synqtab.experiments import (
-    Experiment, NormalExperiment, PrivacyExperiment,
-    AugmentationExperiment, RebalancingExperiment
-)
-from synqtab.generators import (
-    Generator, SynthcityGenerator,
-    RealTabTransformer, TabEBM, TabPFN
-)
+from synqtab.mappings.LazyRegistry import LazyInstance, LazyRegistry
+
+
+# The registries import their classes on first lookup, so that importing this module does not import every error,
+# experiment, evaluator and generator (and, through them, synthcity and torch).
 
+DATA_ERROR_TYPE_TO_DATA_ERROR_CLASS = LazyRegistry({
+    DataErrorType.CATEGORICAL_SHIFT: 'synqtab.errors.CategoricalShift:CategoricalShift',
+    DataErrorType.GAUSSIAN_NOISE: 'synqtab.errors.GaussianNoise:GaussianNoise',
+    DataErrorType.INCONSISTENCY: 'synqtab.errors.Inconsistency:Inconsistency',
+    DataErrorType.LABEL_ERROR: 'synqtab.errors.LabelError:LabelError',
+    DataErrorType.NEAR_DUPLICATE: 'synqtab.errors.NearDuplicateRow:NearDuplicateRow',
+    DataErrorType.OUTLIER: 'synqtab.errors.Outlier:Outlier',
+    DataErrorType.PLACEHOLDER: 'synqtab.errors.Placeholder:Placeholder',
+})
 
-DATA_ERROR_TYPE_TO_DATA_ERROR_CLASS: dict[DataErrorType, DataError.__class__] = {
-    DataErrorType.CATEGORICAL_SHIFT: CategoricalShift,
-    DataErrorType.GAUSSIAN_NOISE: GaussianNoise,
-    DataErrorType.INCONSISTENCY: Inconsistency,
-    DataErrorType.LABEL_ERROR: LabelError,
-    DataErrorType.NEAR_DUPLICATE: NearDuplicateRow,
-    DataErrorType.OUTLIER: Outlier,
-    DataErrorType.PLACEHOLDER: Placeholder,
-}
 
+EXPERIMENT_TYPE_TO_EXPERIMENT_CLASS = LazyRegistry({
+    ExperimentType.NORMAL: 'synqtab.experiments.NormalExperiment:NormalExperiment',
+    ExperimentType.PRIVACY: 'synqtab.experiments.PrivacyExperiment:PrivacyExperiment',
+    ExperimentType.AUGMENTATION: 'synqtab.experiments.AugmentationExperiment:AugmentationExperiment',
+    ExperimentType.REBALANCING: 'synqtab.experiments.RebalancingExperiment:RebalancingExperiment',
+})
 
-EXPERIMENT_TYPE_TO_EXPERIMENT_CLASS: dict[ExperimentType, Experiment.__class__] = {
-    ExperimentType.NORMAL: NormalExperiment,
-    ExperimentType.PRIVACY: PrivacyExperiment,
-    ExperimentType.AUGMENTATION: AugmentationExperiment,
-    ExperimentType.REBALANCING: RebalancingExperiment,
-}
 
+_SYNTHCITY_GENERATOR = 'synqtab.generators.SynthcityGenerator:SynthcityGenerator'
 
-GENERATOR_MODEL_TO_GENERATOR_INSTANCE: dict[GeneratorModel, Generator] = {
-    GeneratorModel.CTGAN: SynthcityGenerator(GeneratorModel.CTGAN),
-    GeneratorModel.NFLOW: SynthcityGenerator(GeneratorModel.NFLOW),
-    GeneratorModel.RTVAE: SynthcityGenerator(GeneratorModel.RTVAE),
-    GeneratorModel.TVAE: SynthcityGenerator(GeneratorModel.TVAE),
-    GeneratorModel.DDPM: SynthcityGenerator(GeneratorModel.DDPM),
-    GeneratorModel.ARF: SynthcityGenerator(GeneratorModel.ARF),
-    GeneratorModel.MARGINAL_DISTRIBUTIONS: SynthcityGenerator(GeneratorModel.MARGINAL_DISTRIBUTIONS),
-    GeneratorModel.BAYESIAN_NETWORK: SynthcityGenerator(GeneratorModel.BAYESIAN_NETWORK),
-    GeneratorModel.GREAT: SynthcityGenerator(GeneratorModel.GREAT),
-    GeneratorModel.REALTABFORMER: RealTabTransformer(),
-    GeneratorModel.TABPFN: TabPFN(),
-    GeneratorModel.TABEBM: TabEBM(),
-    GeneratorModel.ADSGAN: SynthcityGenerator(GeneratorModel.ADSGAN),
-    GeneratorModel.PATEGAN: SynthcityGenerator(GeneratorModel.PATEGAN),
-    GeneratorModel.AIM: SynthcityGenerator(GeneratorModel.AIM),
-    GeneratorModel.DPGAN: SynthcityGenerator(GeneratorModel.DPGAN),
-    GeneratorModel.DECAF: SynthcityGenerator(GeneratorModel.DECAF),
-    GeneratorModel.PRIVBAYES: SynthcityGenerator(GeneratorModel.PRIVBAYES),
-}
+GENERATOR_MODEL_TO_GENERATOR_INSTANCE = LazyRegistry({
+    GeneratorModel.CTGAN: LazyInstance(_SYNTHCITY_GENERATOR, GeneratorModel.CTGAN),
+    GeneratorModel.NFLOW: LazyInstance(_SYNTHCITY_GENERATOR, GeneratorModel.NFLOW),
+    GeneratorModel.RTVAE: LazyInstance(_SYNTHCITY_GENERATOR, GeneratorModel.RTVAE),
+    GeneratorModel.TVAE: LazyInstance(_SYNTHCITY_GENERATOR, GeneratorModel.TVAE),
+    GeneratorModel.DDPM: LazyInstance(_SYNTHCITY_GENERATOR, GeneratorModel.DDPM),
+    GeneratorModel.ARF: LazyInstance(_SYNTHCITY_GENERATOR, GeneratorModel.ARF),
+    GeneratorModel.MARGINAL_DISTRIBUTIONS: LazyInstance(_SYNTHCITY_GENERATOR, GeneratorModel.MARGINAL_DISTRIBUTIONS),
+    GeneratorModel.BAYESIAN_NETWORK: LazyInstance(_SYNTHCITY_GENERATOR, GeneratorModel.BAYESIAN_NETWORK),
+    GeneratorModel.GREAT: LazyInstance(_SYNTHCITY_GENERATOR, GeneratorModel.GREAT),
+    GeneratorModel.REALTABFORMER: LazyInstance('synqtab.generators.RealTabTransformer:RealTabTransformer'),
+    GeneratorModel.TABPFN: LazyInstance('synqtab.generators.TabPFN:TabPFN'),
+    GeneratorModel.TABEBM: LazyInstance('synqtab.generators.TabEBM:TabEBM'),
+    GeneratorModel.ADSGAN: LazyInstance(_SYNTHCITY_GENERATOR, GeneratorModel.ADSGAN),
+    GeneratorModel.PATEGAN: LazyInstance(_SYNTHCITY_GENERATOR, GeneratorModel.PATEGAN),
+    GeneratorModel.AIM: LazyInstance(_SYNTHCITY_GENERATOR, GeneratorModel.AIM),
+    GeneratorModel.DPGAN: LazyInstance(_SYNTHCITY_GENERATOR, GeneratorModel.DPGAN),
+    GeneratorModel.DECAF: LazyInstance(_SYNTHCITY_GENERATOR, GeneratorModel.DECAF),
+    GeneratorModel.PRIVBAYES: LazyInstance(_SYNTHCITY_GENERATOR, GeneratorModel.PRIVBAYES),
+})
 
 
-EVALUATION_METHOD_TO_EVALUATION_CLASS: dict[EvaluationMethod, Evaluator.__class__] = {
-    EvaluationMethod.DCR: DCREvaluator,
-    EvaluationMethod.DFD: DesbordanteFDs,
-    EvaluationMethod.DPR: DisclosureProtectionEvaluator,
-    EvaluationMethod.HFD: HyFD,
-    EvaluationMethod.IFO: IsolationForestEvaluator,
-    EvaluationMethod.LOF: LofEvaluator,
-    EvaluationMethod.APR: MLAugmentationPrecision,
-    EvaluationMethod.ARC: MLAugmentationRecall,
-    EvaluationMethod.AR2: MLAugmentationRegression,
-    EvaluationMethod.EFF: MLEfficacy,
-    EvaluationMethod.QLT: QualityEvaluator,
-}
+EVALUATION_METHOD_TO_EVALUATION_CLASS = LazyRegistry({
+    EvaluationMethod.DCR: 'synqtab.evaluators.DCREvaluator:DCREvaluator',
+    EvaluationMethod.DFD: 'synqtab.evaluators.DesbordanteFDs:DesbordanteFDs',
+    EvaluationMethod.DPR: 'synqtab.evaluators.DisclosureProtectionEvaluator:DisclosureProtectionEvaluator',
+    EvaluationMethod.HFD: 'synqtab.evaluators.HyFD:HyFD',
+    EvaluationMethod.IFO: 'synqtab.evaluators.IsolationForestEvaluator:IsolationForestEvaluator',
+    EvaluationMethod.LOF: 'synqtab.evaluators.LofEvaluator:LofEvaluator',
+    EvaluationMethod.APR: 'synqtab.evaluators.MLAugmentationPrecision:MLAugmentationPrecision',
+    EvaluationMethod.ARC: 'synqtab.evaluators.MLAugmentationRecall:MLAugmentationRecall',
+    EvaluationMethod.AR2: 'synqtab.evaluators.MLAugmentationRegression:MLAugmentationRegression',
+    EvaluationMethod.EFF: 'synqtab.evaluators.MLEfficacy:MLEfficacy',
+    EvaluationMethod.QLT: 'synqtab.evaluators.QualityEvaluator:QualityEvaluator',
+})
 
 SINGULAR_EVALUATION_TARGETS: list[tuple[EvaluationTarget]] = [
     (EvaluationTarget.R,), # each one is a tuple for consistent handling with dual evaluation targets
@@ -1,6 +1,7 @@
+import threading
+from contextlib import contextmanager
 from typing import List, Optional, Tuple
 
-from matplotlib.pylab import seed
 
 class Singleton(type):
     _instances = {}
@@ -13,23 +14,147 @@ class Singleton(type):
 
 class _RandomSeedOperations:
     _random_seed: int | float = None
+    _streams = threading.local() # the active random stream and the default stream of each thread
+    _legacy_mode: str = 'legacy'
+    _streams_mode: str = 'streams'
+    _warm_models: dict = dict() # prior-fitted models that keep their weights loaded, if `keep_models_warm()`
+    _keep_models_warm: bool = False
 
 
 class ReproducibleOperations(_RandomSeedOperations, metaclass=Singleton):
 
     @classmethod
-    def _ensure_reproducibility(self) -> None:
+    def _ensure_reproducibility(self):
+        """Returns the source of randomness for the next operation: the active `random_stream()` of the thread, if any.
+        Otherwise, in legacy mode, the global numpy random state, freshly reseeded with the random seed; in streams
+        mode, the default generator of the thread, which is derived from the random seed.
+        """
         import numpy as np
-        from synqtab.reproducibility import ReproducibilityError
+        from synqtab.environment import RNG_MODE
         
-        if self._random_seed:
-            np.random.seed(self._random_seed)
-            return
-        raise ReproducibilityError(
-            f"The reproducibility of the requested operation that involves randomness cannot be ensured. \
-                Make sure to call the set_random_seed(some_seed) function at least once in your program."
+        self._require_random_seed()
+        active_generator = getattr(self._streams, 'active', None)
+        if active_generator is not None:
+            return active_generator
+
+        if RNG_MODE == self._streams_mode:
+            if getattr(self._streams, 'default_seed', None) != self._random_seed:
+                self._streams.default = self.get_generator('default')
+                self._streams.default_seed = self._random_seed
+            return self._streams.default
+
+        np.random.seed(self._random_seed)
+        return np.random
+
+    @classmethod
+    def _require_random_seed(cls) -> None:
+        from synqtab.reproducibility import ReproducibilityError
+
+        if not cls._random_seed:
+            raise ReproducibilityError(
+                "The reproducibility of the requested operation that involves randomness cannot be ensured. \
+                    Make sure to call the set_random_seed(some_seed) function at least once in your program."
+            )
+
+    @classmethod
+    def _seed_sequence(cls, purpose: str, experiment_id: Optional[str] = None):
+        import hashlib
+        import numpy as np
+
+        def stable_key(text: str) -> int:
+            # unlike hash(), stable across processes and interpreter runs
+            return int.from_bytes(hashlib.sha256(text.encode()).digest()[:8], 'little')
+
+        cls._require_random_seed()
+        # the same derivation as SeedSequence.spawn(), but the children are keyed by what they are used for
+        # instead of by the order in which they are spawned
+        return np.random.SeedSequence(
+            entropy=int(cls._random_seed),
+            spawn_key=(stable_key(experiment_id or ''), stable_key(purpose)),
         )
 
+    @classmethod
+    def get_generator(cls, purpose: str, experiment_id: Optional[str] = None):
+        """Returns a new `np.random.Generator` whose stream is fully determined by the random seed, the experiment
+        and the purpose. Independent of global state and of any other stream, so it is safe to use from any thread.
+
+        Args:
+            purpose (str): what the randomness is used for, e.g., 'corruption'.
+            experiment_id (str, optional): the experiment the randomness belongs to. Defaults to None.
+
+        Returns:
+            np.random.Generator: a generator at the start of its stream.
+        """
+        import numpy as np
+
+        return np.random.Generator(np.random.PCG64(cls._seed_sequence(purpose, experiment_id)))
+
+    @classmethod
+    def spawn_generators(cls, how_many: int, purpose: str, experiment_id: Optional[str] = None) -> list:
+        """Spawns `how_many` independent generators from the stream of `get_generator(purpose, experiment_id)`, e.g.,
+        one per parallel worker or thread, so that each chunk of work gets the same randomness however it is scheduled.
+        """
+        import numpy as np
+
+        return [
+            np.random.Generator(np.random.PCG64(seed_sequence))
+            for seed_sequence in cls._seed_sequence(purpose, experiment_id).spawn(how_many)
+        ]
+
+    @classmethod
+    def derive_seed(cls, purpose: str, experiment_id: Optional[str] = None) -> int:
+        """Returns an integer seed for libraries that only accept integers (e.g., scikit-learn's `random_state`)."""
+        return int(cls._seed_sequence(purpose, experiment_id).generate_state(1)[0])
+
+    @classmethod
+    def _seed_for(cls, purpose: str) -> int | float:
+        """The seed of a model or a split: the random seed itself in legacy mode, a derived seed in streams mode."""
+        from synqtab.environment import RNG_MODE
+
+        if RNG_MODE == cls._streams_mode:
+            return cls.derive_seed(purpose)
+        return cls._random_seed
+
+    @classmethod
+    @contextmanager
+    def random_stream(cls, purpose: str, experiment_id: Optional[str] = None):
+        """Within this context, all operations of this class in the current thread draw from the stream of
+        `get_generator(purpose, experiment_id)`, one after the other, instead of the global numpy random state.
+        Only takes effect in streams mode (`RNG_MODE=streams`); in legacy mode, the operations keep reseeding the
+        global state, which reproduces the results of the runs that preceded the streams.
+
+        Yields:
+            np.random.Generator | None: the active generator, or None in legacy mode.
+        """
+        from synqtab.environment import RNG_MODE
+
+        if RNG_MODE != cls._streams_mode:
+            yield None
+            return
+
+        with cls.use_generator(cls.get_generator(purpose, experiment_id)) as generator:
+            yield generator
+
+    @classmethod
+    @contextmanager
+    def use_generator(cls, generator):
+        """Within this context, all operations of this class in the current thread draw from the given generator,
+        whatever the RNG mode. Unlike `random_stream()`, it also takes effect in legacy mode, for code whose draws
+        must be independent of each other there as well.
+
+        Args:
+            generator (np.random.Generator): the generator to draw from, e.g., one of `get_generator()`.
+
+        Yields:
+            np.random.Generator: the given generator.
+        """
+        previous_generator = getattr(cls._streams, 'active', None)
+        cls._streams.active = generator
+        try:
+            yield generator
+        finally:
+            cls._streams.active = previous_generator
+
     @classmethod
     def seed_everything(self) -> None:
         """
@@ -85,9 +210,8 @@ class ReproducibleOperations(_RandomSeedOperations, metaclass=Singleton):
         if len(elements) <= how_many:
             return elements
         
-        import numpy as np
-        cls._ensure_reproducibility()
-        return np.random.choice(
+        random_state = cls._ensure_reproducibility()
+        return random_state.choice(
             a=elements,
             size=max(int(how_many), at_least),
             replace=sampling_with_replacement,
@@ -100,46 +224,53 @@ class ReproducibleOperations(_RandomSeedOperations, metaclass=Singleton):
         """Wraps a call to `np.random.uniform` for reproducibility purposes. For more info
         see https://numpy.org/devdocs/reference/random/generated/numpy.random.uniform.html.
         """
-        import numpy as np
-        
-        cls._ensure_reproducibility()
-        return np.random.uniform(low=low, high=high, size=size)
+        random_state = cls._ensure_reproducibility()
+        return random_state.uniform(low=low, high=high, size=size)
 
     @classmethod
     def normal(cls, loc: float, scale: float, size: int | Tuple[int]):
         """Wraps a call to `np.random.normal` for reproducibility purposes. For more info
         see https://numpy.org/devdocs/reference/random/generated/numpy.random.normal.html.
         """
-        import numpy as np
-        
-        cls._ensure_reproducibility()
-        return np.random.normal(loc=loc, scale=scale, size=size)
+        random_state = cls._ensure_reproducibility()
+        return random_state.normal(loc=loc, scale=scale, size=size)
     
     @classmethod
-    def derangement(cls, x):
-        """Wraps a call to `np.random.permutation` for reproducibility purposes. For more info
-        see https://numpy.org/devdocs/reference/random/generated/numpy.random.permutation.html.
-        The function returns a **derangement**, i.e., there is no element that remains in its
-        original position. This is performed by generating consecutive permutations with the same
-        random seed, until the first derangement is found and returned.
+    def derangement(cls, x, method: str = 'rejection'):
+        """Returns a **derangement** of `x`, i.e., a permutation where no element remains in its original
+        position. The elements of `x` are expected to be distinct (e.g., the categories of a column). Two methods:
+        - 'rejection' (default): draws permutations (see `np.random.permutation`) until the first derangement, which is
+        sampled uniformly among all derangements. The fixed-point check is vectorized and about e ~ 2.72 draws are
+        needed on average, so this is O(n) in expectation. It returns exactly what the earlier, element-by-element
+        check returned for the same random seed.
+        - 'cycle': arranges the elements in a single random cycle (the outcome of Sattolo's algorithm) with one
+        permutation and one shift, in O(n) without any rejection. Not uniform among all derangements, since it never
+        produces derangements made of several cycles (e.g., swaps of pairs).
         """
-        if len(x) == 1:
+        import numpy as np
+
+        if len(x) <= 1:
             return x
         
-        import numpy as np
-        cls._ensure_reproducibility()
+        random_state = cls._ensure_reproducibility()
+        elements = np.asarray(x)
         
-        while True:
-            permutation = np.random.permutation(x=x)
-            
-            permutation_is_a_derangement = True
-            for original_element, permuted_element in zip(x, permutation):
-                if original_element == permuted_element:
-                    permutation_is_a_derangement = False
-                    break
-            
-            if permutation_is_a_derangement:
-                return permutation
+        match method:
+            case 'rejection':
+                while True:
+                    permutation = random_state.permutation(x)
+                    if not np.any(np.asarray(permutation) == elements):
+                        return permutation
+
+            case 'cycle':
+                cycle_order = random_state.permutation(len(elements))
+                derangement = np.empty_like(elements)
+                # every element takes the place of its predecessor in the cycle
+                derangement[cycle_order] = elements[np.roll(cycle_order, -1)]
+                return derangement
+
+            case _:
+                raise ValueError(f"Unknown derangement method '{method}'. Valid options: ['rejection', 'cycle'].")
 
     @classmethod
     def shuffle_reindex_dataframe(cls, df):
@@ -151,9 +282,12 @@ class ReproducibleOperations(_RandomSeedOperations, metaclass=Singleton):
         Returns:
             pd.DataFrame: the shuffled pandas dataframe.
         """
+        import numpy as np
+
         # pandas uses numpy's random seed internally: https://stackoverflow.com/a/52375474
-        cls._ensure_reproducibility() 
-        return df.sample(frac=1, replace=False).reset_index(drop=True)
+        random_state = cls._ensure_reproducibility()
+        random_state = random_state if isinstance(random_state, np.random.Generator) else None
+        return df.sample(frac=1, replace=False, random_state=random_state).reset_index(drop=True)
 
     @classmethod
     def train_test_split(
@@ -192,7 +326,7 @@ class ReproducibleOperations(_RandomSeedOperations, metaclass=Singleton):
                 train_size=train_size,
                 shuffle=shuffle,
                 stratify=stratify,
-                random_state=cls._random_seed,
+                random_state=cls._seed_for('train_test_split'),
             )
 
         # ELSE IF problem_type == ProblemType.REGRESSION:
@@ -226,7 +360,7 @@ class ReproducibleOperations(_RandomSeedOperations, metaclass=Singleton):
             train_size=train_size,
             shuffle=shuffle,
             stratify=final_stratify,
-            random_state=cls._random_seed,
+            random_state=cls._seed_for('train_test_split'),
         )
 
         return train_df, test_df
@@ -248,7 +382,7 @@ class ReproducibleOperations(_RandomSeedOperations, metaclass=Singleton):
         return IsolationForest(
             n_estimators=n_estimators,
             contamination=contamination,
-            random_state=cls._random_seed
+            random_state=cls._seed_for('isolation_forest')
         )
         
     @classmethod
@@ -266,21 +400,44 @@ class ReproducibleOperations(_RandomSeedOperations, metaclass=Singleton):
         
         return RandomForestRegressor(
             n_estimators=n_estimators,
-            random_state=cls._random_seed,
+            random_state=cls._seed_for('random_forest_regressor'),
             n_jobs=-1
         )
     
+    @classmethod
+    def keep_models_warm(cls, enabled: bool = True) -> None:
+        """Makes the getters of prior-fitted models (TabPFN, TabEBM) hand out the same model instances on every call,
+        re-seeded for the current random seed, so that their weights are loaded once per process and not once per
+        call. Meant for long-lived processes that generate data for many experiments, e.g., the `GeneratorServer`.
+        The instances are shared, so the caller must not use them from several threads at the same time.
+        """
+        cls._keep_models_warm = enabled
+        if not enabled:
+            cls._warm_models.clear()
+
+    @classmethod
+    def _get_warm_model(cls, model_name: str, create_model):
+        if not cls._keep_models_warm:
+            return create_model()
+        if model_name not in cls._warm_models:
+            cls._warm_models[model_name] = create_model()
+        return cls._warm_models[model_name]
+
     @classmethod
     def get_tabpfn_classifier_model(cls):
         from tabpfn_extensions import TabPFNClassifier
         
-        return TabPFNClassifier(random_state=cls._random_seed)
+        classifier = cls._get_warm_model('tabpfn_classifier', TabPFNClassifier)
+        classifier.random_state = cls._seed_for('tabpfn_classifier')
+        return classifier
     
     @classmethod
     def get_tabpfn_regression_model(cls):
         from tabpfn_extensions import TabPFNRegressor
         
-        return TabPFNRegressor(random_state=cls._random_seed)
+        regressor = cls._get_warm_model('tabpfn_regressor', TabPFNRegressor)
+        regressor.random_state = cls._seed_for('tabpfn_regressor')
+        return regressor
     
     @classmethod
     def get_tabpfn_unsupervised_model(cls):
@@ -296,7 +453,7 @@ class ReproducibleOperations(_RandomSeedOperations, metaclass=Singleton):
         
         cls._ensure_reproducibility()
         cls.seed_everything()
-        return TabEBM()
+        return cls._get_warm_model('tabebm', TabEBM)
     
     @classmethod
     def get_realtabformer_model(cls, model_type='tabular', gradient_accumulation_steps=4, logging_steps=100):
@@ -309,7 +466,7 @@ class ReproducibleOperations(_RandomSeedOperations, metaclass=Singleton):
             model_type=model_type,
             gradient_accumulation_steps=gradient_accumulation_steps,
             logging_steps=logging_steps,
-            random_state=cls._random_seed,
+            random_state=cls._seed_for('realtabformer'),
             epochs=500,
             batch_size=64,
         )
@@ -0,0 +1,95 @@
+import json
+import time
+from typing import Optional, Self
+
+from synqtab.enums import MinioBucket
+from synqtab.utils import get_logger
+
+
+LOG = get_logger(__file__)
+
+
+class TaskLease():
+    """A lease on a task of the `tasks` bucket. The lease is an object in the `task-leases` bucket under the same key as
+    the task itself. It is created with a conditional write (If-None-Match), so exactly one worker can hold it at a time.
+    Leases older than `lease_seconds` are considered abandoned (e.g., the worker crashed) and can be taken over with a
+    compare-and-swap on the ETag of the stale lease, which is again atomic. For the same reason, a lease is renewed and
+    released (i.e., expired) only if its ETag is still the one of our own write.
+    """
+
+    def __init__(self, task_key: str, worker_id: str, lease_seconds: int):
+        self.task_key = task_key
+        self.worker_id = worker_id
+        self.lease_seconds = lease_seconds
+        self._etag: Optional[str] = None # the ETag of our last write of the lease
+
+    @property
+    def is_held(self) -> bool:
+        return self._etag is not None
+
+    def _lease_body(self, expires_at: Optional[float] = None) -> bytes:
+        return json.dumps({
+            'worker_id': self.worker_id,
+            'expires_at': time.time() + self.lease_seconds if expires_at is None else expires_at,
+        }).encode('utf-8')
+
+    def acquire(self) -> bool:
+        from synqtab.data import MinioClient
+
+        self._etag = MinioClient.put_object_if_absent(MinioBucket.TASK_LEASES, self.task_key, self._lease_body())
+        if self.is_held:
+            return True
+
+        existing_lease = MinioClient.get_object_with_etag(MinioBucket.TASK_LEASES, self.task_key)
+        if existing_lease is None: # released between our two calls; let the next listing round pick it up
+            return False
+
+        lease_body, lease_etag = existing_lease
+        if json.loads(lease_body).get('expires_at', 0) > time.time():
+            return False
+
+        LOG.info(f"Lease of task {self.task_key} has expired. Worker {self.worker_id} attempts to take it over.")
+        self._etag = MinioClient.put_object_if_match(
+            MinioBucket.TASK_LEASES, self.task_key, self._lease_body(), etag=lease_etag
+        )
+        return self.is_held
+
+    def renew(self) -> bool:
+        """Extends the lease by another `lease_seconds`, with a compare-and-swap on the ETag of our last write, e.g.,
+        between the evaluations of a long task.
+
+        Returns:
+            bool: True if the lease is still ours, False if it expired and another worker has taken it over.
+        """
+        from synqtab.data import MinioClient
+
+        if not self.is_held:
+            return False
+        self._etag = MinioClient.put_object_if_match(
+            MinioBucket.TASK_LEASES, self.task_key, self._lease_body(), etag=self._etag
+        )
+        if not self.is_held:
+            LOG.warning(f"Lease of task {self.task_key} was taken over before worker {self.worker_id} renewed it.")
+        return self.is_held
+
+    def release(self) -> None:
+        """Expires the lease with a compare-and-swap on the ETag of our last write, so that the next worker can take
+        it over at once. The lease is overwritten rather than deleted, because a delete cannot be made conditional on
+        every S3 implementation, and an unconditional one could delete the lease of a worker that has just taken it
+        over. If the lease is not ours anymore, it is left alone.
+        """
+        from synqtab.data import MinioClient
+
+        if not self.is_held:
+            return
+        if not MinioClient.put_object_if_match(
+            MinioBucket.TASK_LEASES, self.task_key, self._lease_body(expires_at=0), etag=self._etag
+        ):
+            LOG.warning(f"Lease of task {self.task_key} was taken over before worker {self.worker_id} released it.")
+        self._etag = None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.release()
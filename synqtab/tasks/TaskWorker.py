@@ -0,0 +1,245 @@
+import os
+import random
+import socket
+import time
+import uuid
+from collections import Counter, defaultdict
+from typing import Any, Callable, Optional
+
+from synqtab.enums import MinioBucket, TaskStatus
+from synqtab.utils import get_logger
+
+
+LOG = get_logger(__file__)
+
+
+class TaskWorker():
+    """Drains the `tasks` bucket that is populated by `Evaluation.publish_task_if_valid()` (one evaluation per task)
+    and `EvaluationBatch.publish_task_if_valid()` (all evaluations of the same targets per task). Tasks are grouped by
+    experiment and each group is handed to a process of a pool, so that the processes of the node work on different
+    experiments. Every single task is claimed through a `TaskLease` before it runs, which makes it safe to start
+    multiple workers on the same or on different nodes. Once a task is done, it is moved to the bucket that
+    corresponds to its outcome (finished, failed or skipped).
+    """
+
+    _task_key_delimiter: str = '/' # task keys are <experiment_id>/<evaluation_id or batch id>, see publish_task_if_valid()
+
+    def __init__(
+        self,
+        processes: Optional[int] = None,
+        prefix: str = "",
+        follow: bool = False,
+        lease_seconds: Optional[int] = None,
+        poll_seconds: Optional[int] = None,
+    ):
+        from synqtab.environment import TASK_WORKER_PROCESSES, TASK_LEASE_SECONDS, TASK_POLL_SECONDS
+
+        self.processes = processes or TASK_WORKER_PROCESSES
+        self.prefix = prefix
+        self.follow = follow
+        self.lease_seconds = lease_seconds or TASK_LEASE_SECONDS
+        self.poll_seconds = poll_seconds or TASK_POLL_SECONDS
+        self.worker_id = f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+
+    def run(self) -> Counter:
+        """Processes tasks until the queue is empty, or forever if the worker was created with `follow=True`.
+
+        Returns:
+            Counter: number of tasks per `TaskStatus` processed by this worker.
+        """
+        from concurrent.futures import as_completed
+        from concurrent.futures.process import BrokenProcessPool
+        from synqtab.data import MinioClient
+
+        MinioClient.ensure_bucket_exists(MinioBucket.TASKS)
+        MinioClient.ensure_bucket_exists(MinioBucket.TASK_LEASES)
+        LOG.info(f"Worker {self.worker_id} starts draining the tasks queue with {self.processes} processes.")
+
+        total_statuses = Counter()
+        pool = self._create_pool()
+        try:
+            while True:
+                task_groups = self._list_task_groups()
+                round_statuses = Counter()
+                pool_is_broken = False
+                futures = [
+                    pool.submit(_process_task_group, task_keys, self.worker_id, self.lease_seconds)
+                    for task_keys in task_groups
+                ]
+                for future in as_completed(futures):
+                    try:
+                        round_statuses.update(future.result())
+                    except BrokenProcessPool as e:
+                        # a process died (e.g., out of memory). Its leases expire and its tasks are retried later on
+                        LOG.error(f"A process of worker {self.worker_id} died unexpectedly. Error: {e}")
+                        pool_is_broken = True
+
+                if pool_is_broken:
+                    pool.shutdown(wait=False, cancel_futures=True)
+                    pool = self._create_pool()
+
+                total_statuses.update(round_statuses)
+                LOG.info(f"Worker {self.worker_id} completed a round over {len(task_groups)} experiments: " +
+                         f"{ {str(status): count for status, count in round_statuses.items()} }")
+
+                # unmoved tasks are still queued; retrying them at once would spin while, e.g., Postgres is down
+                claimed_tasks = sum(
+                    count for status, count in round_statuses.items()
+                    if status not in (TaskStatus.CONTENDED, TaskStatus.UNMOVED)
+                )
+                if claimed_tasks > 0:
+                    continue # there may be more tasks to claim
+                if not self.follow:
+                    break
+                time.sleep(self.poll_seconds)
+        finally:
+            pool.shutdown()
+
+        return total_statuses
+
+    def _create_pool(self):
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        # spawn, so that every process creates its own MinIO and Postgres connections
+        return ProcessPoolExecutor(max_workers=self.processes, mp_context=multiprocessing.get_context('spawn'))
+
+    def _list_task_groups(self) -> list[list[str]]:
+        from synqtab.data import MinioClient
+
+        tasks_per_experiment = defaultdict(list)
+        for task_object in MinioClient.iter_bucket_objects(MinioBucket.TASKS, prefix=self.prefix):
+            task_key = task_object['Key']
+            tasks_per_experiment[self.experiment_id_of(task_key)].append(task_key)
+
+        # workers of different nodes list the same tasks; visiting them in different order reduces lease contention
+        task_groups = list(tasks_per_experiment.values())
+        random.shuffle(task_groups)
+        return task_groups
+
+    @classmethod
+    def experiment_id_of(cls, task_key: str) -> str:
+        return task_key.split(cls._task_key_delimiter)[0]
+
+    @classmethod
+    def process_task(
+        cls, task_key: str, worker_id: str, lease_seconds: int, evaluation_contexts: dict[str, Any]
+    ) -> TaskStatus:
+        """Claims, runs and moves the given task.
+
+        Args:
+            task_key (str): the key of the task in the tasks bucket.
+            worker_id (str): the identifier of the worker, written in the lease of the task.
+            lease_seconds (int): seconds after which the lease is considered abandoned.
+            evaluation_contexts (dict[str, EvaluationContext]): evaluation contexts by experiment id. The context of
+            the experiment of the task is taken from here or added here, so that tasks of the same experiment share it.
+
+        Returns:
+            TaskStatus: the outcome of the task.
+        """
+        from synqtab.data import MinioClient, PostgresClient
+        from synqtab.tasks.TaskLease import TaskLease
+
+        with TaskLease(task_key, worker_id, lease_seconds) as lease:
+            if not lease.acquire():
+                return TaskStatus.CONTENDED
+
+            # the task may have been completed by another worker between our listing and our lease
+            if not MinioClient.object_exists(MinioBucket.TASKS, task_key):
+                return TaskStatus.CONTENDED
+
+            task_status = cls._run_task(task_key, evaluation_contexts, renew_lease=lease.renew)
+            # the results must be durable before the task leaves the tasks bucket
+            PostgresClient.flush()
+            # the compare-and-swap detects a worker that took the task over because it ran for longer than the lease;
+            # that worker moves the task
+            if not lease.renew():
+                return TaskStatus.CONTENDED
+            MinioClient.move_file(
+                source_bucket_name=MinioBucket.TASKS,
+                source_prefix=task_key,
+                destination_bucket_name=task_status.destination_bucket(),
+                destination_prefix=task_key,
+            )
+            return task_status
+
+    @classmethod
+    def _run_task(
+        cls, task_key: str, evaluation_contexts: dict[str, Any], renew_lease: Optional[Callable[[], bool]] = None
+    ) -> TaskStatus:
+        from synqtab.data import MinioClient
+        from synqtab.evaluators.Evaluation import Evaluation
+        from synqtab.evaluators.EvaluationBatch import EvaluationBatch
+        from synqtab.evaluators.EvaluationContext import EvaluationContext
+        from synqtab.experiments.Experiment import Experiment
+
+        try:
+            task = MinioClient.read_json_from_bucket(MinioBucket.TASKS, task_key)
+            experiment_id = task['experiment_id']
+            if experiment_id not in evaluation_contexts:
+                experiment, _ = Experiment.from_str(experiment_id) # also sets the random seed of the experiment
+                evaluation_contexts[experiment_id] = EvaluationContext(experiment)
+            evaluation_context = evaluation_contexts[experiment_id]
+
+            if 'evaluation_ids' in task: # a task of an EvaluationBatch
+                evaluation_batch = EvaluationBatch.from_ids_and_experiment(
+                    task['evaluation_ids'],
+                    evaluation_context.experiment,
+                    params=task.get('params'),
+                    context=evaluation_context,
+                )
+                evaluation_batch.run(renew_lease=renew_lease)
+                if evaluation_batch.lease_lost: # the worker that took the task over decides its outcome
+                    return TaskStatus.CONTENDED
+                if evaluation_batch.failed_evaluations:
+                    # failed tasks are not retried automatically. The finished evaluations are in Postgres already,
+                    # so they are skipped if the task is published again, e.g., from the failed tasks bucket
+                    return TaskStatus.FAILED
+                return TaskStatus.SKIPPED if evaluation_batch.was_skipped else TaskStatus.FINISHED
+
+            evaluation = Evaluation.from_str_and_experiment(
+                task['evaluation_id'],
+                evaluation_context.experiment,
+                params=task.get('params'),
+                context=evaluation_context,
+            )
+            evaluation.run()
+            return TaskStatus.SKIPPED if evaluation.was_skipped else TaskStatus.FINISHED
+        except Exception as e:
+            if cls.is_infrastructure_error(e):
+                raise # the task stays in the tasks bucket and is retried, see _process_task_group()
+            LOG.error(
+                f"Task {task_key} failed. Error: {e}",
+                extra={'experiment_id': cls.experiment_id_of(task_key)}
+            )
+            return TaskStatus.FAILED
+
+    @staticmethod
+    def is_infrastructure_error(error: BaseException) -> bool:
+        """Whether the error comes from the infrastructure, e.g., MinIO or Postgres being unreachable or the disk
+        being full, rather than from the evaluation itself. A task that failed with such an error may succeed later.
+        """
+        from botocore.exceptions import BotoCoreError, ClientError
+        from synqtab.data.clients.PostgresBatchWriter import PostgresBatchWriter
+
+        if isinstance(error, ClientError): # a missing object does not appear by retrying
+            return error.response.get('Error', {}).get('Code') not in {'404', 'NoSuchKey', 'NotFound', 'NoSuchBucket'}
+        return isinstance(error, (BotoCoreError, OSError)) or PostgresBatchWriter.is_connection_error(error)
+
+
+def _process_task_group(task_keys: list[str], worker_id: str, lease_seconds: int) -> Counter:
+    """Entry point of the pool processes. Lives at module level, so that it can be pickled.
+    All tasks of a group belong to the same experiment, so they share the same evaluation context.
+    """
+    statuses = Counter()
+    evaluation_contexts = dict()
+    for task_key in task_keys:
+        try:
+            statuses[TaskWorker.process_task(task_key, worker_id, lease_seconds, evaluation_contexts)] += 1
+        except Exception as e:
+            LOG.error(
+                f"Could not process task {task_key}. It will be retried in a later round. Error: {e}",
+                extra={'experiment_id': TaskWorker.experiment_id_of(task_key)}
+            )
+            statuses[TaskStatus.UNMOVED] += 1
+    return statuses
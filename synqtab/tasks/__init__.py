@@ -0,0 +1,7 @@
+from .TaskLease import TaskLease
+from .TaskWorker import TaskWorker
+
+__all__ = [
+    'TaskLease',
+    'TaskWorker',
+]
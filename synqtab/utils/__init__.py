@@ -1,8 +1,9 @@
 from .logging_utils import get_logger
-from .general_utils import get_experimental_params_for_normal, timed_computation
+from .general_utils import get_experimental_params_for_normal, get_normal_experiment_grid, timed_computation
 
 __all__ = [
     'get_logger',
     'get_experimental_params_for_normal',
+    'get_normal_experiment_grid',
     'timed_computation',
 ]
\ No newline at end of file
@@ -1,5 +1,4 @@
 import os
-import tempfile
 import pandas as pd
 from sklearn.preprocessing import LabelEncoder
 
@@ -71,53 +70,28 @@ def _load_dataset_to_postgres(name: str, df: pd.DataFrame, yaml_content: dict) -
     
 def _load_dataset_to_minio(name: str, df: pd.DataFrame, yaml_content: dict) -> None:
     """
-    Serializes a DataFrame to a temporary Parquet file and uploads it to MinIO.
+    Streams a DataFrame as Parquet to MinIO, without any temporary files.
     Also, uploads the raw YAML metadata file as-is.
     """
-    import yaml
-    
-    # 0. Ensure target buckets exist
     bucket = MinioBucket.REAL.value    
     data_folder = MinioFolder.create_path(MinioFolder.PERFECT, MinioFolder.DATA)
     metadata_folder = MinioFolder.create_path(MinioFolder.PERFECT, MinioFolder.METADATA)
-    MinioClient.ensure_bucket_exists(bucket)
-
-    # 1. Write the DataFrame and YAML file to MinIO as Parquet and YAML respectively
-    # We use a temporary file to save each, upload it, and then delete it.
-    LOG.info("Trying to get temporary file names")
-    with tempfile.NamedTemporaryFile(suffix=".parquet", delete=False) as tmp:
-        df.to_parquet(tmp.name, index=False)
-        tmp_path_data = tmp.name
-        
-    with tempfile.NamedTemporaryFile(suffix=".yaml", delete=False) as tmp:
-        with open(tmp.name, 'w') as file:
-            yaml.dump(yaml_content, file)
-        tmp_path_metadata = tmp.name
-    
-    LOG.info("Found temporary file names for the data and metadata.")
 
-    try:
-        data_object_key = f"{data_folder}/{name}.parquet"
-        LOG.info(f"Uploading data to MinIO: {bucket}/{data_object_key}")
-        MinioClient.upload_file_to_bucket(
-            local_file_path=tmp_path_data, 
-            bucket_name=bucket, 
-            object_name=data_object_key,
-        )
-        
-        meta_object_key = f"{metadata_folder}/{name}.yaml"
-        LOG.info(f"Uploading metadata to MinIO: {bucket}/{meta_object_key}")
-        MinioClient.upload_file_to_bucket(
-            local_file_path=tmp_path_metadata,
-            bucket_name=bucket,
-            object_name=meta_object_key,
-        )
-    finally:
-        # Clean up the local temporary files
-        if os.path.exists(tmp_path_data):
-            os.remove(tmp_path_data)
-        if os.path.exists(tmp_path_metadata):
-            os.remove(tmp_path_metadata)
+    data_object_key = f"{data_folder}/{name}.parquet"
+    LOG.info(f"Uploading data to MinIO: {bucket}/{data_object_key}")
+    MinioClient.upload_dataframe_as_parquet_to_bucket(
+        df=df,
+        bucket_name=bucket,
+        object_name=data_object_key,
+    )
+    
+    meta_object_key = f"{metadata_folder}/{name}.yaml"
+    LOG.info(f"Uploading metadata to MinIO: {bucket}/{meta_object_key}")
+    MinioClient.upload_yaml_to_bucket(
+        data=yaml_content,
+        bucket_name=bucket,
+        object_name=meta_object_key,
+    )
     
     LOG.info(f"Upload of data and metadata completed for dataset: {name}")
 
@@ -0,0 +1,221 @@
+import hashlib
+import json
+import threading
+from typing import Any, Optional
+
+import numpy as np
+import pandas as pd
+
+
+_MODELABLE_SDTYPES = ('numerical', 'datetime', 'categorical', 'boolean')
+
+
+def _datetime_as_seconds(column: pd.Series, column_metadata: dict[str, Any]) -> np.ndarray:
+    if not pd.api.types.is_datetime64_any_dtype(column):
+        column = pd.to_datetime(column, format=column_metadata.get('datetime_format'))
+    seconds = column.to_numpy(dtype='datetime64[ns]').astype(np.int64) / 1e9
+    seconds[column.isna().to_numpy()] = np.nan
+    return seconds
+
+
+class DCRReference():
+    """The real data of a distance-to-closest-record (DCR) computation, preprocessed once: the numerical and datetime
+    columns as float64 arrays (datetimes in seconds) together with their ranges, and the categorical and boolean
+    columns as dictionary codes. `distances()` then computes the DCR of every row of another table against it.
+
+    The distance of two rows is the one of sdmetrics (`sdmetrics.single_table.privacy.dcr_utils.calculate_dcr`):
+    the mean over the columns of the absolute difference divided by the range of the real column and capped at 1 for
+    the numerical and datetime columns (0/1 if the range is 0), and of 0/1 for unequal categories, where a missing
+    value is at distance 0 from a missing value and 1 from anything else. Unlike sdmetrics, it is computed in NumPy
+    blocks of bounded size and in parallel threads.
+
+    Use `DCRReference.of()` to reuse the preprocessing of the same real data across evaluations.
+    """
+
+    _cached: dict[str, 'DCRReference'] = dict()
+    _max_cached: int = 4
+    _cache_lock = threading.Lock()
+
+    def __init__(self, real_data: pd.DataFrame, metadata: dict[str, Any]):
+        """
+        Args:
+            real_data (pd.DataFrame): the real data to measure the distances to.
+            metadata (dict[str, Any]): the sdmetrics single table metadata of the data.
+        """
+        self.metadata = metadata
+        self.columns = [
+            column for column, column_metadata in metadata['columns'].items()
+            if column_metadata['sdtype'] in _MODELABLE_SDTYPES and column in real_data.columns
+        ]
+        if not self.columns:
+            raise ValueError('There are no overlapping statistical columns to measure.')
+
+        self.n_rows = len(real_data)
+        self._numerical_values: dict[str, np.ndarray] = dict()
+        self._ranges: dict[str, float] = dict()
+        self._categories: dict[str, pd.Index] = dict()
+        self._categorical_codes: dict[str, np.ndarray] = dict()
+        for column in self.columns:
+            if self._is_numerical(column):
+                values = self._numerical_column(real_data, column)
+                self._numerical_values[column] = values
+                self._ranges[column] = np.nanmax(values) - np.nanmin(values) if not np.all(np.isnan(values)) else np.nan
+            else:
+                # compared as plain values, like sdmetrics compares them, whatever the categories of the dtypes
+                codes, categories = pd.factorize(real_data[column].astype(object), use_na_sentinel=True)
+                self._categories[column] = pd.Index(categories, dtype=object)
+                self._categorical_codes[column] = np.where(codes < 0, -2, codes).astype(np.int64)
+
+    @classmethod
+    def of(cls, real_data: pd.DataFrame, metadata: dict[str, Any]) -> 'DCRReference':
+        """Returns the `DCRReference` of the real data, preprocessing them only if they were not recently used."""
+        key = cls.fingerprint(real_data, metadata)
+        with cls._cache_lock:
+            if key not in cls._cached:
+                if len(cls._cached) >= cls._max_cached:
+                    cls._cached.pop(next(iter(cls._cached)))
+                cls._cached[key] = cls(real_data, metadata)
+            return cls._cached[key]
+
+    @staticmethod
+    def fingerprint(data: pd.DataFrame, metadata: dict[str, Any]) -> str:
+        fingerprint = hashlib.sha256(json.dumps(metadata, sort_keys=True, default=str).encode('utf-8'))
+        fingerprint.update(str(list(data.columns)).encode('utf-8'))
+        fingerprint.update(pd.util.hash_pandas_object(data, index=False).to_numpy().tobytes())
+        return fingerprint.hexdigest()
+
+    def _is_numerical(self, column: str) -> bool:
+        return self.metadata['columns'][column]['sdtype'] in ('numerical', 'datetime')
+
+    def _numerical_column(self, data: pd.DataFrame, column: str) -> np.ndarray:
+        column_metadata = self.metadata['columns'][column]
+        if column_metadata['sdtype'] == 'datetime':
+            return _datetime_as_seconds(data[column], column_metadata)
+        return data[column].to_numpy(dtype=np.float64, na_value=np.nan)
+
+    def _encode(self, data: pd.DataFrame) -> tuple[dict[str, np.ndarray], dict[str, np.ndarray]]:
+        numerical_values, categorical_codes = dict(), dict()
+        for column in self.columns:
+            if self._is_numerical(column):
+                numerical_values[column] = self._numerical_column(data, column)
+            else:
+                # -2 marks missing values, like in the reference; categories that the reference lacks get -1, which
+                # equals no code of the reference
+                codes = self._categories[column].get_indexer(data[column].astype(object))
+                codes[data[column].isna().to_numpy()] = -2
+                categorical_codes[column] = codes.astype(np.int64)
+        return numerical_values, categorical_codes
+
+    def distances(
+        self,
+        data: pd.DataFrame,
+        block_bytes: int = 64 * 2**20,
+        threads: int = 1,
+        reference_rows: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """Computes the DCR of every row of the data, i.e., its distance to the closest row of the reference.
+
+        Args:
+            data (pd.DataFrame): the data to compute the DCRs of, e.g., the synthetic data.
+            block_bytes (int, optional): the memory of the distance block that each thread computes at a time.
+            Defaults to 64 MiB.
+            threads (int, optional): the number of threads to compute the blocks with. Defaults to 1.
+            reference_rows (np.ndarray, optional): the positions of the reference rows to compare against, e.g., a
+            sample of them. Defaults to None, i.e., all rows.
+
+        Returns:
+            np.ndarray: the DCR of every row of the data, in [0, 1].
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        numerical_values, categorical_codes = self._encode(data)
+        reference_numerical_values = self._numerical_values
+        reference_categorical_codes = self._categorical_codes
+        if reference_rows is not None:
+            reference_numerical_values = {c: v[reference_rows] for c, v in reference_numerical_values.items()}
+            reference_categorical_codes = {c: v[reference_rows] for c, v in reference_categorical_codes.items()}
+        n_reference_rows = self.n_rows if reference_rows is None else len(reference_rows)
+
+        # a block holds the running sum and about two temporaries of a column, all float64
+        reference_block_rows = min(n_reference_rows, 8192)
+        block_rows = max(1, block_bytes // (3 * 8 * max(reference_block_rows, 1)))
+        dcrs = np.empty(len(data), dtype=np.float64)
+
+        def compute_block(start: int) -> None:
+            stop = min(start + block_rows, len(data))
+            closest = np.full(stop - start, np.inf)
+            for reference_start in range(0, n_reference_rows, reference_block_rows):
+                reference_stop = min(reference_start + reference_block_rows, n_reference_rows)
+                distance_sums = np.zeros((stop - start, reference_stop - reference_start))
+                for column in self.columns:
+                    if column in numerical_values:
+                        distance_sums += self._numerical_distances(
+                            numerical_values[column][start:stop],
+                            reference_numerical_values[column][reference_start:reference_stop],
+                            self._ranges[column],
+                        )
+                    else:
+                        distance_sums += np.not_equal.outer(
+                            categorical_codes[column][start:stop],
+                            reference_categorical_codes[column][reference_start:reference_stop],
+                        )
+                np.minimum(closest, distance_sums.min(axis=1), out=closest)
+            dcrs[start:stop] = closest / len(self.columns)
+
+        block_starts = range(0, len(data), block_rows)
+        if threads > 1 and len(block_starts) > 1:
+            with ThreadPoolExecutor(max_workers=threads) as executor:
+                list(executor.map(compute_block, block_starts))
+        else:
+            for start in block_starts:
+                compute_block(start)
+        return dcrs
+
+    @staticmethod
+    def _numerical_distances(values: np.ndarray, reference_values: np.ndarray, column_range: float) -> np.ndarray:
+        differences = np.abs(np.subtract.outer(values, reference_values))
+        if column_range == 0:
+            distances = (differences > 0).astype(np.float64)
+        else:
+            distances = np.minimum(differences / column_range, 1.0)
+        # exactly one missing value: 1, both missing: 0
+        missing = np.isnan(differences)
+        if missing.any():
+            distances[missing] = np.not_equal.outer(np.isnan(values), np.isnan(reference_values))[missing]
+        return distances
+
+
+def generate_random_baseline(real_data: pd.DataFrame, n_samples: int, generator: np.random.Generator) -> pd.DataFrame:
+    """Draws random data within the domain of the real data, like sdmetrics' `DCRBaselineProtection`: uniform
+    integers, floats or datetimes between the minimum and the maximum of each column, uniform categories among the
+    observed ones, and missing values at the rate of the real column. Unlike sdmetrics, all draws come from the given
+    generator, so the baseline is reproducible.
+
+    Args:
+        real_data (pd.DataFrame): the real data.
+        n_samples (int): the number of rows to draw.
+        generator (np.random.Generator): the generator to draw from.
+
+    Returns:
+        pd.DataFrame: the random data.
+    """
+    random_data = dict()
+    for column in real_data.columns:
+        values = real_data[column]
+        if pd.api.types.is_integer_dtype(values):
+            random_values = generator.integers(low=values.min(), high=values.max() + 1, size=n_samples)
+        elif pd.api.types.is_float_dtype(values):
+            random_values = generator.uniform(low=values.min(), high=values.max(), size=n_samples)
+        elif pd.api.types.is_datetime64_any_dtype(values):
+            min_date, max_date = values.min(), values.max()
+            random_values = min_date + pd.to_timedelta(
+                generator.uniform(low=0, high=(max_date - min_date).total_seconds(), size=n_samples), unit='s'
+            )
+        else:
+            random_values = generator.choice(values.dropna().unique(), size=n_samples)
+
+        random_values = pd.Series(random_values)
+        missing = generator.random(n_samples) < values.isna().mean()
+        random_values[missing] = pd.NaT if pd.api.types.is_datetime64_any_dtype(values) else np.nan
+        random_data[column] = random_values
+    return pd.DataFrame(random_data)
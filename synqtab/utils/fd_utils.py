@@ -0,0 +1,116 @@
+import numpy as np
+import pandas as pd
+
+from synqtab.utils.logging_utils import get_logger
+
+
+LOG = get_logger(__file__)
+
+# the Desbordante algorithms that can be chosen, by name, and whether they accept the `threads` option
+FD_ALGORITHMS = {'pyro': True, 'hyfd': True, 'fdep': False, 'tane': False}
+
+
+def encode_as_dictionary_codes(data: pd.DataFrame) -> pd.DataFrame:
+    """Replaces the values of every column by dictionary codes, i.e., the position of each value among the distinct
+    values of its column. Functional dependencies only depend on which values are equal within a column, so the FDs
+    of the codes are exactly the FDs of the data, while the codes are much cheaper to load, hash, compare and write
+    than strings or floats. Missing values get a code of their own, i.e., they are considered equal to each other.
+
+    Args:
+        data (pd.DataFrame): the data to encode.
+
+    Returns:
+        pd.DataFrame: the codes, with the same columns as the data and a fresh range index.
+    """
+    return pd.DataFrame(
+        {
+            column: pd.factorize(data[column], use_na_sentinel=False)[0].astype(np.int32, copy=False)
+            for column in data.columns
+        },
+        columns=data.columns,
+    )
+
+
+def fd_holds(codes: pd.DataFrame, determinant: list, dependant) -> bool:
+    """Checks whether the functional dependency `determinant -> dependant` holds on all rows of the codes, i.e.,
+    whether the determinant has as many distinct combinations as the determinant together with the dependant.
+
+    Args:
+        codes (pd.DataFrame): the data, as returned by `encode_as_dictionary_codes()`.
+        determinant (list): the columns of the left-hand side. An empty left-hand side means a constant column.
+        dependant: the column of the right-hand side.
+
+    Returns:
+        bool: True if the dependency holds, False otherwise.
+    """
+    if len(determinant) == 0:
+        return codes[dependant].nunique(dropna=False) <= 1
+    determinant_groups = codes.groupby(list(determinant), sort=False).ngroups
+    return determinant_groups == codes.groupby([*determinant, dependant], sort=False).ngroups
+
+
+def discover_fds(codes: pd.DataFrame, algorithm_name: str, threads: int) -> list[tuple[list[int], int, str]]:
+    """Runs a Desbordante FD discovery algorithm on the codes and returns the left-hand side column indices, the
+    right-hand side column index and the string representation of every discovered FD."""
+    import desbordante as db
+
+    algorithm = {
+        'pyro': db.fd.algorithms.Pyro,
+        'hyfd': db.fd.algorithms.HyFD,
+        'fdep': db.fd.algorithms.FDep,
+        'tane': db.fd.algorithms.Tane,
+    }[algorithm_name]()
+    algorithm.load_data(table=codes)
+    LOG.info(f"Data loaded into FD discovery algorithm {algorithm_name}.")
+
+    options = {'threads': threads} if FD_ALGORITHMS[algorithm_name] and threads > 1 else dict()
+    algorithm.execute(**options)
+    LOG.info(f"Executed FD discovery algorithm {algorithm_name}.")
+
+    return [(list(fd.lhs_indices), fd.rhs_index, str(fd)) for fd in algorithm.get_fds()]
+
+
+def _discover_fds_into_connection(connection, codes: pd.DataFrame, algorithm_name: str, threads: int) -> None:
+    """Entry point of the process that runs a discovery with a timeout. Lives at module level of this lightweight
+    module, so that it can be pickled by the spawn start method without importing the evaluators in the child."""
+    try:
+        connection.send(('ok', discover_fds(codes, algorithm_name, threads)))
+    except Exception as e:
+        connection.send(('error', repr(e)))
+
+
+def discover_fds_with_timeout(
+    codes: pd.DataFrame, algorithm_name: str, threads: int, timeout_seconds: float
+) -> list[tuple[list[int], int, str]]:
+    """Like `discover_fds()`, but in a separate process, which is terminated after the timeout (Desbordante cannot
+    be interrupted from Python).
+
+    Raises:
+        RuntimeError: if the discovery fails or does not finish in time. Not a `TimeoutError`, which is an `OSError`
+            and would thus be taken for a transient infrastructure error (see `TaskWorker.is_infrastructure_error()`).
+    """
+    import multiprocessing
+
+    context = multiprocessing.get_context('spawn')
+    parent_connection, child_connection = context.Pipe(duplex=False)
+    process = context.Process(
+        target=_discover_fds_into_connection,
+        args=(child_connection, codes, algorithm_name, threads),
+        daemon=True,
+    )
+    process.start()
+    child_connection.close()
+    try:
+        if not parent_connection.poll(timeout_seconds):
+            raise RuntimeError(f"FD discovery with {algorithm_name} did not finish in {timeout_seconds} seconds.")
+        status, payload = parent_connection.recv()
+    except EOFError:
+        status, payload = 'error', "the discovery process exited unexpectedly"
+    finally:
+        parent_connection.close()
+        process.terminate()
+        process.join()
+
+    if status == 'error':
+        raise RuntimeError(f"FD discovery with {algorithm_name} failed: {payload}")
+    return payload
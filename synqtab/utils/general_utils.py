@@ -65,4 +65,39 @@ def get_experimental_params_for_normal() -> dict[str, Any]:
         'error_rates': error_rates,
         'data_perfectness_levels': data_perfectness_levels,
         'evaluation_methods': evaluation_methods,
-    }
\ No newline at end of file
+    }
+
+def get_normal_experiment_grid(experimental_params: dict[str, Any]) -> list[dict[str, Any]]:
+    """Expands the experimental parameters of `get_experimental_params_for_normal()` into the list of the
+    (imperfect and semi-perfect) normal experiments to run, in the order that they should run.
+
+    Returns:
+        list[dict[str, Any]]: one dictionary per experiment with the keys `random_seed`, `dataset_name`,
+        `generator`, `data_error_type`, `data_error_rate` and `data_perfectness`.
+    """
+    from synqtab.enums import DataErrorType, DataPerfectness
+
+    grid = []
+    for random_seed in experimental_params.get('random_seeds'):
+        for dataset_name in experimental_params.get('dataset_names'):
+            for model in experimental_params.get('models'):
+                for error in experimental_params.get('error_types'):
+                    for error_rate in experimental_params.get('error_rates'):
+                        for perfectness_level in experimental_params.get('data_perfectness_levels'):
+                            if perfectness_level == DataPerfectness.SEMIPERFECT and error_rate != 0.4:
+                                # We investigate the cleaning dilemma only for 0.4 error rate
+                                continue
+
+                            if perfectness_level == DataPerfectness.SEMIPERFECT and error == DataErrorType.NEAR_DUPLICATE:
+                                # Semi-perfect for near duplicates is the same as perfect, no need to compute
+                                continue
+
+                            grid.append({
+                                'random_seed': random_seed,
+                                'dataset_name': dataset_name,
+                                'generator': model,
+                                'data_error_type': error,
+                                'data_error_rate': error_rate,
+                                'data_perfectness': perfectness_level,
+                            })
+    return grid
@@ -1,29 +1,165 @@
+import atexit
 import logging
+import logging.handlers
+import os
+import queue
+import sys
+import threading
 from typing import Optional
 
+from synqtab.environment import LOG_QUEUE_MAX_RECORDS, LOG_BATCH_MAX_RECORDS, LOG_FLUSH_SECONDS
 
-class PostgresDatabaseHandler(logging.Handler):
+
+# set in the thread that writes the error records, so that errors raised while writing them are not queued again
+_writing_error_records = threading.local()
+
+
+class PostgresDatabaseHandler(logging.handlers.BufferingHandler):
     """
-    Custom logging handler that sends ERROR logs to the Postgres database.
+    Custom logging handler that sends ERROR logs to the Postgres database, `capacity` records per insert.
+    It runs behind the queue of `PostgresQueueHandler`, so the database is never written from the logging thread.
     """
-    def emit(self, record):
-        from synqtab.data.clients.PostgresClient import PostgresClient 
+    def _row_of(self, record: logging.LogRecord) -> dict[str, str]:
+        return {
+            "experiment_id": getattr(record, "experiment_id", "SYSTEM_LOG"),
+            "file_path": f"{record.name}:{record.lineno}",
+            # formatted by the queue handler, so it already includes the traceback, if any
+            "error_message": record.getMessage(),
+        }
+
+    def flush(self):
+        from synqtab.data.clients.PostgresClient import PostgresClient
+
+        with self.lock:
+            records, self.buffer = self.buffer, []
+        if not records:
+            return
 
         try:
-            file_info = f"{record.name}:{record.lineno}"
-            experiment_id = getattr(record, "experiment_id", "SYSTEM_LOG")
-            
-            error_msg = record.getMessage()
-            if record.exc_info:
-                error_msg += f"\nTraceback: {self.format(record)}"
-
-            PostgresClient.write_runtime_error(
-                experiment_id=experiment_id,
-                file_path=file_info,
-                error_message=error_msg
+            PostgresClient.write_runtime_errors([self._row_of(record) for record in records])
+        except Exception as e:
+            sys.stderr.write(f"Could not write {len(records)} error records to Postgres. Error: {e}\n")
+
+
+class _BatchingQueueListener(logging.handlers.QueueListener):
+    """Queue listener that also flushes its handlers whenever the queue stays empty for `flush_seconds`."""
+
+    def __init__(self, queue_handler: 'PostgresQueueHandler', handler: logging.Handler, flush_seconds: float):
+        super().__init__(queue_handler.queue, handler)
+        self.queue_handler = queue_handler
+        self.flush_seconds = flush_seconds
+
+    def dequeue(self, block):
+        _writing_error_records.active = True
+        while True:
+            try:
+                return self.queue.get(block=block, timeout=self.flush_seconds if block else None)
+            except queue.Empty:
+                self.flush()
+                if not block:
+                    raise
+
+    def flush(self) -> None:
+        dropped_records = self.queue_handler.pop_unreported_dropped_records()
+        if dropped_records:
+            for handler in self.handlers:
+                handler.handle(logging.makeLogRecord({
+                    'name': __name__,
+                    'levelno': logging.ERROR,
+                    'levelname': 'ERROR',
+                    'msg': f"Dropped {dropped_records} error records, because the logging queue was full.",
+                }))
+        for handler in self.handlers:
+            handler.flush()
+
+    def enqueue_sentinel(self):
+        # the queue may be full; the listener keeps draining it, so waiting for a free slot is safe
+        self.queue.put(self._sentinel)
+
+    def stop(self):
+        super().stop()
+        self.flush()
+
+
+class PostgresQueueHandler(logging.handlers.QueueHandler):
+    """
+    Non-blocking front of `PostgresDatabaseHandler`. Records are put in a bounded queue, which a background listener
+    writes to Postgres in batches. When the queue is full (e.g., during a database outage), records are dropped and
+    counted in `dropped_records` instead of stalling the caller; the number of dropped records is reported once the
+    database can be written again. Queued records are written on exit, including the exit of `multiprocessing` children.
+    """
+    def __init__(self, max_records: int, batch_records: int, flush_seconds: float):
+        super().__init__(queue.Queue(maxsize=max_records))
+        self.dropped_records = 0
+        self._unreported_dropped_records = 0
+        self._batch_records = batch_records
+        self._flush_seconds = flush_seconds
+        self._listener = None
+        self._pid = None
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self.lock:
+                self.dropped_records += 1
+                self._unreported_dropped_records += 1
+
+    def pop_unreported_dropped_records(self) -> int:
+        with self.lock:
+            dropped_records, self._unreported_dropped_records = self._unreported_dropped_records, 0
+        return dropped_records
+
+    def emit(self, record):
+        if getattr(_writing_error_records, 'active', False):
+            return
+        self._ensure_listening()
+        super().emit(record)
+
+    def _ensure_listening(self) -> None:
+        # a forked child inherits the queue but not the listener thread, so it starts its own
+        if self._pid == os.getpid():
+            return
+        with self.lock:
+            if self._pid == os.getpid():
+                return
+            from multiprocessing import util
+
+            if self._pid is not None:
+                self.queue = queue.Queue(maxsize=self.queue.maxsize)
+            self._pid = os.getpid()
+            self._listener = _BatchingQueueListener(
+                self, PostgresDatabaseHandler(capacity=self._batch_records), flush_seconds=self._flush_seconds
             )
-        except Exception:
-            self.handleError(record)
+            self._listener.start()
+            atexit.register(self._stop_listening)
+            util.Finalize(self, PostgresQueueHandler._stop_listening, args=(self,), exitpriority=20)
+
+    def _stop_listening(self) -> None:
+        if self._pid != os.getpid() or self._listener is None:
+            return
+        listener, self._listener = self._listener, None
+        listener.stop()
+
+    def close(self):
+        self._stop_listening()
+        super().close()
+
+
+_postgres_queue_handler: Optional[PostgresQueueHandler] = None
+
+
+def _get_postgres_queue_handler() -> PostgresQueueHandler:
+    """All loggers share a single queue and listener."""
+    global _postgres_queue_handler
+    if _postgres_queue_handler is None:
+        _postgres_queue_handler = PostgresQueueHandler(
+            max_records=LOG_QUEUE_MAX_RECORDS,
+            batch_records=LOG_BATCH_MAX_RECORDS,
+            flush_seconds=LOG_FLUSH_SECONDS,
+        )
+        _postgres_queue_handler.setLevel(logging.ERROR)
+    return _postgres_queue_handler
 
 
 def get_logger(name: Optional[str] = None, level: int = logging.INFO) -> logging.Logger:
@@ -48,10 +184,8 @@ def get_logger(name: Optional[str] = None, level: int = logging.INFO) -> logging
         handler.setFormatter(formatter)
         logger.addHandler(handler)
         
-        # 2. Automated Postgres Logging only for ERROR
-        db_handler = PostgresDatabaseHandler()
-        db_handler.setLevel(logging.ERROR)
-        logger.addHandler(db_handler)
+        # 2. Automated, non-blocking Postgres Logging only for ERROR
+        logger.addHandler(_get_postgres_queue_handler())
         
         # Prevent double logging if root logger is also configured.
         logger.propagate = False
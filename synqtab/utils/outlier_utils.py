@@ -1,3 +1,6 @@
+import threading
+
+import numpy as np
 import pandas as pd
 
 def handle_categorical(data:pd.DataFrame, method:str = 'onehot') -> pd.DataFrame:
@@ -38,4 +41,193 @@ def handle_categorical(data:pd.DataFrame, method:str = 'onehot') -> pd.DataFrame
     elif method == 'only_numerical':
         return data.select_dtypes(include='number')
     else:
-        raise ValueError(f"Unsupported method '{method}' for handling categorical data. Supported methods are: 'onehot', 'label', 'only_numerical'.")
\ No newline at end of file
+        raise ValueError(f"Unsupported method '{method}' for handling categorical data. Supported methods are: 'onehot', 'label', 'only_numerical'.")
+
+class OneHotFeatureEncoder():
+    """Encodes data for the outlier detectors like `handle_categorical(data, method='onehot')`, i.e., the numerical
+    columns followed by the one-hot encoded categorical columns, but learns the categories once, from the real schema,
+    and is shared by all the evaluations of the same dataset. The one-hot block can be returned as a sparse CSR matrix
+    instead of a dense frame, which keeps high-cardinality categoricals cheap, and the encoded matrices are memoized
+    by the fingerprint of the data, so that, e.g., LOF and Isolation Forest on the same R data encode it only once.
+
+    Like `handle_categorical()`, the numerical and the categorical columns are those of the encoded data's dtypes.
+    The categories of each column are the ones of the real schema, extended with the categories of the encoded data
+    that the schema lacks, e.g., typos injected by a data error, so that those get their own column instead of all
+    zeros. Missing values of a categorical column get their own column as well. The categories of the schema that
+    the data lack are all-zero columns, which leave distances (LOF) unchanged but not the features that an Isolation
+    Forest samples from; `transform(..., observed_categories_only=True)` leaves them out, which gives exactly the
+    columns of `handle_categorical()`.
+
+    The encoder is thread-safe; the memoized matrices are shared among the threads.
+    """
+
+    _max_memoized: int = 8
+
+    def __init__(self, schema_df: pd.DataFrame):
+        """
+        Args:
+            schema_df (pd.DataFrame): the real data to learn the columns and the categories from. The encoder is
+            fitted the first time that it is used.
+        """
+        self._schema_df = schema_df
+        self._categories: dict[str, pd.Index] = dict()
+        self._has_missing: dict[str, bool] = dict()
+        self.categorical_columns: list = []
+        self.numerical_columns: list = []
+        self._memoized: dict[tuple, object] = dict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _categorical_columns_of(data: pd.DataFrame) -> list:
+        return list(data.select_dtypes(include=['object', 'category']).columns)
+
+    @staticmethod
+    def _categories_of(values: pd.Series) -> pd.Index:
+        categories = pd.Index(values.dropna().unique(), dtype=object)
+        try:
+            return categories.sort_values()
+        except TypeError: # mixed types, kept in order of appearance
+            return categories
+
+    def _ensure_fitted(self) -> None:
+        with self._lock:
+            if self._schema_df is not None:
+                self._fit()
+
+    def _fit(self) -> None:
+        self.categorical_columns = self._categorical_columns_of(self._schema_df)
+        self.numerical_columns = [column for column in self._schema_df.columns if column not in self.categorical_columns]
+        for column in self.categorical_columns:
+            values = self._schema_df[column].astype(object)
+            self._categories[column] = self._categories_of(values)
+            self._has_missing[column] = bool(values.isna().any())
+        self._schema_df = None # not needed anymore
+
+    def transform(
+        self, data: pd.DataFrame, sparse: bool = False, dtype=np.float64, observed_categories_only: bool = False
+    ):
+        """Encodes the data, or returns the memoized encoding of identical data.
+
+        Args:
+            data (pd.DataFrame): data with the columns of the real schema.
+            sparse (bool, optional): whether to return a sparse CSR matrix instead of a dense array. Defaults to False.
+            dtype (optional): the dtype of the encoded matrix. Defaults to np.float64.
+            observed_categories_only (bool, optional): whether to encode only the categories that occur in the data,
+            in sorted order, like `handle_categorical()`, instead of all categories of the schema. Defaults to False.
+
+        Returns:
+            np.ndarray | scipy.sparse.csr_matrix: the encoded data. It is shared with later calls, so do not modify it.
+        """
+        import scipy.sparse
+
+        self._ensure_fitted()
+
+        key = (self.fingerprint(data), sparse, np.dtype(dtype).str, observed_categories_only)
+        with self._lock:
+            if key in self._memoized:
+                return self._memoized[key]
+
+        categorical_columns = self._categorical_columns_of(data)
+        numerical_columns = [column for column in data.columns if column not in categorical_columns]
+        numerical = data[numerical_columns].to_numpy(dtype=dtype)
+
+        one_hot_columns, n_one_hot_columns = [], 0
+        for column in categorical_columns:
+            values = data[column].astype(object)
+            missing = values.isna().to_numpy()
+            if observed_categories_only:
+                categories, has_missing = self._categories_of(values), False
+            else:
+                categories = self._categories.get(column, pd.Index([], dtype=object))
+                categories = categories.append(self._categories_of(values).difference(categories, sort=False))
+                has_missing = self._has_missing.get(column, False)
+            codes = categories.get_indexer(values)
+            n_categories = len(categories)
+            if missing.any() or has_missing:
+                codes[missing] = n_categories
+                n_categories += 1
+            one_hot_columns.append(codes + n_one_hot_columns)
+            n_one_hot_columns += n_categories
+
+        if one_hot_columns:
+            one_hot = scipy.sparse.csr_matrix(
+                (
+                    np.ones(len(data) * len(one_hot_columns), dtype=dtype),
+                    np.column_stack(one_hot_columns).ravel(),
+                    np.arange(0, len(data) * len(one_hot_columns) + 1, len(one_hot_columns)),
+                ),
+                shape=(len(data), n_one_hot_columns),
+            )
+            if sparse:
+                encoded = scipy.sparse.hstack([scipy.sparse.csr_matrix(numerical), one_hot], format='csr')
+            else:
+                encoded = np.hstack([numerical, one_hot.toarray()])
+        else:
+            encoded = scipy.sparse.csr_matrix(numerical) if sparse else numerical
+
+        with self._lock:
+            if len(self._memoized) >= self._max_memoized:
+                self._memoized.pop(next(iter(self._memoized)))
+            self._memoized[key] = encoded
+        return encoded
+
+    @property
+    def n_encoded_columns(self) -> int:
+        """The number of columns of the encoded real schema; data with unseen categories have a few more."""
+        self._ensure_fitted()
+        n_one_hot_columns = sum(
+            len(self._categories[column]) + self._has_missing[column] for column in self.categorical_columns
+        )
+        return len(self.numerical_columns) + n_one_hot_columns
+
+    @staticmethod
+    def fingerprint(data: pd.DataFrame) -> str:
+        import hashlib
+
+        fingerprint = hashlib.sha256(str(list(data.columns)).encode('utf-8'))
+        fingerprint.update(pd.util.hash_pandas_object(data, index=True).to_numpy().tobytes())
+        return fingerprint.hexdigest()
+
+
+def hnsw_neighbors_graph(data, n_neighbors: int, random_seed: int = 100):
+    """Builds the k-nearest-neighbors graph of the data with an HNSW index (https://github.com/nmslib/hnswlib), in
+    the format that scikit-learn expects for `metric='precomputed'`: a sparse CSR matrix with the euclidean distances
+    of each sample to itself and to its `n_neighbors` approximate nearest neighbors, sorted by distance.
+
+    The index is built with a single thread, because a parallel build inserts the samples in a nondeterministic
+    order; the queries are independent of each other and run in parallel.
+
+    Args:
+        data (np.ndarray | scipy.sparse matrix): the encoded data.
+        n_neighbors (int): the number of neighbors of each sample, excluding itself.
+        random_seed (int, optional): the seed of the random levels of the index. Defaults to 100, hnswlib's default.
+
+    Returns:
+        scipy.sparse.csr_matrix: the (n_samples, n_samples) neighbors graph.
+    """
+    import hnswlib
+    import scipy.sparse
+
+    if scipy.sparse.issparse(data):
+        data = data.toarray()
+    data = np.ascontiguousarray(data, dtype=np.float32)
+    n_samples = data.shape[0]
+    n_neighbors_with_self = min(n_neighbors + 1, n_samples)
+
+    index = hnswlib.Index(space='l2', dim=data.shape[1])
+    index.init_index(max_elements=n_samples, ef_construction=200, M=16, random_seed=random_seed)
+    index.add_items(data, num_threads=1)
+    index.set_ef(max(2 * n_neighbors_with_self, 50))
+    labels, squared_distances = index.knn_query(data, k=n_neighbors_with_self, num_threads=-1)
+
+    distances = np.sqrt(np.maximum(squared_distances, 0), dtype=np.float64)
+    # among duplicates, the search may miss a sample itself; scikit-learn then drops the nearest neighbor instead
+    order = np.argsort(distances, axis=1, kind='stable')
+    return scipy.sparse.csr_matrix(
+        (
+            np.take_along_axis(distances, order, axis=1).ravel(),
+            np.take_along_axis(labels.astype(np.int64), order, axis=1).ravel(),
+            np.arange(0, n_samples * n_neighbors_with_self + 1, n_neighbors_with_self),
+        ),
+        shape=(n_samples, n_samples),
+    )
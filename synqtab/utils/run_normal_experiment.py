@@ -2,19 +2,13 @@ import warnings
 warnings.filterwarnings("ignore") # mitigates synthcity's annoying verbosity
 
 
-from synqtab.data import Dataset
-from synqtab.enums import DataPerfectness, DataErrorType, ProblemType
-from synqtab.experiments.Experiment import Experiment
-from synqtab.experiments import NormalExperiment
-from synqtab.reproducibility import ReproducibleOperations
+from synqtab.experiments import GridRunner
 from synqtab.utils import get_logger, get_experimental_params_for_normal
 
 
 LOG = get_logger(__file__)
 
 
-experimental_params = get_experimental_params_for_normal()
-
 # First, generate all perfect synthetic data (S)
 # for random_seed in experimental_params.get('random_seeds'):
 #     ReproducibleOperations.set_random_seed(random_seed)
@@ -43,38 +37,8 @@ experimental_params = get_experimental_params_for_normal()
 
 # exit(0)
 
-# Then, generate all imperfect (S_hat) and semi-perfect (S_semi) and populate evaluation tasks
-for random_seed in experimental_params.get('random_seeds'):
-    ReproducibleOperations.set_random_seed(random_seed)
-    for dataset_name in experimental_params.get('dataset_names'):
-        dataset = Dataset(dataset_name)
-        for model in experimental_params.get('models'):
-            for error in experimental_params.get('error_types'):
-                for error_rate in experimental_params.get('error_rates'):
-                    for perfectness_level in experimental_params.get('data_perfectness_levels'):
-                        try:
-                            if perfectness_level == DataPerfectness.SEMIPERFECT and error_rate != 0.4:
-                                # We investigate the cleaning dilemma only for 0.4 error rate
-                                continue
-
-                            if perfectness_level == DataPerfectness.SEMIPERFECT and error == DataErrorType.NEAR_DUPLICATE:
-                                # Semi-perfect for near duplicates is the same as perfect, no need to compute
-                                continue
-                            
-                            force = (dataset.problem_type == str(ProblemType.REGRESSION))
-                            normal_experiment = NormalExperiment(
-                                dataset=dataset,
-                                generator=model,
-                                data_error_type=error,
-                                data_error_rate=error_rate,
-                                data_perfectness=perfectness_level,
-                                evaluation_methods=experimental_params.get('evaluation_methods'),
-                            )
-                            normal_experiment.run(force=force).publish_tasks()
-                            
-                        except Exception as e:
-                            LOG.error(
-                                f"The experiment failed but I will continue to the next one. Error: {e}",
-                                extra={'experiment_id': str(normal_experiment)}
-                            )
-                            continue
+# Then, generate all imperfect (S_hat) and semi-perfect (S_semi) and populate evaluation tasks.
+# The grid runs on process pools that re-import this module, hence the main guard.
+if __name__ == '__main__':
+    experimental_params = get_experimental_params_for_normal()
+    GridRunner(experimental_params).run()
@@ -0,0 +1,6 @@
+import os
+
+# the clients of synqtab.data are built on import; they are never connected to in the tests
+os.environ.setdefault('POSTGRES_MAPPED_PORT', '5432')
+os.environ.setdefault('MINIO_HOST', 'localhost')
+os.environ.setdefault('MINIO_API_MAPPED_PORT', '9000')
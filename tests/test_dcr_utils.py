@@ -0,0 +1,83 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from synqtab.utils.dcr_utils import DCRReference, generate_random_baseline
+
+
+METADATA = {
+    'columns': {
+        'age': {'sdtype': 'numerical'},
+        'income': {'sdtype': 'numerical'},
+        'constant': {'sdtype': 'numerical'},
+        'joined': {'sdtype': 'datetime'},
+        'tier': {'sdtype': 'categorical'},
+        'city': {'sdtype': 'categorical'},
+        'active': {'sdtype': 'boolean'},
+        'comment': {'sdtype': 'text'}, # not modelable, hence ignored
+    }
+}
+
+
+def _table(n_rows: int, rng: np.random.Generator, categories_offset: int = 0) -> pd.DataFrame:
+    table = pd.DataFrame({
+        'age': rng.integers(18, 90, size=n_rows).astype(float),
+        'income': rng.lognormal(10, 1, size=n_rows),
+        'constant': np.full(n_rows, 7.0),
+        'joined': pd.Timestamp('2020-01-01') + pd.to_timedelta(rng.integers(0, 1_000, size=n_rows), unit='D'),
+        'tier': pd.Categorical(rng.choice(['gold', 'silver', 'bronze'], size=n_rows)),
+        'city': rng.choice([f"city_{i + categories_offset}" for i in range(20)], size=n_rows).astype(object),
+        'active': rng.random(n_rows) < 0.5,
+        'comment': 'n/a',
+    })
+    for column in ['age', 'income', 'joined', 'tier', 'city']:
+        table.loc[rng.random(n_rows) < 0.05, column] = None
+    return table
+
+
+@pytest.fixture
+def real_and_synthetic_data() -> tuple[pd.DataFrame, pd.DataFrame]:
+    rng = np.random.default_rng(100)
+    return _table(300, rng), _table(200, rng, categories_offset=5) # some cities are unseen
+
+
+def test_distances_match_sdmetrics(real_and_synthetic_data):
+    from sdmetrics.single_table.privacy.dcr_utils import calculate_dcr
+
+    real_data, synthetic_data = real_and_synthetic_data
+    expected = calculate_dcr(dataset=synthetic_data, reference_dataset=real_data, metadata=METADATA).to_numpy()
+
+    actual = DCRReference(real_data, METADATA).distances(synthetic_data)
+    np.testing.assert_allclose(actual, expected, rtol=0, atol=1e-9)
+
+
+def test_distances_do_not_depend_on_blocks_and_threads(real_and_synthetic_data):
+    real_data, synthetic_data = real_and_synthetic_data
+    reference = DCRReference(real_data, METADATA)
+
+    expected = reference.distances(synthetic_data)
+    actual = reference.distances(synthetic_data, block_bytes=64 * 1024, threads=4)
+    np.testing.assert_array_equal(actual, expected)
+
+
+def test_distances_to_a_sample_of_the_reference(real_and_synthetic_data):
+    real_data, synthetic_data = real_and_synthetic_data
+    reference = DCRReference(real_data, METADATA)
+    expected = reference.distances(synthetic_data)
+
+    all_rows = reference.distances(synthetic_data, reference_rows=np.arange(len(real_data)))
+    np.testing.assert_array_equal(all_rows, expected)
+    # the ranges stay those of all real rows, so the closest row of a sample is at least as far as the closest row
+    sample_rows = reference.distances(synthetic_data, reference_rows=np.arange(0, len(real_data), 3))
+    assert (sample_rows >= expected).all() and (sample_rows > expected).any()
+
+
+def test_the_random_baseline_is_reproducible_and_within_the_real_domain(real_and_synthetic_data):
+    real_data, _ = real_and_synthetic_data
+
+    random_data = generate_random_baseline(real_data, 500, np.random.default_rng(1))
+    pd.testing.assert_frame_equal(random_data, generate_random_baseline(real_data, 500, np.random.default_rng(1)))
+    assert list(random_data.columns) == list(real_data.columns)
+    assert random_data['income'].min() >= real_data['income'].min()
+    assert random_data['income'].max() <= real_data['income'].max()
+    assert set(random_data['city'].dropna()) <= set(real_data['city'].dropna())
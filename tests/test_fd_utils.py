@@ -0,0 +1,70 @@
+import itertools
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from synqtab.utils.fd_utils import discover_fds, discover_fds_with_timeout, encode_as_dictionary_codes, fd_holds
+
+
+@pytest.fixture
+def data() -> pd.DataFrame:
+    return pd.DataFrame({
+        'zip': ['1000', '1000', '2000', '3000', '3000', None],
+        'city': ['A', 'A', 'B', 'C', 'C', 'D'],
+        'street': ['x', 'y', 'x', 'x', 'y', 'x'],
+        'price': [1.5, 2.0, 1.5, 1.5, 2.0, 1.5],
+        'constant': [7, 7, 7, 7, 7, 7],
+    })
+
+
+def _minimal_fds(codes: pd.DataFrame) -> set[tuple[frozenset, str]]:
+    """The minimal non-trivial FDs of the codes, by brute force."""
+    fds = set()
+    for dependant in codes.columns:
+        others = [column for column in codes.columns if column != dependant]
+        for size in range(len(others) + 1):
+            for determinant in itertools.combinations(others, size):
+                is_minimal = not any(found <= set(determinant) for found, rhs in fds if rhs == dependant)
+                if is_minimal and fd_holds(codes, list(determinant), dependant):
+                    fds.add((frozenset(determinant), dependant))
+    return fds
+
+
+def test_codes_keep_which_values_are_equal(data):
+    codes = encode_as_dictionary_codes(data)
+
+    assert list(codes.columns) == list(data.columns)
+    assert all(codes[column].dtype == np.int32 for column in codes.columns)
+    assert codes['city'].tolist() == [0, 0, 1, 2, 2, 3]
+    # missing values get a code of their own
+    assert codes['zip'].nunique() == 4
+
+
+def test_fd_holds(data):
+    codes = encode_as_dictionary_codes(data)
+
+    assert fd_holds(codes, ['zip'], 'city')
+    assert fd_holds(codes, ['city'], 'zip')
+    assert fd_holds(codes, ['street'], 'price')
+    assert not fd_holds(codes, ['city'], 'street')
+    assert not fd_holds(codes, ['street'], 'city')
+    assert fd_holds(codes, [], 'constant')
+    assert not fd_holds(codes, [], 'city')
+
+
+def test_discover_fds_finds_the_minimal_fds(data):
+    pytest.importorskip('desbordante')
+    codes = encode_as_dictionary_codes(data)
+
+    for algorithm_name in ('pyro', 'hyfd', 'fdep', 'tane'):
+        discovered = {
+            (frozenset(codes.columns[lhs_indices]), codes.columns[rhs_index])
+            for lhs_indices, rhs_index, _ in discover_fds(codes, algorithm_name, threads=1)
+        }
+        assert discovered == _minimal_fds(codes), algorithm_name
+
+
+def test_a_discovery_that_times_out_raises(data):
+    with pytest.raises(RuntimeError, match='did not finish'):
+        discover_fds_with_timeout(encode_as_dictionary_codes(data), 'pyro', threads=1, timeout_seconds=0.001)
@@ -0,0 +1,72 @@
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.metrics import pairwise_distances
+
+from synqtab.utils.outlier_utils import OneHotFeatureEncoder, handle_categorical
+
+
+@pytest.fixture
+def schema_df() -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        'x': rng.normal(size=300),
+        'color': pd.Categorical(rng.choice(['red', 'green', 'blue', 'black'], size=300)),
+        'size': rng.choice(['S', 'M', 'L', None], size=300).astype(object),
+        'count': rng.integers(0, 10, size=300),
+    })
+
+
+@pytest.fixture
+def corrupted_df(schema_df) -> pd.DataFrame:
+    # fewer colors than the schema, an unseen one, and a numeric column that an error turned into object
+    corrupted_df = schema_df.iloc[:100].copy()
+    corrupted_df['color'] = pd.Categorical(np.where(np.arange(100) % 10 == 0, 'purpel', 'red'))
+    corrupted_df['count'] = corrupted_df['count'].astype(str)
+    corrupted_df.loc[corrupted_df.index[:5], 'count'] = '?'
+    return corrupted_df
+
+
+@pytest.mark.parametrize('data', ['schema_df', 'corrupted_df'])
+def test_observed_categories_give_the_columns_of_handle_categorical(request, schema_df, data):
+    data = request.getfixturevalue(data)
+    encoder = OneHotFeatureEncoder(schema_df)
+
+    encoded = encoder.transform(data, observed_categories_only=True)
+    np.testing.assert_array_equal(encoded, handle_categorical(data).to_numpy(dtype=np.float64))
+
+
+@pytest.mark.parametrize('data', ['schema_df', 'corrupted_df'])
+def test_schema_categories_give_the_distances_of_handle_categorical(request, schema_df, data):
+    data = request.getfixturevalue(data)
+    encoder = OneHotFeatureEncoder(schema_df)
+
+    np.testing.assert_allclose(
+        pairwise_distances(encoder.transform(data)),
+        pairwise_distances(handle_categorical(data).to_numpy(dtype=np.float64)),
+    )
+
+
+def test_unseen_categories_get_a_column_of_their_own(schema_df, corrupted_df):
+    encoder = OneHotFeatureEncoder(schema_df)
+
+    encoded = encoder.transform(corrupted_df)
+    assert encoded.shape[1] > encoder.n_encoded_columns
+    # 'purpel' rows differ from 'red' rows in the color block, so no row is all zeros there
+    assert (encoded[:, 1:].sum(axis=1) >= 2).all()
+
+
+def test_sparse_and_dense_encodings_are_equal(schema_df, corrupted_df):
+    encoder = OneHotFeatureEncoder(schema_df)
+
+    for data in (schema_df, corrupted_df):
+        np.testing.assert_array_equal(encoder.transform(data, sparse=True).toarray(), encoder.transform(data))
+
+
+def test_encodings_of_identical_data_are_memoized(schema_df):
+    encoder = OneHotFeatureEncoder(schema_df)
+
+    encoded = encoder.transform(schema_df, dtype=np.float32)
+    assert encoded.dtype == np.float32
+    assert encoder.transform(schema_df.copy(), dtype=np.float32) is encoded
+    assert encoder.transform(schema_df) is not encoded
@@ -0,0 +1,60 @@
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.pool import StaticPool
+
+from synqtab.data.clients.PostgresBatchWriter import PostgresBatchWriter
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine('sqlite://', poolclass=StaticPool, connect_args={'check_same_thread': False})
+    with engine.begin() as connection:
+        connection.execute(text(
+            "CREATE TABLE evaluations (evaluation_id VARCHAR PRIMARY KEY, result FLOAT NOT NULL)"
+        ))
+    return engine
+
+
+def _evaluation_ids(engine) -> list[str]:
+    with engine.connect() as connection:
+        return sorted(row[0] for row in connection.execute(text("SELECT evaluation_id FROM evaluations")))
+
+
+def _batch_writer(engine) -> PostgresBatchWriter:
+    # flushed explicitly by the tests; a long period keeps the background thread out of the way
+    return PostgresBatchWriter(engine=engine, max_rows=1000, flush_seconds=3600, max_pending_rows=1000)
+
+
+def test_a_row_that_violates_not_null_is_dropped_and_the_rest_of_its_batch_is_written(engine):
+    batch_writer = _batch_writer(engine)
+    batch_writer.add('evaluations', {'evaluation_id': 'A', 'result': 1.0})
+    batch_writer.add('evaluations', {'evaluation_id': 'B', 'result': None})
+    batch_writer.add('evaluations', {'evaluation_id': 'C', 'result': 3.0})
+
+    batch_writer.flush() # does not raise
+
+    assert _evaluation_ids(engine) == ['A', 'C']
+    assert batch_writer._buffered_rows == 0
+
+    # the writer is not poisoned: later rows and flushes go through
+    batch_writer.add('evaluations', {'evaluation_id': 'D', 'result': 4.0})
+    batch_writer.flush()
+    assert _evaluation_ids(engine) == ['A', 'C', 'D']
+
+
+def test_rows_are_kept_and_the_error_is_raised_while_postgres_is_unreachable(engine, monkeypatch):
+    batch_writer = _batch_writer(engine)
+    batch_writer.add('evaluations', {'evaluation_id': 'A', 'result': 1.0})
+
+    def unreachable(*args, **kwargs):
+        raise OperationalError('INSERT', {}, Exception('could not connect to server'))
+
+    monkeypatch.setattr(batch_writer, '_insert', unreachable)
+    with pytest.raises(OperationalError):
+        batch_writer.flush()
+    assert batch_writer._buffered_rows == 1
+
+    monkeypatch.undo()
+    batch_writer.flush()
+    assert _evaluation_ids(engine) == ['A']
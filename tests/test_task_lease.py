@@ -0,0 +1,96 @@
+import itertools
+import json
+import time
+from typing import Optional
+
+import pytest
+
+import synqtab.data
+from synqtab.tasks.TaskLease import TaskLease
+
+
+class _StubMinioClient():
+    """An in-memory task-leases bucket with the conditional writes of MinIO. Every write gets a new ETag."""
+
+    def __init__(self):
+        self.objects: dict[str, tuple[bytes, str]] = dict()
+        self._etags = itertools.count()
+
+    def put_object_if_absent(self, bucket_name, object_name: str, data: bytes) -> Optional[str]:
+        if object_name in self.objects:
+            return None
+        return self._put(object_name, data)
+
+    def put_object_if_match(self, bucket_name, object_name: str, data: bytes, etag: str) -> Optional[str]:
+        if object_name not in self.objects or self.objects[object_name][1] != etag:
+            return None
+        return self._put(object_name, data)
+
+    def get_object_with_etag(self, bucket_name, object_name: str) -> Optional[tuple[bytes, str]]:
+        return self.objects.get(object_name)
+
+    def _put(self, object_name: str, data: bytes) -> str:
+        etag = f'"{next(self._etags)}"'
+        self.objects[object_name] = (data, etag)
+        return etag
+
+    def lease_body(self, object_name: str) -> dict:
+        return json.loads(self.objects[object_name][0])
+
+
+@pytest.fixture
+def minio_client(monkeypatch) -> _StubMinioClient:
+    minio_client = _StubMinioClient()
+    monkeypatch.setattr(synqtab.data, 'MinioClient', minio_client)
+    return minio_client
+
+
+def test_only_one_worker_acquires_a_lease(minio_client):
+    first_lease, second_lease = TaskLease('task', 'A', 60), TaskLease('task', 'B', 60)
+
+    assert first_lease.acquire()
+    assert not second_lease.acquire()
+    assert first_lease.is_held and not second_lease.is_held
+    assert minio_client.lease_body('task')['worker_id'] == 'A'
+
+
+def test_an_expired_lease_is_taken_over(minio_client):
+    stale_lease, lease = TaskLease('task', 'A', -1), TaskLease('task', 'B', 60)
+    assert stale_lease.acquire()
+
+    assert lease.acquire()
+    assert minio_client.lease_body('task')['worker_id'] == 'B'
+    # the compare-and-swap of the stale worker detects the takeover
+    assert not stale_lease.renew()
+    assert not stale_lease.is_held
+
+
+def test_renew_extends_the_lease(minio_client):
+    lease = TaskLease('task', 'A', 60)
+    assert lease.acquire()
+    expires_at = minio_client.lease_body('task')['expires_at']
+
+    time.sleep(0.01)
+    assert lease.renew()
+    assert minio_client.lease_body('task')['expires_at'] > expires_at
+    assert lease.renew() # with the ETag of the previous renewal
+
+
+def test_release_expires_the_lease_for_the_next_worker(minio_client):
+    with TaskLease('task', 'A', 60) as lease:
+        assert lease.acquire()
+    assert not lease.is_held
+    assert minio_client.lease_body('task')['expires_at'] <= time.time()
+
+    assert TaskLease('task', 'B', 60).acquire()
+
+
+def test_release_leaves_the_lease_of_the_worker_that_took_it_over(minio_client):
+    stale_lease, lease = TaskLease('task', 'A', -1), TaskLease('task', 'B', 60)
+    assert stale_lease.acquire()
+    assert lease.acquire()
+
+    stale_lease.release()
+    assert minio_client.lease_body('task')['worker_id'] == 'B'
+    assert minio_client.lease_body('task')['expires_at'] > time.time()
+    assert lease.renew()
@@ -0,0 +1,106 @@
+from typing import Optional
+
+import pytest
+from botocore.exceptions import ClientError, EndpointConnectionError
+from sqlalchemy.exc import IntegrityError, OperationalError
+
+from synqtab.enums import TaskStatus
+from synqtab.tasks.TaskWorker import TaskWorker
+
+
+class _FakeEvaluation():
+    def __init__(self, error: Optional[Exception] = None, was_skipped: bool = False):
+        self.error = error
+        self.was_skipped = was_skipped
+
+    def run(self):
+        if self.error is not None:
+            raise self.error
+        return self
+
+
+class _FakeEvaluationBatch():
+    def __init__(self, failed: bool = False, was_skipped: bool = False, lease_lost: bool = False):
+        self.failed_evaluations = [_FakeEvaluation()] if failed else []
+        self.was_skipped = was_skipped
+        self.lease_lost = lease_lost
+        self.renew_lease = None
+
+    def run(self, renew_lease=None):
+        self.renew_lease = renew_lease
+        return self
+
+
+def _client_error(code: str) -> ClientError:
+    return ClientError({'Error': {'Code': code, 'Message': code}}, 'GetObject')
+
+
+@pytest.fixture
+def run_task(monkeypatch):
+    """Runs `TaskWorker._run_task()` on a task whose evaluation (or batch) is the given fake."""
+    pytest.importorskip('synqtab.evaluators', reason="the evaluators need the full set of dependencies")
+    from synqtab.data import MinioClient
+    from synqtab.evaluators.Evaluation import Evaluation
+    from synqtab.evaluators.EvaluationBatch import EvaluationBatch
+    from synqtab.experiments.Experiment import Experiment
+
+    monkeypatch.setattr(Experiment, 'from_str', lambda experiment_id: (object(), 0))
+
+    def run_task(runnable, batch: bool = False) -> TaskStatus:
+        task = {'experiment_id': 'experiment', 'params': dict()}
+        if batch:
+            task['evaluation_ids'] = ['first', 'second']
+            monkeypatch.setattr(EvaluationBatch, 'from_ids_and_experiment', lambda *args, **kwargs: runnable)
+        else:
+            task['evaluation_id'] = 'first'
+            monkeypatch.setattr(Evaluation, 'from_str_and_experiment', lambda *args, **kwargs: runnable)
+        monkeypatch.setattr(MinioClient, 'read_json_from_bucket', lambda bucket_name, prefix: task)
+        return TaskWorker._run_task('experiment/task', dict(), renew_lease=lambda: True)
+
+    return run_task
+
+
+@pytest.mark.parametrize('evaluation, status', [
+    (_FakeEvaluation(), TaskStatus.FINISHED),
+    (_FakeEvaluation(was_skipped=True), TaskStatus.SKIPPED),
+    (_FakeEvaluation(error=ValueError('bad data')), TaskStatus.FAILED),
+    (_FakeEvaluation(error=_client_error('NoSuchKey')), TaskStatus.FAILED),
+])
+def test_the_outcome_of_an_evaluation_maps_to_a_status(run_task, evaluation, status):
+    assert run_task(evaluation) == status
+
+
+@pytest.mark.parametrize('error', [
+    OperationalError('SELECT 1', {}, Exception('server closed the connection')),
+    EndpointConnectionError(endpoint_url='http://localhost:9000'),
+    _client_error('SlowDown'),
+    OSError('No space left on device'),
+])
+def test_infrastructure_errors_are_raised_so_that_the_task_is_retried(run_task, error):
+    with pytest.raises(type(error)):
+        run_task(_FakeEvaluation(error=error))
+
+
+@pytest.mark.parametrize('batch, status', [
+    (_FakeEvaluationBatch(), TaskStatus.FINISHED),
+    (_FakeEvaluationBatch(was_skipped=True), TaskStatus.SKIPPED),
+    (_FakeEvaluationBatch(failed=True), TaskStatus.FAILED),
+    (_FakeEvaluationBatch(failed=True, lease_lost=True), TaskStatus.CONTENDED),
+])
+def test_the_outcome_of_a_batch_maps_to_a_status(run_task, batch, status):
+    assert run_task(batch, batch=True) == status
+    assert batch.renew_lease is not None
+
+
+@pytest.mark.parametrize('error, is_infrastructure_error', [
+    (OperationalError('SELECT 1', {}, Exception('server closed the connection')), True),
+    (IntegrityError('INSERT', {}, Exception('null value in column "result"')), False),
+    (EndpointConnectionError(endpoint_url='http://localhost:9000'), True),
+    (_client_error('SlowDown'), True),
+    (_client_error('NoSuchKey'), False),
+    (ConnectionResetError(), True),
+    (RuntimeError('FD discovery with pyro did not finish in 10 seconds.'), False),
+    (ValueError('bad data'), False),
+])
+def test_is_infrastructure_error(error, is_infrastructure_error):
+    assert TaskWorker.is_infrastructure_error(error) == is_infrastructure_error